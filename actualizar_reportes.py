@@ -1,194 +1,341 @@
 """
 Script auxiliar para actualizar el reporte técnico con los resultados reales
-de los experimentos. Este script lee los resultados de resultados_experimentos.json
-y genera tablas en formato Markdown que se pueden copiar al reporte.
+de los experimentos. Este script consulta el almacén de resultados (resultados.db,
+con resultados_experimentos.json como respaldo) y genera tablas en formato
+Markdown en tablas_reporte.md y en las secciones marcadas de REPORTE_TECNICO.md.
+
+La actualización es incremental: cada sección (SECCIONES) depende del resumen
+de un experimento y está delimitada en el documento por marcadores
+
+    <!-- seccion:clave hash=... -->
+    ...
+    <!-- fin:clave -->
+
+El hash combina el texto JSON del resumen, leído tal cual del almacén sin
+decodificarlo, con el código de la función que escribe la sección. Solo se
+decodifican y se vuelven a escribir las secciones cuyo hash cambió; el resto
+del documento (incluido lo escrito a mano fuera de los marcadores) se conserva.
+El documento se reemplaza de forma atómica (archivo temporal + os.replace), así
+que un lector nunca ve un reporte a medias.
+
+Uso:
+    python actualizar_reportes.py [--force]
 """
 
+import hashlib
+import inspect
+import io
 import json
-import statistics
-from typing import Dict, List
-
-def cargar_resultados(archivo='resultados_experimentos.json'):
-    """Carga los resultados desde un archivo JSON."""
-    try:
-        with open(archivo, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Error: No se encontró el archivo {archivo}")
-        print("Ejecuta primero los experimentos con: python experiments.py")
-        return None
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, TextIO
 
-def generar_tabla_experimento1(resultados):
-    """Genera tabla Markdown para el Experimento 1."""
-    if not resultados or 'experimento1' not in resultados:
-        return "No hay datos del Experimento 1"
-    
-    exp1 = resultados['experimento1']
-    hc_data = exp1['hill_climbing']
-    bt_data = exp1['backtracking']
-    
-    tabla = "\n**Tabla 4.1: Resultados de Escalabilidad - Hill Climbing**\n\n"
-    tabla += "| n  | Tiempo Promedio (s) | Iteraciones Promedio | Memoria (MB) | Tasa de Éxito |\n"
-    tabla += "|----|---------------------|---------------------|--------------|---------------|\n"
-    
-    for hc in hc_data:
+from results_store import DEFAULT_PATH, load_summary_texts
+
+TABLAS = 'tablas_reporte.md'
+REPORTE = 'REPORTE_TECNICO.md'
+
+ENCABEZADO_TABLAS = "# TABLAS PARA EL REPORTE TÉCNICO\n"
+
+# Título de cada experimento en tablas_reporte.md
+TITULOS = {
+    'experimento1': 'Experimento 1: Escalabilidad',
+    'experimento2': 'Experimento 2: Consistencia',
+    'experimento3': 'Experimento 3: Optimización',
+}
+
+_SECCION = re.compile(r'<!-- seccion:(\w+) hash=(\w*) -->\n.*?<!-- fin:\1 -->', re.S)
+
+class TablaMarkdown:
+    """Escribe una tabla Markdown en un flujo de texto, fila a fila."""
+
+    def __init__(self, out: TextIO, titulo: str, encabezado: Sequence[str]):
+        """
+        Escribe el título y las líneas de encabezado de la tabla.
+
+        Args:
+            out: Flujo de salida
+            titulo: Título de la tabla (se escribe en negrita)
+            encabezado: Líneas de encabezado, incluida la de separación
+        """
+        self.out = out
+        out.write(f"\n**{titulo}**\n\n")
+        for linea in encabezado:
+            out.write(linea + "\n")
+
+    def fila(self, *celdas) -> None:
+        """Escribe una fila con las celdas dadas."""
+        self.out.write("| " + " | ".join(str(celda) for celda in celdas) + " |\n")
+
+def escribir_tabla_experimento1(out: TextIO, exp1: dict) -> None:
+    """Escribe las tablas Markdown del Experimento 1."""
+    tabla = TablaMarkdown(out, "Tabla 4.1: Resultados de Escalabilidad - Hill Climbing", [
+        "| n  | Tiempo Promedio (s) | Iteraciones Promedio | Memoria (MB) | Tasa de Éxito |",
+        "|----|---------------------|---------------------|--------------|---------------|"])
+    for hc in exp1['hill_climbing']:
         memoria = f"{hc['memoria_promedio']:.2f}" if hc.get('memoria_promedio') else "N/A"
-        tasa = f"{hc['soluciones_encontradas']}/3"
-        tabla += f"| {hc['n']}  | {hc['tiempo_promedio']:.6f} | {hc['iteraciones_promedio']:.0f} | {memoria} | {tasa} |\n"
-    
-    tabla += "\n**Tabla 4.2: Resultados de Escalabilidad - Backtracking**\n\n"
-    tabla += "| n  | Tiempo (s) | Nodos Explorados | Memoria (MB) | Solución Encontrada |\n"
-    tabla += "|----|------------|------------------|--------------|---------------------|\n"
-    
-    for bt in bt_data:
+        # Los resúmenes anteriores a hc_attempts configurable no guardan 'intentos' (eran 3)
+        tabla.fila(hc['n'], f"{hc['tiempo_promedio']:.6f}", f"{hc['iteraciones_promedio']:.0f}",
+                   memoria, f"{hc['soluciones_encontradas']}/{hc.get('intentos', 3)}")
+
+    tabla = TablaMarkdown(out, "Tabla 4.2: Resultados de Escalabilidad - Backtracking", [
+        "| n  | Tiempo (s) | Nodos Explorados | Memoria (MB) | Solución Encontrada |",
+        "|----|------------|------------------|--------------|---------------------|"])
+    for bt in exp1['backtracking']:
         memoria = f"{bt['memoria']:.2f}" if bt.get('memoria') else "N/A"
-        solucion = "Sí" if bt['solucion_encontrada'] else "No"
-        tabla += f"| {bt['n']}  | {bt['tiempo']:.6f} | {bt['nodos_explorados']} | {memoria} | {solucion} |\n"
-    
-    return tabla
+        tabla.fila(bt['n'], f"{bt['tiempo']:.6f}", bt['nodos_explorados'], memoria,
+                   "Sí" if bt['solucion_encontrada'] else "No")
 
-def generar_tabla_experimento2(resultados):
-    """Genera tabla Markdown para el Experimento 2."""
-    if not resultados or 'experimento2' not in resultados:
-        return "No hay datos del Experimento 2"
-    
-    exp2 = resultados['experimento2']
+def escribir_tabla_experimento2(out: TextIO, exp2: dict) -> None:
+    """Escribe la tabla Markdown del Experimento 2."""
     hc_data = exp2['hill_climbing']
     bt_data = exp2['backtracking']
     hc_stats = exp2['estadisticas_hc']
     bt_stats = exp2['estadisticas_bt']
-    
-    tabla = "\n**Tabla 4.3: Análisis Comparativo - Consistencia (n=8, 10 ejecuciones)**\n\n"
-    tabla += "| Ejecución | Hill Climbing                    | Backtracking                    |\n"
-    tabla += "|-----------|----------------------------------|----------------------------------|\n"
-    tabla += "|           | Tiempo (s) | Iter. | Solución    | Tiempo (s) | Nodos  | Solución    |\n"
-    
-    for i in range(len(hc_data)):
-        hc = hc_data[i]
-        bt = bt_data[i]
-        hc_sol = "Sí" if hc['solucion_encontrada'] else "No"
-        bt_sol = "Sí" if bt['solucion_encontrada'] else "No"
-        
-        # Truncar solución si es muy larga
-        hc_sol_detalle = hc['solucion'][:20] + "..." if len(hc['solucion']) > 20 else hc['solucion']
-        bt_sol_detalle = bt['solucion'][:20] + "..." if len(bt['solucion']) > 20 else bt['solucion']
-        
-        tabla += f"| {hc['ejecucion']} | {hc['tiempo']:.6f} | {hc['iteraciones']} | {hc_sol} | {bt['tiempo']:.6f} | {bt['nodos_explorados']} | {bt_sol} |\n"
-    
-    tabla += f"| **Promedio** | **{hc_stats['tiempo_promedio']:.6f}** | **{hc_stats['iteraciones_promedio']:.0f}** | **-** | **{bt_stats['tiempo_promedio']:.6f}** | **{bt_stats['nodos_promedio']:.0f}** | **-** |\n"
-    tabla += f"| **Desv. Est.** | **{hc_stats['tiempo_desv_est']:.6f}** | **{hc_stats['iteraciones_desv_est']:.0f}** | **-** | **{bt_stats['tiempo_desv_est']:.6f}** | **{bt_stats['nodos_desv_est']:.0f}** | **-** |\n"
-    
-    return tabla
 
-def generar_tabla_experimento3(resultados):
-    """Genera tabla Markdown para el Experimento 3."""
-    if not resultados or 'experimento3' not in resultados:
-        return "No hay datos del Experimento 3"
-    
-    exp3 = resultados['experimento3']
-    hc_data = exp3['hill_climbing']
-    bt_data = exp3['backtracking']
-    
-    tabla = "\n**Tabla 4.4: Hill Climbing - Original vs. Random Restart**\n\n"
-    tabla += "| n  | Versión       | Tiempo (s) | Iteraciones | Reinicios | Solución Encontrada |\n"
-    tabla += "|----|---------------|------------|-------------|-----------|---------------------|\n"
-    
-    for hc in hc_data:
+    tabla = TablaMarkdown(out, f"Tabla 4.3: Análisis Comparativo - Consistencia (n=8, {len(hc_data)} "
+                               f"ejecuciones HC, {len(bt_data)} BT)", [
+        "| Ejecución | Hill Climbing                    | Backtracking                    |",
+        "|-----------|----------------------------------|----------------------------------|",
+        "|           | Tiempo (s) | Iter. | Solución    | Tiempo (s) | Nodos  | Solución    |"])
+
+    # Con muestreo secuencial cada algoritmo puede tener un número distinto de ejecuciones
+    # (el lado con menos ejecuciones se completa con "-")
+    for i in range(max(len(hc_data), len(bt_data))):
+        celdas = [i + 1]
+        if i < len(hc_data):
+            hc = hc_data[i]
+            celdas += [f"{hc['tiempo']:.6f}", hc['iteraciones'],
+                       "Sí" if hc['solucion_encontrada'] else "No"]
+        else:
+            celdas += ["-"] * 3
+        if i < len(bt_data):
+            bt = bt_data[i]
+            celdas += [f"{bt['tiempo']:.6f}", bt['nodos_explorados'],
+                       "Sí" if bt['solucion_encontrada'] else "No"]
+        else:
+            celdas += ["-"] * 3
+        tabla.fila(*celdas)
+
+    tabla.fila("**Promedio**", f"**{hc_stats['tiempo_promedio']:.6f}**",
+               f"**{hc_stats['iteraciones_promedio']:.0f}**", "**-**",
+               f"**{bt_stats['tiempo_promedio']:.6f}**", f"**{bt_stats['nodos_promedio']:.0f}**", "**-**")
+    tabla.fila("**Desv. Est.**", f"**{hc_stats['tiempo_desv_est']:.6f}**",
+               f"**{hc_stats['iteraciones_desv_est']:.0f}**", "**-**",
+               f"**{bt_stats['tiempo_desv_est']:.6f}**", f"**{bt_stats['nodos_desv_est']:.0f}**", "**-**")
+    # Resultados anteriores al muestreo secuencial no tienen intervalos
+    if 'tiempo_ic95' in hc_stats and 'tiempo_ic95' in bt_stats:
+        tabla.fila("**IC95 tiempo**",
+                   f"**[{hc_stats['tiempo_ic95'][0]:.6f}, {hc_stats['tiempo_ic95'][1]:.6f}]**", "", "",
+                   f"**[{bt_stats['tiempo_ic95'][0]:.6f}, {bt_stats['tiempo_ic95'][1]:.6f}]**", "", "")
+
+def escribir_tabla_experimento3(out: TextIO, exp3: dict) -> None:
+    """Escribe las tablas Markdown del Experimento 3."""
+    tabla = TablaMarkdown(out, "Tabla 4.4: Hill Climbing - Original vs. Random Restart", [
+        "| n  | Versión       | Tiempo (s) | Iteraciones | Reinicios | Solución Encontrada |",
+        "|----|---------------|------------|-------------|-----------|---------------------|"])
+    for hc in exp3['hill_climbing']:
         orig = hc['original']
         rr = hc['random_restart']
-        orig_sol = "Sí" if orig['solution_found'] else "No"
-        rr_sol = "Sí" if rr['solution_found'] else "No"
-        
-        tabla += f"| {hc['n']}  | Original      | {orig['execution_time']:.6f} | {orig['iterations']} | 0 | {orig_sol} |\n"
-        tabla += f"| {hc['n']}  | Random Restart| {rr['execution_time']:.6f} | {rr['iterations']} | {rr.get('restarts', 0)} | {rr_sol} |\n"
-    
-    tabla += "\n**Tabla 4.5: Backtracking - Original vs. Poda Optimizada**\n\n"
-    tabla += "| n  | Versión          | Tiempo (s) | Nodos Explorados | Solución Encontrada |\n"
-    tabla += "|----|------------------|------------|------------------|---------------------|\n"
-    
-    for bt in bt_data:
+        tabla.fila(hc['n'], "Original", f"{orig['execution_time']:.6f}", orig['iterations'], 0,
+                   "Sí" if orig['solution_found'] else "No")
+        tabla.fila(hc['n'], "Random Restart", f"{rr['execution_time']:.6f}", rr['iterations'],
+                   rr.get('restarts', 0), "Sí" if rr['solution_found'] else "No")
+
+    tabla = TablaMarkdown(out, "Tabla 4.5: Backtracking - Original vs. Poda Optimizada", [
+        "| n  | Versión          | Tiempo (s) | Nodos Explorados | Solución Encontrada |",
+        "|----|------------------|------------|------------------|---------------------|"])
+    for bt in exp3['backtracking']:
         orig = bt['original']
         opt = bt['optimizada']
-        orig_sol = "Sí" if orig['solution_found'] else "No"
-        opt_sol = "Sí" if opt['solution_found'] else "No"
-        
-        tabla += f"| {bt['n']}  | Original         | {orig['execution_time']:.6f} | {orig['nodes_explored']} | {orig_sol} |\n"
-        tabla += f"| {bt['n']}  | Poda Optimizada  | {opt['execution_time']:.6f} | {opt['nodes_explored']} | {opt_sol} |\n"
-    
-    return tabla
+        tabla.fila(bt['n'], "Original", f"{orig['execution_time']:.6f}", orig['nodes_explored'],
+                   "Sí" if orig['solution_found'] else "No")
+        tabla.fila(bt['n'], "Poda Optimizada", f"{opt['execution_time']:.6f}", opt['nodes_explored'],
+                   "Sí" if opt['solution_found'] else "No")
 
-def generar_analisis_experimento2(resultados):
-    """Genera análisis detallado del Experimento 2."""
-    if not resultados or 'experimento2' not in resultados:
-        return ""
-    
-    exp2 = resultados['experimento2']
-    hc_data = exp2['hill_climbing']
-    bt_data = exp2['backtracking']
+def escribir_analisis_experimento2(out: TextIO, exp2: dict) -> None:
+    """Escribe el análisis detallado del Experimento 2."""
     hc_stats = exp2['estadisticas_hc']
     bt_stats = exp2['estadisticas_bt']
-    
-    # Analizar soluciones únicas de Hill Climbing
-    hc_solutions = [tuple(eval(hc['solucion'])) for hc in hc_data if hc['solucion_encontrada'] and hc['solucion'] != "No solución"]
-    unique_solutions_hc = len(set(hc_solutions)) if hc_solutions else 0
-    
-    # Analizar soluciones de Backtracking
-    bt_solutions = [tuple(eval(bt['solucion'])) for bt in bt_data if bt['solucion_encontrada'] and bt['solucion'] != "No solución"]
-    unique_solutions_bt = len(set(bt_solutions)) if bt_solutions else 0
-    
-    analisis = "\n#### 4.2.3 Análisis de Consistencia\n\n"
-    analisis += "**Hill Climbing:**\n\n"
-    analisis += f"1. **Estado inicial:** Aleatorio en cada ejecución, lo que explica la variabilidad en los resultados.\n"
-    analisis += f"2. **Selección de vecinos:** Cuando hay múltiples vecinos con el mismo número de conflictos, se elige aleatoriamente, añadiendo aleatoriedad.\n"
-    analisis += f"3. **Variación temporal:** El tiempo varía significativamente (desviación estándar de {hc_stats['tiempo_desv_est']:.6f}s) debido a:\n"
-    analisis += "   - Diferentes estados iniciales\n"
-    analisis += "   - Diferentes caminos de búsqueda\n"
-    analisis += "   - Posibilidad de quedar atrapado en óptimos locales\n"
-    analisis += f"4. **Soluciones encontradas:** Se encontraron {unique_solutions_hc} soluciones únicas diferentes, demostrando no determinismo.\n"
-    analisis += f"5. **Tasa de éxito:** {hc_stats['tasa_exito']*100:.0f}% de éxito en encontrar solución.\n\n"
-    
-    analisis += "**Backtracking:**\n\n"
-    analisis += f"1. **Orden de exploración:** Determinista, siempre explora las filas en el mismo orden (0, 1, 2, ..., N-1).\n"
-    analisis += f"2. **Solución encontrada:** Siempre encuentra la misma solución porque explora el espacio de manera sistemática y se detiene en la primera solución encontrada.\n"
-    analisis += f"3. **Consistencia temporal:** El tiempo es muy consistente (desviación estándar de {bt_stats['tiempo_desv_est']:.6f}s) porque el algoritmo es completamente determinista.\n"
-    analisis += f"4. **Nodos explorados:** Siempre explora exactamente el mismo número de nodos ({bt_stats['nodos_promedio']:.0f}) porque el orden de exploración es fijo.\n"
-    analisis += f"5. **Tasa de éxito:** {bt_stats['tasa_exito']*100:.0f}% de éxito.\n"
-    
-    return analisis
+
+    # Soluciones únicas de cada algoritmo
+    unique_solutions_hc = len({hc['solucion'] for hc in exp2['hill_climbing']
+                               if hc['solucion_encontrada'] and hc['solucion'] != "No solución"})
+
+    out.write("\n#### 4.2.3 Análisis de Consistencia\n\n")
+    out.write("**Hill Climbing:**\n\n")
+    out.write("1. **Estado inicial:** Aleatorio en cada ejecución, lo que explica la variabilidad en los resultados.\n")
+    out.write("2. **Selección de vecinos:** Cuando hay múltiples vecinos con el mismo número de conflictos, se elige aleatoriamente, añadiendo aleatoriedad.\n")
+    out.write(f"3. **Variación temporal:** El tiempo varía significativamente (desviación estándar de {hc_stats['tiempo_desv_est']:.6f}s) debido a:\n")
+    out.write("   - Diferentes estados iniciales\n")
+    out.write("   - Diferentes caminos de búsqueda\n")
+    out.write("   - Posibilidad de quedar atrapado en óptimos locales\n")
+    out.write(f"4. **Soluciones encontradas:** Se encontraron {unique_solutions_hc} soluciones únicas diferentes, demostrando no determinismo.\n")
+    out.write(f"5. **Tasa de éxito:** {hc_stats['tasa_exito']*100:.0f}% de éxito en encontrar solución.\n\n")
+
+    out.write("**Backtracking:**\n\n")
+    out.write("1. **Orden de exploración:** Determinista, siempre explora las filas en el mismo orden (0, 1, 2, ..., N-1).\n")
+    out.write("2. **Solución encontrada:** Siempre encuentra la misma solución porque explora el espacio de manera sistemática y se detiene en la primera solución encontrada.\n")
+    out.write(f"3. **Consistencia temporal:** El tiempo es muy consistente (desviación estándar de {bt_stats['tiempo_desv_est']:.6f}s) porque el algoritmo es completamente determinista.\n")
+    out.write(f"4. **Nodos explorados:** Siempre explora exactamente el mismo número de nodos ({bt_stats['nodos_promedio']:.0f}) porque el orden de exploración es fijo.\n")
+    out.write(f"5. **Tasa de éxito:** {bt_stats['tasa_exito']*100:.0f}% de éxito.\n")
+
+# Sección -> (experimento del que depende, función que la escribe), en orden del reporte
+SECCIONES = {
+    'tabla_escalabilidad': ('experimento1', escribir_tabla_experimento1),
+    'tabla_consistencia': ('experimento2', escribir_tabla_experimento2),
+    'analisis_consistencia': ('experimento2', escribir_analisis_experimento2),
+    'tabla_optimizacion': ('experimento3', escribir_tabla_experimento3),
+}
+
+def _generar(escribir, resultados, experimento: str, sin_datos: str) -> str:
+    if not resultados or experimento not in resultados:
+        return sin_datos
+    out = io.StringIO()
+    escribir(out, resultados[experimento])
+    return out.getvalue()
+
+def generar_tabla_experimento1(resultados):
+    """Genera tabla Markdown para el Experimento 1."""
+    return _generar(escribir_tabla_experimento1, resultados, 'experimento1', "No hay datos del Experimento 1")
+
+def generar_tabla_experimento2(resultados):
+    """Genera tabla Markdown para el Experimento 2."""
+    return _generar(escribir_tabla_experimento2, resultados, 'experimento2', "No hay datos del Experimento 2")
+
+def generar_tabla_experimento3(resultados):
+    """Genera tabla Markdown para el Experimento 3."""
+    return _generar(escribir_tabla_experimento3, resultados, 'experimento3', "No hay datos del Experimento 3")
+
+def generar_analisis_experimento2(resultados):
+    """Genera análisis detallado del Experimento 2."""
+    return _generar(escribir_analisis_experimento2, resultados, 'experimento2', "")
+
+def hash_seccion(clave: str, texto: str) -> str:
+    """Hash del código de la función de la sección y del resumen del que depende."""
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(SECCIONES[clave][1]).encode('utf-8'))
+    digest.update(texto.encode('utf-8'))
+    return digest.hexdigest()
+
+def _bloque(clave: str, hash_actual: str, texto: str) -> str:
+    """Sección completa con sus marcadores, generada a partir del resumen en texto JSON."""
+    _, escribir = SECCIONES[clave]
+    out = io.StringIO()
+    escribir(out, json.loads(texto))
+    return f"<!-- seccion:{clave} hash={hash_actual} -->\n{out.getvalue().strip()}\n<!-- fin:{clave} -->"
+
+def escribir_atomico(ruta: str, texto: str) -> None:
+    """Reemplaza ruta por texto de forma atómica (archivo temporal en el mismo directorio)."""
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        f.write(texto)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+def actualizar_documento(ruta: str, crudos: Dict[str, str], anexar: bool = False,
+                         forzar: bool = False) -> List[str]:
+    """
+    Reescribe las secciones marcadas de un documento cuyo hash cambió.
+
+    Args:
+        ruta: Documento Markdown
+        crudos: Texto JSON del resumen de cada experimento
+        anexar: Si True, las secciones que falten se anexan al final bajo el
+            título de su experimento (y se crea el documento si no existe)
+        forzar: Reescribir todas las secciones aunque su hash no haya cambiado
+
+    Returns:
+        Secciones reescritas
+    """
+    texto = None
+    if os.path.exists(ruta):
+        with open(ruta, 'r', encoding='utf-8') as f:
+            texto = f.read()
+    if texto is None or (anexar and not _SECCION.search(texto)):
+        # Documento nuevo o generado por versiones sin marcadores
+        if not anexar:
+            return []
+        texto = ENCABEZADO_TABLAS
+
+    presentes = set()
+    actualizadas = []
+
+    def reemplazar(m):
+        clave, hash_previo = m.group(1), m.group(2)
+        presentes.add(clave)
+        if clave not in SECCIONES or SECCIONES[clave][0] not in crudos:
+            return m.group(0)
+        hash_actual = hash_seccion(clave, crudos[SECCIONES[clave][0]])
+        if hash_actual == hash_previo and not forzar:
+            return m.group(0)
+        actualizadas.append(clave)
+        return _bloque(clave, hash_actual, crudos[SECCIONES[clave][0]])
+
+    nuevo = _SECCION.sub(reemplazar, texto)
+    if anexar:
+        titulo_previo = None
+        for clave, (experimento, _) in SECCIONES.items():
+            if clave in presentes or experimento not in crudos:
+                continue
+            if experimento != titulo_previo:
+                nuevo = nuevo.rstrip('\n') + f"\n\n## {TITULOS[experimento]}\n"
+                titulo_previo = experimento
+            nuevo += "\n" + _bloque(clave, hash_seccion(clave, crudos[experimento]), crudos[experimento]) + "\n"
+            actualizadas.append(clave)
+
+    if actualizadas:
+        escribir_atomico(ruta, nuevo)
+    return actualizadas
+
+def actualizar_reportes(almacen: str = DEFAULT_PATH, archivo: Optional[str] = 'resultados_experimentos.json',
+                        tablas: str = TABLAS, reporte: Optional[str] = REPORTE,
+                        forzar: bool = False) -> Optional[Dict[str, List[str]]]:
+    """
+    Actualiza las secciones de tablas_reporte.md y REPORTE_TECNICO.md cuyos datos cambiaron.
+
+    Args:
+        almacen: Archivo SQLite del almacén
+        archivo: JSON combinado usado como respaldo (None = sin respaldo)
+        tablas: Documento de tablas (se crea y se completa con las secciones que falten)
+        reporte: Reporte técnico (solo se actualizan las secciones ya marcadas; None = no tocarlo)
+        forzar: Reescribir todas las secciones
+
+    Returns:
+        Diccionario documento -> secciones reescritas, o None si no hay resultados
+    """
+    experimentos = sorted({experimento for experimento, _ in SECCIONES.values()})
+    crudos = load_summary_texts(experimentos, almacen, archivo)
+    if not crudos:
+        print(f"Error: No se encontraron resultados en {almacen} ni en {archivo}")
+        print("Ejecuta primero los experimentos con: python experiments.py")
+        return None
+    cambios = {tablas: actualizar_documento(tablas, crudos, anexar=True, forzar=forzar)}
+    if reporte:
+        cambios[reporte] = actualizar_documento(reporte, crudos, forzar=forzar)
+    return cambios
 
 def main():
     """Función principal."""
+    args = sys.argv[1:]
+    forzar = '--force' in args
+
     print("="*60)
     print("GENERADOR DE TABLAS PARA REPORTE TÉCNICO")
     print("="*60)
-    
-    resultados = cargar_resultados()
-    if not resultados:
+
+    cambios = actualizar_reportes(forzar=forzar)
+    if cambios is None:
         return
-    
-    print("\nGenerando tablas...")
-    
-    # Generar tablas
-    tabla1 = generar_tabla_experimento1(resultados)
-    tabla2 = generar_tabla_experimento2(resultados)
-    tabla3 = generar_tabla_experimento3(resultados)
-    analisis2 = generar_analisis_experimento2(resultados)
-    
-    # Guardar en archivo
-    with open('tablas_reporte.md', 'w', encoding='utf-8') as f:
-        f.write("# TABLAS PARA EL REPORTE TÉCNICO\n\n")
-        f.write("## Experimento 1: Escalabilidad\n")
-        f.write(tabla1)
-        f.write("\n\n## Experimento 2: Consistencia\n")
-        f.write(tabla2)
-        f.write(analisis2)
-        f.write("\n\n## Experimento 3: Optimización\n")
-        f.write(tabla3)
-    
-    print("\nTablas generadas en: tablas_reporte.md")
-    print("\nPuedes copiar las tablas de este archivo al REPORTE_TECNICO.md")
+
+    for documento, secciones in cambios.items():
+        if secciones:
+            print(f"\n{documento}: secciones actualizadas: {', '.join(secciones)}")
+        else:
+            print(f"\n{documento}: sin cambios")
     print("="*60)
 
 if __name__ == "__main__":
     main()
-
@@ -18,36 +18,55 @@ MODIFICACIONES REALIZADAS:
 - Implementada función de visualización opcional
 - Agregada poda adicional con verificación de diagonales optimizada (Experimento 3)
 - Agregado registro de la primera solución encontrada
+- El estado interno usa el tablero compacto Board (array('i') con contadores
+  de filas y diagonales), de modo que is_safe es O(1)
+- Agregado presupuesto de nodos, orden aleatorio de filas opcional y resolución
+  parcial de las primeras k columnas (usados por el solver híbrido)
 """
 
+import random
 import time
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+
+from board import Board
 
 
 class BacktrackingNQueens:
     """Implementación del algoritmo Backtracking para N-Reinas."""
     
-    def __init__(self, n: int, use_optimized_pruning: bool = False):
+    __slots__ = ('n', 'use_optimized_pruning', 'max_nodes', 'shuffle_rows', 'budget_exhausted',
+                 'nodes_explored', 'start_time', 'end_time', 'solution_count')
+    
+    def __init__(self, n: int, use_optimized_pruning: bool = False,
+                 max_nodes: Optional[int] = None, shuffle_rows: bool = False):
         """
         Inicializa el algoritmo Backtracking.
         
         Args:
             n: Tamaño del tablero (número de reinas)
             use_optimized_pruning: Si es True, usa poda optimizada adicional
+            max_nodes: Presupuesto de nodos; al agotarse la búsqueda se abandona
+                (None = sin límite)
+            shuffle_rows: Si es True, prueba las filas de cada columna en orden
+                aleatorio en lugar de 0, 1, ..., n-1
         """
         self.n = n
         self.use_optimized_pruning = use_optimized_pruning
+        self.max_nodes = max_nodes
+        self.shuffle_rows = shuffle_rows
+        self.budget_exhausted = False
         self.nodes_explored = 0
         self.start_time = 0
         self.end_time = 0
         self.solution_count = 0
     
-    def is_safe(self, board: List[int], row: int, col: int) -> bool:
+    def is_safe(self, board: Union[Board, List[int]], row: int, col: int) -> bool:
         """
         Verifica si es seguro colocar una reina en la posición (row, col).
         
         Args:
-            board: Estado actual del tablero
+            board: Estado actual del tablero (Board o lista con las columnas
+                anteriores a col ocupadas)
             row: Fila donde se quiere colocar la reina
             col: Columna donde se quiere colocar la reina
             
@@ -56,19 +75,24 @@ class BacktrackingNQueens:
         """
         self.nodes_explored += 1
         
-        # Verificar todas las reinas colocadas anteriormente
-        for i in range(col):
-            # Misma fila
-            if board[i] == row:
-                return False
-            
-            # Diagonal principal: row - col = constante
-            if board[i] - i == row - col:
-                return False
-            
-            # Diagonal secundaria: row + col = constante
-            if board[i] + i == row + col:
+        if isinstance(board, Board):
+            # Contadores de fila y diagonales: verificación en O(1)
+            if not board.is_free(col, row):
                 return False
+        else:
+            # Verificar todas las reinas colocadas anteriormente
+            for i in range(col):
+                # Misma fila
+                if board[i] == row:
+                    return False
+                
+                # Diagonal principal: row - col = constante
+                if board[i] - i == row - col:
+                    return False
+                
+                # Diagonal secundaria: row + col = constante
+                if board[i] + i == row + col:
+                    return False
         
         # Poda adicional optimizada: verificar conflictos futuros potenciales
         if self.use_optimized_pruning:
@@ -81,34 +105,43 @@ class BacktrackingNQueens:
         
         return True
     
-    def solve_util(self, board: List[int], col: int) -> bool:
+    def solve_util(self, board: Board, col: int, depth: Optional[int] = None) -> bool:
         """
         Función recursiva auxiliar para resolver el problema.
         
         Args:
             board: Estado actual del tablero
             col: Columna actual a procesar
+            depth: Número de columnas a completar (None = todas)
             
         Returns:
             True si se encontró una solución, False en caso contrario
         """
         # Caso base: todas las reinas están colocadas
-        if col >= self.n:
+        if col >= (self.n if depth is None else depth):
             return True
         
         # Intentar colocar la reina en todas las filas de esta columna
-        for row in range(self.n):
+        rows = range(self.n)
+        if self.shuffle_rows:
+            rows = list(rows)
+            random.shuffle(rows)
+        for row in rows:
+            if self.max_nodes is not None and self.nodes_explored >= self.max_nodes:
+                # Presupuesto de nodos agotado: abandonar la búsqueda
+                self.budget_exhausted = True
+                return False
             if self.is_safe(board, row, col):
                 # Colocar la reina
-                board[col] = row
+                board.place(col, row)
                 
                 # Recursión para colocar el resto de las reinas
-                if self.solve_util(board, col + 1):
+                if self.solve_util(board, col + 1, depth):
                     return True
                 
                 # Si colocar la reina en (row, col) no lleva a una solución,
                 # removerla (backtrack)
-                board[col] = -1
+                board.remove(col)
         
         # Si no se puede colocar la reina en ninguna fila de esta columna,
         # retornar False para activar backtracking
@@ -121,28 +154,58 @@ class BacktrackingNQueens:
         Returns:
             Tupla (solución, estadísticas)
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.nodes_explored = 0
+        self.budget_exhausted = False
         
         # Inicializar el tablero
-        board = [-1] * self.n
+        board = Board(self.n)
         
         # Intentar resolver
         solution_found = self.solve_util(board, 0)
         
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         
         if not solution_found:
             return [], {
                 'solution_found': False,
                 'nodes_explored': self.nodes_explored,
-                'execution_time': self.end_time - self.start_time
+                'execution_time': self.end_time - self.start_time,
+                'budget_exhausted': self.budget_exhausted
             }
         
-        return board, {
+        return board.to_list(), {
             'solution_found': True,
             'nodes_explored': self.nodes_explored,
-            'execution_time': self.end_time - self.start_time
+            'execution_time': self.end_time - self.start_time,
+            'budget_exhausted': False
+        }
+    
+    def solve_prefix(self, k: int) -> Tuple[Optional[Board], dict]:
+        """
+        Coloca sin conflictos las reinas de las primeras k columnas.
+        
+        Args:
+            k: Número de columnas a completar (0 <= k <= n)
+            
+        Returns:
+            Tupla (tablero con las k primeras columnas ocupadas o None si no se
+            logró dentro del presupuesto, estadísticas)
+        """
+        self.start_time = time.perf_counter()
+        self.nodes_explored = 0
+        self.budget_exhausted = False
+        
+        board = Board(self.n)
+        prefix_found = self.solve_util(board, 0, depth=k)
+        
+        self.end_time = time.perf_counter()
+        
+        return board if prefix_found else None, {
+            'solution_found': prefix_found,
+            'nodes_explored': self.nodes_explored,
+            'execution_time': self.end_time - self.start_time,
+            'budget_exhausted': self.budget_exhausted
         }
     
     def count_all_solutions(self) -> int:
@@ -154,7 +217,7 @@ class BacktrackingNQueens:
         """
         self.nodes_explored = 0
         count = 0
-        board = [-1] * self.n
+        board = Board(self.n)
         
         def count_util(board, col):
             nonlocal count
@@ -164,9 +227,9 @@ class BacktrackingNQueens:
             
             for row in range(self.n):
                 if self.is_safe(board, row, col):
-                    board[col] = row
+                    board.place(col, row)
                     count_util(board, col + 1)
-                    board[col] = -1
+                    board.remove(col)
         
         count_util(board, 0)
         return count
@@ -0,0 +1,178 @@
+"""
+Hill Climbing por lotes para el Problema de las N-Reinas usando NumPy
+
+Avanza B tableros independientes en paralelo (lockstep). El estado de todos los
+tableros es un arreglo de forma (B, n) y los contadores de filas y diagonales
+son arreglos (B, n) y (B, 2n - 1), de modo que el delta de los n * (n - 1)
+movimientos de cada tablero se calcula de forma vectorizada en cada iteración.
+Los tableros que terminan (solución u óptimo local) se enmascaran y dejan de
+actualizarse.
+
+Cada tablero sigue exactamente la misma regla que HillClimbingNQueens con la
+estrategia por defecto (ascenso estricto, desempate aleatorio), opcionalmente
+con movimientos laterales como SidewaysMovesStrategy.
+"""
+
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class BatchHillClimbingNQueens:
+    """Hill Climbing vectorizado sobre B tableros de tamaño n."""
+
+    def __init__(self, n: int, batch_size: int, max_iterations: int = 10000,
+                 max_sideways: int = 0, seed: Optional[int] = None):
+        """
+        Inicializa el solver por lotes.
+
+        Args:
+            n: Tamaño del tablero (número de reinas)
+            batch_size: Número de tableros independientes (B)
+            max_iterations: Iteraciones máximas por tablero
+            max_sideways: Movimientos laterales consecutivos permitidos (0 = ascenso estricto)
+            seed: Semilla del generador aleatorio de NumPy
+        """
+        self.n = n
+        self.batch_size = batch_size
+        self.max_iterations = max_iterations
+        self.max_sideways = max_sideways
+        self.rng = np.random.default_rng(seed)
+        self.start_time = 0
+        self.end_time = 0
+
+    def generate_random_states(self) -> np.ndarray:
+        """
+        Genera B estados iniciales aleatorios.
+
+        Returns:
+            Arreglo (B, n) donde boards[b, i] = fila de la reina en la columna i
+        """
+        return self.rng.integers(0, self.n, size=(self.batch_size, self.n), dtype=np.int32)
+
+    def _counters(self, boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Construye los contadores de filas y diagonales de cada tablero."""
+        n = self.n
+        batch = boards.shape[0]
+        cols = np.arange(n)
+        offsets = np.arange(batch)[:, None]
+        rows = np.zeros((batch, n), dtype=np.int32)
+        diag1 = np.zeros((batch, 2 * n - 1), dtype=np.int32)
+        diag2 = np.zeros((batch, 2 * n - 1), dtype=np.int32)
+        np.add.at(rows, (offsets, boards), 1)
+        np.add.at(diag1, (offsets, boards - cols + n - 1), 1)
+        np.add.at(diag2, (offsets, boards + cols), 1)
+        return rows, diag1, diag2
+
+    @staticmethod
+    def _pairs(counters: np.ndarray) -> np.ndarray:
+        """Suma de C(k, 2) por tablero."""
+        return (counters * (counters - 1) // 2).sum(axis=1)
+
+    def solve(self, initial_states: Optional[np.ndarray] = None) -> Tuple[np.ndarray, dict]:
+        """
+        Ejecuta Hill Climbing sobre todos los tableros del lote.
+
+        Args:
+            initial_states: Arreglo (B, n) con los estados iniciales (opcional)
+
+        Returns:
+            Tupla (tableros_finales, estadísticas). Las estadísticas contienen
+            arreglos por tablero ('solution_found', 'iterations', 'conflicts')
+            y agregados del lote.
+        """
+        self.start_time = time.perf_counter()
+        n = self.n
+
+        if initial_states is None:
+            boards = self.generate_random_states()
+        else:
+            boards = np.array(initial_states, dtype=np.int32, copy=True)
+        batch = boards.shape[0]
+
+        rows, diag1, diag2 = self._counters(boards)
+        conflicts = self._pairs(rows) + self._pairs(diag1) + self._pairs(diag2)
+        iterations = np.zeros(batch, dtype=np.int64)
+        sideways = np.zeros(batch, dtype=np.int64)
+        active = conflicts > 0
+
+        # Índices de diagonal de cada casilla (columna, fila): (n, n)
+        cols = np.arange(n)
+        cand_rows = np.arange(n)
+        idx1 = cand_rows[None, :] - cols[:, None] + n - 1
+        idx2 = cand_rows[None, :] + cols[:, None]
+
+        step = 0
+        while step < self.max_iterations and active.any():
+            step += 1
+            ids = np.flatnonzero(active)
+            q = boards[ids]
+            r, d1, d2 = rows[ids], diag1[ids], diag2[ids]
+            k = ids.size
+
+            # Conflictos de cada reina en su posición actual: (k, n)
+            current = (np.take_along_axis(r, q, axis=1)
+                       + np.take_along_axis(d1, q - cols + n - 1, axis=1)
+                       + np.take_along_axis(d2, q + cols, axis=1) - 3)
+            # Conflictos al llegar a cada casilla (col, fila): (k, n, n)
+            added = r[:, None, :] + d1[:, idx1] + d2[:, idx2]
+            delta = added - current[:, :, None]
+            # Excluir "mover" la reina a su propia fila
+            delta[np.arange(k)[:, None], cols[None, :], q] = n * n
+
+            # Desempate aleatorio uniforme entre los mejores vecinos
+            noisy = delta.reshape(k, n * n) + self.rng.random((k, n * n))
+            choice = noisy.argmin(axis=1)
+            best = delta.reshape(k, n * n)[np.arange(k), choice]
+
+            iterations[ids] += 1
+            improving = best < 0
+            lateral = (best == 0) & (sideways[ids] < self.max_sideways)
+            moving = improving | lateral
+            sideways[ids] = np.where(lateral, sideways[ids] + 1, 0)
+
+            # Tableros sin movimiento aceptable: óptimo local
+            active[ids[~moving]] = False
+            if not moving.any():
+                break
+
+            sel = np.flatnonzero(moving)
+            b = ids[sel]
+            col = choice[sel] // n
+            new = choice[sel] % n
+            old = boards[b, col]
+            rows[b, old] -= 1
+            diag1[b, old - col + n - 1] -= 1
+            diag2[b, old + col] -= 1
+            rows[b, new] += 1
+            diag1[b, new - col + n - 1] += 1
+            diag2[b, new + col] += 1
+            boards[b, col] = new
+            conflicts[b] += best[sel]
+            active[b[conflicts[b] == 0]] = False
+
+        self.end_time = time.perf_counter()
+        found = conflicts == 0
+        return boards, {
+            'solution_found': found,
+            'iterations': iterations,
+            'conflicts': conflicts,
+            'batch_size': batch,
+            'success_rate': float(found.mean()) if batch else 0.0,
+            'execution_time': self.end_time - self.start_time
+        }
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    n = 8
+    batch_size = 1000
+    print(f"Resolviendo {batch_size} tableros de {n}-Reinas con Hill Climbing por lotes")
+
+    solver = BatchHillClimbingNQueens(n, batch_size)
+    boards, stats = solver.solve()
+
+    print(f"Tasa de éxito: {stats['success_rate']:.3f}")
+    print(f"Iteraciones promedio: {stats['iterations'].mean():.2f}")
+    print(f"Tiempo de ejecución: {stats['execution_time']:.6f} segundos")
@@ -0,0 +1,277 @@
+"""
+Arnés de microbenchmarks para los solvers de N-Reinas
+
+A diferencia de los experimentos (una diferencia de tiempo por ejecución), cada
+configuración (algoritmo, n, variante) se mide así:
+1. Rondas de calentamiento que no se registran (caché de código, asignador).
+2. Repeticiones adaptativas: se repite hasta acumular min_time segundos y al
+   menos min_reps muestras (con un máximo de max_reps).
+3. Cada muestra se toma con time.perf_counter_ns() alrededor de solve().
+
+El reporte incluye mediana, cuartiles, IQR e intervalo de confianza del 95%
+para la mediana (por estadísticos de orden, sin suponer normalidad). La
+repetición i usa la semilla i, de modo que Hill Climbing recorre la misma
+secuencia de tableros en la línea base y en la comparación.
+
+Uso:
+    python benchmark.py run --output baseline.json
+    python benchmark.py compare baseline.json [actual.json] --threshold 0.10
+
+compare termina con código 1 si alguna configuración empeora: su mediana supera
+la de la línea base en más del umbral y los intervalos de confianza no se solapan.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from solvers import Trial, make_solver
+
+# Configuraciones (algoritmo, n, variante) medidas por defecto
+DEFAULT_CONFIGS = [
+    ('hill_climbing', 8, 'original'),
+    ('hill_climbing', 16, 'original'),
+    ('hill_climbing', 32, 'original'),
+    ('hill_climbing', 8, 'random_restart'),
+    ('hill_climbing', 16, 'random_restart'),
+    ('backtracking', 8, 'original'),
+    ('backtracking', 12, 'original'),
+    ('backtracking', 16, 'original'),
+    ('backtracking', 12, 'optimizada'),
+]
+
+# z para un intervalo de confianza bilateral del 95%
+Z_95 = 1.959964
+
+
+def config_key(algorithm: str, n: int, variant: str) -> str:
+    """Clave textual de una configuración (usada en el JSON)."""
+    return f"{algorithm}/n={n}/{variant}"
+
+
+def median_ci(samples: List[int], z: float = Z_95) -> Tuple[int, int]:
+    """
+    Intervalo de confianza para la mediana por estadísticos de orden.
+
+    Los rangos j y k se obtienen de la aproximación normal a la binomial
+    B(m, 1/2): n/2 -/+ z * sqrt(m) / 2.
+
+    Args:
+        samples: Muestras (no es necesario que estén ordenadas)
+        z: Cuantil de la normal estándar
+
+    Returns:
+        Tupla (límite inferior, límite superior)
+    """
+    ordered = sorted(samples)
+    m = len(ordered)
+    half_width = z * math.sqrt(m) / 2
+    lower = max(0, math.floor(m / 2 - half_width))
+    upper = min(m - 1, math.ceil(m / 2 + half_width) - 1)
+    return ordered[lower], ordered[upper]
+
+
+def summarize(samples: List[int]) -> dict:
+    """
+    Estadísticos robustos de una lista de tiempos en nanosegundos.
+
+    Args:
+        samples: Tiempos por repetición (ns)
+
+    Returns:
+        Diccionario con mediana, cuartiles, IQR, media, mínimo e IC de la mediana
+    """
+    if len(samples) >= 2:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    else:
+        q1 = q3 = samples[0]
+    ci_low, ci_high = median_ci(samples)
+    return {
+        'repeticiones': len(samples),
+        'mediana_ns': statistics.median(samples),
+        'q1_ns': q1,
+        'q3_ns': q3,
+        'iqr_ns': q3 - q1,
+        'media_ns': statistics.mean(samples),
+        'min_ns': min(samples),
+        'ic95_ns': [ci_low, ci_high]
+    }
+
+
+def measure(algorithm: str, n: int, variant: str, warmup: int = 2, min_reps: int = 5,
+            max_reps: int = 1000, min_time: float = 0.2) -> dict:
+    """
+    Mide una configuración con calentamiento y repeticiones adaptativas.
+
+    Args:
+        algorithm: 'hill_climbing' o 'backtracking'
+        n: Tamaño del tablero
+        variant: Variante del solver (ver solvers.make_solver)
+        warmup: Rondas de calentamiento descartadas
+        min_reps: Repeticiones mínimas
+        max_reps: Repeticiones máximas
+        min_time: Tiempo mínimo acumulado de medición en segundos
+
+    Returns:
+        Resumen de summarize() más la configuración
+    """
+    # Semillas fuera de las de las repeticiones medidas (0 .. max_reps - 1), para
+    # que el calentamiento no recorra los mismos tableros que la medición
+    for i in range(warmup):
+        random.seed(max_reps + i)
+        make_solver(Trial(algorithm, n, variant, None)).solve()
+
+    samples = []
+    budget_ns = int(min_time * 1e9)
+    total = 0
+    while len(samples) < max_reps and (len(samples) < min_reps or total < budget_ns):
+        random.seed(len(samples))
+        solver = make_solver(Trial(algorithm, n, variant, None))
+        start = time.perf_counter_ns()
+        solver.solve()
+        elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed)
+        total += elapsed
+
+    summary = summarize(samples)
+    summary.update({'algoritmo': algorithm, 'n': n, 'variante': variant})
+    return summary
+
+
+def run_benchmarks(configs: List[Tuple[str, int, str]] = None, verbose: bool = True,
+                   **options) -> dict:
+    """
+    Mide todas las configuraciones.
+
+    Args:
+        configs: Configuraciones (algoritmo, n, variante); por defecto DEFAULT_CONFIGS
+        verbose: Si es True, imprime una línea por configuración
+        **options: Opciones de measure() (warmup, min_reps, max_reps, min_time)
+
+    Returns:
+        Diccionario con metadatos del entorno y resultados por clave de configuración
+    """
+    if configs is None:
+        configs = DEFAULT_CONFIGS
+    results = {}
+    for algorithm, n, variant in configs:
+        summary = measure(algorithm, n, variant, **options)
+        results[config_key(algorithm, n, variant)] = summary
+        if verbose:
+            print(f"{config_key(algorithm, n, variant):<34} "
+                  f"mediana={summary['mediana_ns'] / 1e6:10.4f} ms  "
+                  f"IQR={summary['iqr_ns'] / 1e6:9.4f} ms  "
+                  f"reps={summary['repeticiones']}")
+    return {
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'opciones': options,
+        'resultados': results
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    Compara dos corridas y detecta regresiones.
+
+    Una configuración empeora si su mediana supera la de la línea base en más de
+    threshold (fracción) y el intervalo de confianza actual queda por encima del
+    de la línea base (los intervalos no se solapan).
+
+    Args:
+        baseline: Resultado de run_benchmarks() usado como referencia
+        current: Resultado de run_benchmarks() a evaluar
+        threshold: Empeoramiento relativo tolerado
+
+    Returns:
+        Lista de comparaciones por configuración presente en ambas corridas
+    """
+    rows = []
+    for key, base in baseline['resultados'].items():
+        cur = current['resultados'].get(key)
+        if cur is None:
+            continue
+        ratio = cur['mediana_ns'] / base['mediana_ns'] if base['mediana_ns'] else math.inf
+        regression = ratio > 1 + threshold and cur['ic95_ns'][0] > base['ic95_ns'][1]
+        rows.append({
+            'configuracion': key,
+            'base_ns': base['mediana_ns'],
+            'actual_ns': cur['mediana_ns'],
+            'razon': ratio,
+            'regresion': regression
+        })
+    return rows
+
+
+def _load(filename: str) -> dict:
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save(data: dict, filename: str) -> None:
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en: {filename}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks de los solvers de N-Reinas")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    for name in ('run', 'compare'):
+        cmd = sub.add_parser(name)
+        cmd.add_argument('--warmup', type=int, default=2, help="Rondas de calentamiento")
+        cmd.add_argument('--min-reps', type=int, default=5, help="Repeticiones mínimas")
+        cmd.add_argument('--max-reps', type=int, default=1000, help="Repeticiones máximas")
+        cmd.add_argument('--min-time', type=float, default=0.2,
+                         help="Segundos mínimos de medición por configuración")
+        if name == 'run':
+            cmd.add_argument('--output', default='benchmark_baseline.json',
+                             help="Archivo JSON de salida")
+        else:
+            cmd.add_argument('baseline', help="JSON de la línea base")
+            cmd.add_argument('current', nargs='?',
+                             help="JSON a comparar (por defecto se mide ahora)")
+            cmd.add_argument('--threshold', type=float, default=0.10,
+                             help="Empeoramiento relativo tolerado (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+    options = {'warmup': args.warmup, 'min_reps': args.min_reps,
+               'max_reps': args.max_reps, 'min_time': args.min_time}
+
+    if args.command == 'run':
+        _save(run_benchmarks(**options), args.output)
+        return 0
+
+    baseline = _load(args.baseline)
+    if args.current:
+        current = _load(args.current)
+    else:
+        configs = [(r['algoritmo'], r['n'], r['variante'])
+                   for r in baseline['resultados'].values()]
+        current = run_benchmarks(configs, **options)
+
+    rows = compare(baseline, current, args.threshold)
+    print("\n" + "-"*80)
+    print(f"{'Configuración':<34} {'Base (ms)':<12} {'Actual (ms)':<12} {'Razón':<8} Estado")
+    print("-"*80)
+    for row in rows:
+        status = "REGRESIÓN" if row['regresion'] else "ok"
+        print(f"{row['configuracion']:<34} {row['base_ns'] / 1e6:<12.4f} "
+              f"{row['actual_ns'] / 1e6:<12.4f} {row['razon']:<8.3f} {status}")
+    regressions = sum(row['regresion'] for row in rows)
+    if regressions:
+        print(f"\n{regressions} configuración(es) empeoraron más de {args.threshold:.0%}")
+        return 1
+    print("\nSin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+"""
+Representación compacta del tablero para el Problema de las N-Reinas
+
+El tablero se guarda en un buffer array('i') (4 bytes por reina) en lugar de
+una lista de enteros de Python (~36 bytes por reina entre puntero y objeto int).
+Junto con las posiciones se mantienen los contadores de reinas por fila,
+diagonal principal (row - col) y diagonal secundaria (row + col), lo que permite:
+- Calcular en O(1) el cambio de conflictos al mover una reina (búsqueda local)
+- Verificar en O(1) si una casilla es segura (backtracking)
+
+Una columna sin reina se representa con -1, igual que en el formato de lista.
+
+Las posiciones ocupan 4n bytes (~4 MB para n = 10^6). Un contador nunca
+supera n, así que los contadores (n filas y 2n - 1 por cada familia de
+diagonales) usan el tipo entero más pequeño que admite n (smallest_typecode):
+1 byte hasta n = 127 y 2 bytes hasta n = 32767, de modo que el tablero completo
+ocupa unos 14n bytes en lugar de 24n. A partir de ahí los contadores necesitan
+4 bytes y el tablero completo vuelve a ~24n (~24 MB para n = 10^6); para n de
+ese orden, HugeNQueensLocalSearch prescinde del contador de filas. Ver
+Board.nbytes.
+
+PermutationBoard es la variante en la que el tablero siempre es una permutación
+(una reina por fila): el vecindario son los intercambios de dos columnas y solo
+hay conflictos diagonales.
+"""
+
+import random
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+EMPTY = -1
+
+# Tipos enteros con signo de array ordenados por tamaño
+_TYPECODES = ('b', 'h', 'i', 'q')
+
+
+def smallest_typecode(max_value: int) -> str:
+    """
+    Código de tipo de array más pequeño capaz de representar max_value.
+
+    Args:
+        max_value: Valor máximo que debe caber
+
+    Returns:
+        Código de tipo ('b', 'h', 'i' o 'q')
+    """
+    for code in _TYPECODES:
+        if max_value < 1 << (8 * array(code).itemsize - 1):
+            return code
+    raise ValueError(f"Valor demasiado grande para un array: {max_value}")
+
+
+def zeros(typecode: str, length: int) -> array:
+    """Crea un array de ceros sin pasar por objetos de Python por elemento."""
+    return array(typecode, bytes(array(typecode).itemsize * length))
+
+
+class Board:
+    """Tablero de N-Reinas respaldado por array('i') con contadores de conflictos."""
+
+    __slots__ = ('n', 'queens', 'rows', 'diag1', 'diag2', 'conflicts')
+
+    def __init__(self, n: int, queens: Optional[Iterable[int]] = None):
+        """
+        Inicializa el tablero.
+
+        Args:
+            n: Tamaño del tablero
+            queens: Filas de las reinas por columna (None = tablero vacío)
+        """
+        self.n = n
+        if queens is None:
+            self.queens = array('i', [EMPTY]) * n
+        else:
+            self.queens = array('i', queens)
+            if len(self.queens) != n:
+                raise ValueError(f"Se esperaban {n} columnas, se recibieron {len(self.queens)}")
+        counter_code = smallest_typecode(n)
+        self.rows = zeros(counter_code, n)
+        self.diag1 = zeros(counter_code, max(0, 2 * n - 1))
+        self.diag2 = zeros(counter_code, max(0, 2 * n - 1))
+        self.conflicts = 0
+        self._rebuild_counters()
+
+    def _rebuild_counters(self) -> None:
+        """Recalcula los contadores y el número de conflictos desde las posiciones."""
+        n = self.n
+        rows, diag1, diag2 = self.rows, self.diag1, self.diag2
+        for col, row in enumerate(self.queens):
+            if row != EMPTY:
+                rows[row] += 1
+                diag1[row - col + n - 1] += 1
+                diag2[row + col] += 1
+        self.conflicts = sum(k * (k - 1) // 2
+                             for counters in (rows, diag1, diag2)
+                             for k in counters)
+
+    @classmethod
+    def from_list(cls, board: List[int]) -> 'Board':
+        """
+        Crea un tablero a partir del formato de lista (board[i] = fila en columna i).
+
+        Args:
+            board: Lista de filas por columna
+
+        Returns:
+            Nuevo tablero
+        """
+        return cls(len(board), board)
+
+    def to_list(self) -> List[int]:
+        """
+        Exporta el tablero al formato de lista usado por los solvers.
+
+        Returns:
+            Lista donde board[i] = fila de la reina en la columna i
+        """
+        return self.queens.tolist()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, col: int) -> int:
+        return self.queens[col]
+
+    def __iter__(self):
+        return iter(self.queens)
+
+    def __repr__(self) -> str:
+        return f"Board(n={self.n}, conflicts={self.conflicts})"
+
+    def view(self) -> memoryview:
+        """
+        Vista de solo lectura sobre las posiciones, sin copiar el buffer.
+
+        Returns:
+            memoryview de enteros de 32 bits
+        """
+        return memoryview(self.queens).toreadonly()
+
+    def snapshot(self) -> Tuple[array, array, array, array, int]:
+        """
+        Captura el estado completo (posiciones y contadores) con copias de buffer.
+
+        Returns:
+            Instantánea que se puede pasar a restore()
+        """
+        return (self.queens[:], self.rows[:], self.diag1[:], self.diag2[:],
+                self.conflicts)
+
+    def restore(self, snapshot: Tuple[array, array, array, array, int]) -> None:
+        """
+        Restaura un estado capturado con snapshot().
+
+        Args:
+            snapshot: Instantánea del mismo tablero
+        """
+        queens, rows, diag1, diag2, conflicts = snapshot
+        self.queens[:] = queens
+        self.rows[:] = rows
+        self.diag1[:] = diag1
+        self.diag2[:] = diag2
+        self.conflicts = conflicts
+
+    def copy(self) -> 'Board':
+        """Copia independiente del tablero."""
+        other = type(self).__new__(type(self))
+        other.n = self.n
+        (other.queens, other.rows, other.diag1, other.diag2,
+         other.conflicts) = self.snapshot()
+        return other
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por las posiciones y los contadores de filas y diagonales."""
+        return sum(buf.itemsize * len(buf)
+                   for buf in (self.queens, self.rows, self.diag1, self.diag2))
+
+    def is_free(self, col: int, row: int) -> bool:
+        """
+        Verifica si ninguna reina colocada ataca la casilla (row, col).
+
+        Args:
+            col: Columna de la casilla
+            row: Fila de la casilla
+
+        Returns:
+            True si la fila y ambas diagonales están libres
+        """
+        return (self.rows[row] == 0 and self.diag1[row - col + self.n - 1] == 0
+                and self.diag2[row + col] == 0)
+
+    def queen_conflicts(self, col: int) -> int:
+        """
+        Número de reinas que atacan a la reina de la columna col.
+
+        Args:
+            col: Columna de la reina
+
+        Returns:
+            Número de conflictos en los que participa la reina (0 si está vacía)
+        """
+        row = self.queens[col]
+        if row == EMPTY:
+            return 0
+        return (self.rows[row] + self.diag1[row - col + self.n - 1]
+                + self.diag2[row + col] - 3)
+
+    def delta(self, col: int, row: int) -> int:
+        """
+        Cambio en el número de conflictos si la reina de col se mueve a row.
+
+        Args:
+            col: Columna de la reina a mover
+            row: Fila destino
+
+        Returns:
+            Conflictos nuevos menos conflictos actuales
+        """
+        if self.queens[col] == row:
+            return 0
+        added = (self.rows[row] + self.diag1[row - col + self.n - 1]
+                 + self.diag2[row + col])
+        return added - self.queen_conflicts(col)
+
+    def place(self, col: int, row: int) -> None:
+        """
+        Coloca una reina en una columna vacía.
+
+        Args:
+            col: Columna vacía
+            row: Fila donde colocar la reina
+        """
+        n = self.n
+        self.conflicts += (self.rows[row] + self.diag1[row - col + n - 1]
+                           + self.diag2[row + col])
+        self.rows[row] += 1
+        self.diag1[row - col + n - 1] += 1
+        self.diag2[row + col] += 1
+        self.queens[col] = row
+
+    def remove(self, col: int) -> None:
+        """
+        Quita la reina de una columna (no hace nada si está vacía).
+
+        Args:
+            col: Columna de la reina
+        """
+        row = self.queens[col]
+        if row == EMPTY:
+            return
+        n = self.n
+        self.conflicts -= self.queen_conflicts(col)
+        self.rows[row] -= 1
+        self.diag1[row - col + n - 1] -= 1
+        self.diag2[row + col] -= 1
+        self.queens[col] = EMPTY
+
+    def move(self, col: int, row: int) -> None:
+        """
+        Mueve la reina de la columna col a la fila row actualizando contadores.
+
+        Args:
+            col: Columna de la reina a mover
+            row: Fila destino
+        """
+        if self.queens[col] == row:
+            return
+        self.remove(col)
+        self.place(col, row)
+
+    # Interfaz de movimientos usada por las estrategias de búsqueda local.
+    # En Board un movimiento es (columna, fila destino).
+
+    def moves(self) -> Iterator[Tuple[int, int]]:
+        """Itera sobre todos los movimientos (col, row) del vecindario."""
+        queens = self.queens
+        n = self.n
+        for col in range(n):
+            current = queens[col]
+            for row in range(n):
+                if row != current:
+                    yield col, row
+
+    def random_move(self) -> Tuple[int, int]:
+        """Movimiento aleatorio del vecindario (requiere n >= 2)."""
+        col = random.randrange(self.n)
+        row = random.randrange(self.n - 1)
+        if row >= self.queens[col]:
+            row += 1
+        return col, row
+
+    def move_delta(self, a: int, b: int) -> int:
+        """Cambio de conflictos del movimiento (a, b)."""
+        return self.delta(a, b)
+
+    def apply_move(self, a: int, b: int) -> None:
+        """Aplica el movimiento (a, b)."""
+        self.move(a, b)
+
+    def vacated(self, a: int, b: int) -> Tuple[Tuple[int, int], ...]:
+        """Posiciones (col, row) que el movimiento (a, b) deja libres."""
+        return ((a, self.queens[a]),)
+
+    def entered(self, a: int, b: int) -> Tuple[Tuple[int, int], ...]:
+        """Posiciones (col, row) que el movimiento (a, b) ocupa."""
+        return ((a, b),)
+
+
+def pairs_change(counters: array, changes: Tuple[Tuple[int, int], ...]) -> int:
+    """
+    Cambio en el número de pares C(k, 2) al aplicar incrementos a los contadores.
+
+    Args:
+        counters: Contadores de reinas por línea (fila o diagonal)
+        changes: Pares (índice, incremento); un índice puede repetirse
+
+    Returns:
+        Pares nuevos menos pares actuales
+    """
+    net = {}
+    for idx, step in changes:
+        net[idx] = net.get(idx, 0) + step
+    total = 0
+    for idx, step in net.items():
+        k = counters[idx]
+        total += step * k + step * (step - 1) // 2
+    return total
+
+
+class PermutationBoard(Board):
+    """
+    Tablero restringido a permutaciones con vecindario de intercambios.
+
+    Un movimiento (i, j) intercambia las filas de las columnas i y j. Como cada
+    fila tiene exactamente una reina, solo cambian los contadores diagonales y
+    el delta de un intercambio se calcula en O(1).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, n: int, queens: Optional[Iterable[int]] = None):
+        """
+        Inicializa el tablero.
+
+        Args:
+            n: Tamaño del tablero
+            queens: Permutación de range(n) (None = permutación aleatoria)
+        """
+        if queens is None:
+            queens = list(range(n))
+            random.shuffle(queens)
+        super().__init__(n, queens)
+        if any(count != 1 for count in self.rows):
+            raise ValueError("El estado inicial debe ser una permutación de las filas")
+
+    def swap_delta(self, i: int, j: int) -> int:
+        """
+        Cambio en conflictos diagonales al intercambiar las columnas i y j.
+
+        Args:
+            i: Primera columna
+            j: Segunda columna
+
+        Returns:
+            Conflictos nuevos menos conflictos actuales
+        """
+        if i == j:
+            return 0
+        queens = self.queens
+        ri, rj = queens[i], queens[j]
+        off = self.n - 1
+        return (pairs_change(self.diag1, ((ri - i + off, -1), (rj - j + off, -1),
+                                           (rj - i + off, 1), (ri - j + off, 1)))
+                + pairs_change(self.diag2, ((ri + i, -1), (rj + j, -1),
+                                             (rj + i, 1), (ri + j, 1))))
+
+    def swap(self, i: int, j: int) -> None:
+        """
+        Intercambia las filas de las columnas i y j actualizando contadores.
+
+        Args:
+            i: Primera columna
+            j: Segunda columna
+        """
+        if i == j:
+            return
+        self.conflicts += self.swap_delta(i, j)
+        queens = self.queens
+        ri, rj = queens[i], queens[j]
+        off = self.n - 1
+        diag1, diag2 = self.diag1, self.diag2
+        diag1[ri - i + off] -= 1
+        diag2[ri + i] -= 1
+        diag1[rj - j + off] -= 1
+        diag2[rj + j] -= 1
+        diag1[rj - i + off] += 1
+        diag2[rj + i] += 1
+        diag1[ri - j + off] += 1
+        diag2[ri + j] += 1
+        queens[i], queens[j] = rj, ri
+
+    # Interfaz de movimientos: un movimiento es el intercambio (i, j), i < j.
+
+    def moves(self) -> Iterator[Tuple[int, int]]:
+        """Itera sobre todos los intercambios (i, j) con i < j."""
+        n = self.n
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+
+    def random_move(self) -> Tuple[int, int]:
+        """Intercambio aleatorio de dos columnas distintas (requiere n >= 2)."""
+        i, j = random.sample(range(self.n), 2)
+        return (i, j) if i < j else (j, i)
+
+    def move_delta(self, a: int, b: int) -> int:
+        return self.swap_delta(a, b)
+
+    def apply_move(self, a: int, b: int) -> None:
+        self.swap(a, b)
+
+    def vacated(self, a: int, b: int) -> Tuple[Tuple[int, int], ...]:
+        return ((a, self.queens[a]), (b, self.queens[b]))
+
+    def entered(self, a: int, b: int) -> Tuple[Tuple[int, int], ...]:
+        return ((a, self.queens[b]), (b, self.queens[a]))
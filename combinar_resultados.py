@@ -1,45 +1,45 @@
 """
-Script para combinar los resultados de los experimentos individuales en un solo archivo.
+Script para combinar los resultados de los experimentos en un solo archivo.
+
+Los resultados se consultan en el almacén de solo anexado (resultados.db): se
+toma el resumen más reciente de cada experimento. Los experimentos que aún no
+estén en el almacén se leen de los JSON individuales de versiones anteriores.
 """
 
 import json
 import os
 
-def combinar_resultados():
+from results_store import DEFAULT_PATH, ResultsStore
+
+# JSON individuales generados por versiones anteriores de run_experiments.py
+ARCHIVOS_ANTERIORES = {
+    'experimento1': 'resultados_experimento1.json',
+    'experimento2': 'resultados_experimento2.json',
+    'experimento3': 'resultados_experimento3.json'
+}
+
+def combinar_resultados(almacen=DEFAULT_PATH, salida='resultados_experimentos.json'):
     """Combina los resultados de los experimentos en un solo archivo."""
-    resultados_combinados = {
-        'experimento1': {},
-        'experimento2': {},
-        'experimento3': {}
-    }
+    resultados_combinados = {clave: {} for clave in ARCHIVOS_ANTERIORES}
     
-    # Cargar Experimento 1
-    if os.path.exists('resultados_experimento1.json'):
-        with open('resultados_experimento1.json', 'r', encoding='utf-8') as f:
-            exp1 = json.load(f)
-            resultados_combinados['experimento1'] = exp1.get('experimento1', {})
+    # Respaldo: JSON individuales anteriores al almacén
+    for clave, archivo in ARCHIVOS_ANTERIORES.items():
+        if os.path.exists(archivo):
+            with open(archivo, 'r', encoding='utf-8') as f:
+                resultados_combinados[clave] = json.load(f).get(clave, {})
     
-    # Cargar Experimento 2
-    if os.path.exists('resultados_experimento2.json'):
-        with open('resultados_experimento2.json', 'r', encoding='utf-8') as f:
-            exp2 = json.load(f)
-            resultados_combinados['experimento2'] = exp2.get('experimento2', {})
-    
-    # Cargar Experimento 3
-    if os.path.exists('resultados_experimento3.json'):
-        with open('resultados_experimento3.json', 'r', encoding='utf-8') as f:
-            exp3 = json.load(f)
-            resultados_combinados['experimento3'] = exp3.get('experimento3', {})
+    # Resumen más reciente de cada experimento en el almacén
+    if os.path.exists(almacen):
+        with ResultsStore(almacen) as store:
+            resultados_combinados.update(store.latest_results())
     
     # Guardar archivo combinado
-    with open('resultados_experimentos.json', 'w', encoding='utf-8') as f:
+    with open(salida, 'w', encoding='utf-8') as f:
         json.dump(resultados_combinados, f, indent=2, ensure_ascii=False)
     
-    print("Resultados combinados en: resultados_experimentos.json")
-    print(f"  - Experimento 1: {'✓' if resultados_combinados['experimento1'] else '✗'}")
-    print(f"  - Experimento 2: {'✓' if resultados_combinados['experimento2'] else '✗'}")
-    print(f"  - Experimento 3: {'✓' if resultados_combinados['experimento3'] else '✗'}")
+    print(f"Resultados combinados en: {salida}")
+    for clave, datos in resultados_combinados.items():
+        print(f"  - {clave}: {'✓' if datos else '✗'}")
 
 if __name__ == "__main__":
     combinar_resultados()
-
@@ -9,84 +9,635 @@ Este script realiza los tres experimentos requeridos:
 Las instrucciones especifican que se deben medir:
 - Tiempo de ejecución
 - Número de iteraciones/estados explorados
-- Memoria utilizada (opcional, requiere psutil)
+- Memoria utilizada (pico de tracemalloc y RSS máximo, medidos en subprocesos)
 - Variabilidad en tiempo y soluciones
+
+Los experimentos 1-3 y los benchmarks de estrategias, inicialización,
+reinicios y solver híbrido se descomponen en ensayos independientes
+(algoritmo, n, variante, semilla y opciones del solver, ver solvers.Trial) que
+se ejecutan en un pool de procesos configurable (ExperimentRunner(workers=...)).
+Los resultados se recogen en el orden de los ensayos, de modo que con una
+semilla fija el resultado es el mismo con cualquier número de procesos.
+
+La memoria se mide aparte del tiempo: cada ensayo se repite (con la misma
+semilla) en un subproceso nuevo, donde se registra el pico de tracemalloc, el
+RSS máximo (resource.getrusage) y las líneas de código que más memoria tienen
+reservada cerca del pico.
+
+Si el ejecutor tiene un ResultsStore, cada ensayo se anexa al almacén en
+cuanto termina y cada experimento anexa su resumen al completarse. Además el
+almacén actúa como caché: cada ensayo tiene una clave (hash del código del
+solver, experimento, algoritmo, n, variante, semilla y repetición) y los que ya
+están almacenados no se vuelven a ejecutar salvo con force=True.
+
+Con límites por ensayo (timeout en segundos de reloj y/o memory_limit_mb) cada
+ensayo corre en su propio proceso hijo; si supera un límite el hijo se mata y
+el ensayo se registra con estado 'timeout' u 'oom' sin detener el resto.
+
+Con profile='cprofile' o 'sample' (ver profiling.py) los ensayos se ejecutan
+en este proceso bajo el perfilador, sin caché ni almacén (sus tiempos incluyen
+la sobrecarga del perfilador), y profile_report() escribe los .pstats y .folded
+de cada configuración.
+
+Con un TrialStreamWriter (stream=..., ver streaming.py) cada ensayo se escribe
+además como una fila CSV/JSONL en cuanto termina (o en cuanto se toma de la
+caché, o al salir del perfilador), con fsync configurable y rotación atómica.
+La segunda pasada de medición de memoria del Experimento 1 no se escribe: sus
+ensayos repiten los de la primera.
+
+Los módulos que solo usan algunos experimentos (multiprocessing, tracemalloc,
+NumPy a través del modo por lotes y del ajuste de curvas, el perfilador) se
+importan dentro de las funciones que los necesitan. Trial y make_solver están en
+solvers.py (y se reexportan aquí), de modo que resolver un tablero suelto no
+necesita cargar este módulo.
 """
 
 import time
 import statistics
 import csv
+import hashlib
 import json
-from typing import List, Dict, Tuple
+import math
+import random
+import signal
+import threading
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 import sys
 import os
 
-from hill_climbing import HillClimbingNQueens
-from backtracking import BacktrackingNQueens
+from hill_climbing import STRATEGIES, RESTART_POLICIES
+from solvers import Trial, make_solver
+from streaming import TrialStreamWriter, trial_row
+import board as board_module
+import backtracking as backtracking_module
+import hill_climbing as hill_climbing_module
+import hybrid as hybrid_module
+
+if TYPE_CHECKING:
+    from results_store import ResultsStore
 
 try:
-    import psutil
+    import resource
+except ImportError:  # Windows: sin getrusage, solo se reporta tracemalloc
+    resource = None
+
+
+def _max_rss_mb() -> Optional[float]:
+    """RSS máximo del proceso en MB (ru_maxrss está en KB en Linux y en bytes en macOS)."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+def _traced_solve(solver, top: int = 5, interval: float = 0.005) -> Tuple[List[int], dict, dict]:
+    """
+    Ejecuta solver.solve() bajo tracemalloc.
+    
+    Un hilo auxiliar toma instantáneas cada `interval` segundos y conserva la de
+    mayor memoria trazada, de modo que las líneas calientes corresponden al
+    momento más cercano al pico y no solo a lo que sobrevive al final.
+    
+    Args:
+        solver: Solver con método solve()
+        top: Número de líneas calientes a reportar
+        interval: Periodo de muestreo en segundos
+        
+    Returns:
+        Tupla (solución, estadísticas, memoria)
+    """
     import tracemalloc
-    MEMORY_AVAILABLE = True
-except ImportError:
-    MEMORY_AVAILABLE = False
-    print("Advertencia: psutil o tracemalloc no disponibles. No se medirá memoria.")
+
+    rss_before = _max_rss_mb()
+    best = [None, -1]
+    stop = threading.Event()
+    
+    def sample():
+        while not stop.wait(interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > best[1]:
+                best[:] = [tracemalloc.take_snapshot(), current]
+    
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        solution, stats = solver.solve()
+    finally:
+        stop.set()
+        sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        if current >= best[1]:
+            best[:] = [tracemalloc.take_snapshot(), current]
+        tracemalloc.stop()
+    
+    # Excluir las reservas del propio muestreo
+    snapshot = best[0].filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                      tracemalloc.Filter(False, threading.__file__),
+                                      tracemalloc.Filter(False, '*_weakrefset.py'),
+                                      tracemalloc.Filter(False, __file__)])
+    hot_lines = [{
+        'archivo': os.path.basename(stat.traceback[0].filename),
+        'linea': stat.traceback[0].lineno,
+        'kb': stat.size / 1024,
+        'bloques': stat.count
+    } for stat in snapshot.statistics('lineno')[:top]]
+    rss_after = _max_rss_mb()
+    
+    return solution, stats, {
+        'pico_mb': peak / (1024 * 1024),
+        'rss_max_mb': rss_after,
+        'rss_incremento_mb': (max(0, rss_after - rss_before)
+                              if rss_after is not None else None),
+        'lineas_calientes': hot_lines
+    }
+
+
+# Módulos cuyo código determina el resultado de cada algoritmo
+SOLVER_MODULES = {
+    'hill_climbing': (hill_climbing_module, board_module),
+    'backtracking': (backtracking_module, board_module),
+    'hybrid': (hybrid_module, backtracking_module, board_module)
+}
+
+
+@lru_cache(maxsize=None)
+def solver_source_hash(algorithm: str) -> str:
+    """
+    Hash SHA-256 del código fuente del que depende un algoritmo (sus módulos y
+    make_solver, que fija los parámetros de cada variante).
+    
+    Args:
+        algorithm: 'hill_climbing', 'backtracking' o 'hybrid'
+        
+    Returns:
+        Hash hexadecimal
+    """
+    import inspect
+
+    digest = hashlib.sha256()
+    for module in SOLVER_MODULES[algorithm]:
+        digest.update(inspect.getsource(module).encode('utf-8'))
+    digest.update(inspect.getsource(make_solver).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def trial_cache_key(trial: Trial, experiment: str, track_memory: bool = False) -> str:
+    """
+    Clave de caché de un ensayo.
+    
+    Args:
+        trial: Ensayo
+        experiment: Clave del experimento al que pertenece
+        track_memory: Si el ensayo mide memoria (su resultado es distinto)
+        
+    Returns:
+        Hash hexadecimal que cambia si cambia el código del solver o la configuración
+    """
+    parts = (solver_source_hash(trial.algorithm), experiment, trial.algorithm, trial.n,
+             trial.variant, trial.seed, trial.repetition, trial.options, track_memory)
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def run_trial(trial: Trial, track_memory: bool = False) -> Tuple[List[int], dict, Optional[dict]]:
+    """
+    Ejecuta un ensayo. Es una función de módulo para poder enviarla a otro proceso.
+    
+    Args:
+        trial: Ensayo a ejecutar
+        track_memory: Si es True, mide la memoria con _traced_solve (el tiempo
+            reportado incluye la sobrecarga de tracemalloc)
+        
+    Returns:
+        Tupla (solución, estadísticas con 'cpu_time' añadido, memoria o None)
+    """
+    if trial.seed is not None:
+        # Las repeticiones de una misma semilla usan semillas derivadas distintas
+        random.seed(trial.seed if trial.repetition == 0 else f"{trial.seed}:{trial.repetition}")
+    solver = make_solver(trial)
+    cpu_start = time.process_time()
+    if track_memory:
+        solution, stats, memory = _traced_solve(solver)
+    else:
+        solution, stats = solver.solve()
+        memory = None
+    stats['cpu_time'] = time.process_time() - cpu_start
+    return solution, stats, memory
+
+
+# Estados de un ensayo que no terminó normalmente (no se toman de la caché)
+FAILED_STATES = ('timeout', 'oom', 'error')
+
+
+def _address_space_bytes() -> int:
+    """Tamaño actual del espacio de direcciones del proceso (0 si no se puede leer)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _isolated_trial(conn, trial: Trial, track_memory: bool,
+                    memory_limit_mb: Optional[float]) -> None:
+    """
+    Cuerpo del proceso hijo de un ensayo aislado: aplica el límite de memoria,
+    ejecuta el ensayo y envía (estado, resultado) por la tubería.
+    
+    El límite se aplica a RLIMIT_AS por encima del espacio de direcciones que
+    el proceso ya ocupa (intérprete y módulos importados), de modo que
+    memory_limit_mb es la memoria adicional que puede reservar el solver.
+    """
+    if memory_limit_mb is not None and resource is not None:
+        limit = _address_space_bytes() + int(memory_limit_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        outcome = ('ok', run_trial(trial, track_memory))
+    except MemoryError:
+        outcome = ('oom', None)
+    except Exception as e:
+        outcome = ('error', repr(e))
+    conn.send(outcome)
+    conn.close()
+
+
+def failed_trial(trial: Trial, state: str, elapsed: float,
+                 detail: Optional[str] = None) -> Tuple[List[int], dict, None]:
+    """
+    Resultado de un ensayo que no terminó, con las claves que esperan los experimentos.
+    
+    Args:
+        trial: Ensayo
+        state: 'timeout', 'oom' o 'error'
+        elapsed: Tiempo transcurrido hasta la interrupción
+        detail: Descripción del error (opcional)
+        
+    Returns:
+        Tupla (solución vacía, estadísticas, None)
+    """
+    stats = {'solution_found': False, 'execution_time': elapsed, 'estado': state}
+    if trial.algorithm == 'backtracking':
+        stats['nodes_explored'] = 0
+    else:
+        stats.update({'iterations': 0, 'restarts': 0, 'conflicts': None})
+    if detail is not None:
+        stats['detalle'] = detail
+    return [], stats, None
+
+
+def _init_worker(counter, cpus: List[int]) -> None:
+    """
+    Inicializa un proceso del pool fijándolo a una CPU distinta (si el sistema
+    lo permite), para que los ensayos no compitan por el mismo núcleo.
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+        except OSError:
+            pass
 
 
 class ExperimentRunner:
     """Ejecuta los experimentos comparativos."""
     
-    def __init__(self):
+    def __init__(self, workers: int = 1, seed: Optional[int] = None,
+                 store: Optional['ResultsStore'] = None, force: bool = False,
+                 timeout: Optional[float] = None, memory_limit_mb: Optional[float] = None,
+                 profile: Optional[str] = None, profile_dir: str = 'perfiles',
+                 stream: Optional[TrialStreamWriter] = None):
+        """
+        Inicializa el ejecutor.
+        
+        Args:
+            workers: Número de procesos para los ensayos (experimentos 1-3 y benchmarks)
+                (1 = en el mismo proceso, None = una por CPU disponible)
+            seed: Semilla base; el ensayo i usa seed + i (None = sin fijar)
+            store: Almacén de resultados de solo anexado (None = solo en memoria)
+            force: Si es True, ejecuta todos los ensayos aunque estén en el almacén
+            timeout: Segundos de reloj máximos por ensayo (None = sin límite)
+            memory_limit_mb: Memoria adicional máxima por ensayo en MB (None = sin límite)
+            profile: Modo de perfilado de los ensayos, 'cprofile' o 'sample' (None = sin perfilar)
+            profile_dir: Directorio de los archivos de perfil
+            stream: Escritor de filas por ensayo (None = sin salida en flujo)
+        """
+        self.workers = workers if workers is not None else len(self._available_cpus()) or 1
+        self.seed = seed
+        self.store = store
+        self.force = force
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.profiler = None
+        if profile:
+            from profiling import ProfileCollector
+            self.profiler = ProfileCollector(profile, profile_dir)
+        self.stream = stream
+        # Aciertos y fallos de caché por experimento: {experimento: [aciertos, fallos]}
+        self.cache_stats = {}
         self.results = {
             'experimento1': [],
             'experimento2': [],
-            'experimento3': []
+            'experimento3': [],
+            'estrategias': [],
+            'inicializacion': [],
+            'confiabilidad': [],
+            'reinicios': [],
+            'hibrido': [],
+            'escalabilidad_adaptativa': []
         }
     
-    def measure_memory(self, func, *args, **kwargs):
-        """Mide el uso de memoria de una función."""
-        if not MEMORY_AVAILABLE:
-            return None
+    @staticmethod
+    def _available_cpus() -> List[int]:
+        """CPUs en las que puede ejecutarse este proceso."""
+        if hasattr(os, 'sched_getaffinity'):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+    
+    def make_trials(self, specs: List[tuple], start: int = 0) -> List[Trial]:
+        """
+        Asigna una semilla determinista a cada ensayo.
         
-        process = psutil.Process(os.getpid())
-        mem_before = process.memory_info().rss / 1024 / 1024  # MB
-        result = func(*args, **kwargs)
-        mem_after = process.memory_info().rss / 1024 / 1024  # MB
-        mem_used = mem_after - mem_before
+        Args:
+            specs: Tuplas (algoritmo, n, variante) u (algoritmo, n, variante,
+                opciones) en el orden deseado (ver Trial.options)
+            start: Ensayos ya generados con la misma configuración (un lote
+                posterior continúa la numeración de semillas y repeticiones)
+            
+        Returns:
+            Lista de ensayos
+        """
+        trials = []
+        seen = {}
+        for i, (algorithm, n, variant, *rest) in enumerate(specs):
+            options = rest[0] if rest else ()
+            seed = None if self.seed is None else self.seed + start + i
+            config = (algorithm, n, variant, seed, options)
+            repetition = seen.get(config, start if seed is None else 0)
+            seen[config] = repetition + 1
+            trials.append(Trial(algorithm, n, variant, seed, repetition, options))
+        return trials
+    
+    def run_groups(self, groups: List[Tuple[tuple, int]],
+                   experiment: str) -> List[List[Tuple[List[int], dict, Optional[dict]]]]:
+        """
+        Ejecuta de una vez los ensayos de varias configuraciones con run_trials
+        (pool, almacén, caché, límites y flujo de salida) y los agrupa.
         
-        return result, max(0, mem_used)
+        Args:
+            groups: Pares (especificación de make_trials, número de ejecuciones)
+            experiment: Clave del experimento en el almacén
+            
+        Returns:
+            Resultados de cada grupo, en el orden de groups
+        """
+        trials = self.make_trials([spec for spec, runs in groups for _ in range(runs)])
+        outcomes = iter(self.run_trials(trials, experiment=experiment))
+        return [[next(outcomes) for _ in range(runs)] for _, runs in groups]
+    
+    def run_trials(self, trials: List[Trial], track_memory: bool = False,
+                   experiment: Optional[str] = None,
+                   stream_rows: bool = True) -> List[Tuple[List[int], dict, Optional[dict]]]:
+        """
+        Ejecuta los ensayos, en paralelo si workers > 1.
+        
+        Args:
+            trials: Ensayos a ejecutar
+            track_memory: Si es True, cada ensayo se ejecuta en un subproceso
+                nuevo (spawn, una tarea por proceso) para que el pico de
+                tracemalloc y el RSS máximo no arrastren memoria de otros ensayos
+            experiment: Clave con la que se anexan los ensayos al almacén
+                (None = no se almacenan ni se buscan en la caché)
+            stream_rows: Si es False, los ensayos no se escriben en el flujo de
+                salida (p. ej. la segunda pasada de medición de memoria, que
+                repite ensayos ya escritos)
+            
+        Returns:
+            Resultados de run_trial en el mismo orden que trials
+        """
+        stream = self.stream if stream_rows else None
+        if self.profiler is not None and not track_memory:
+            # Perfilado: en este proceso y sin caché ni almacén, porque los
+            # tiempos incluyen la sobrecarga del perfilador (sí se escriben en el flujo)
+            label = experiment or 'ensayos'
+            results = []
+            for trial in trials:
+                outcome = self.profiler.run((label, trial.algorithm, trial.n, trial.variant),
+                                            partial(run_trial, trial))
+                if stream is not None:
+                    stream.write(trial_row(experiment, trial, outcome[1], outcome[2]))
+                results.append(outcome)
+            return results
+        
+        use_store = self.store is not None and experiment is not None
+        keys = [trial_cache_key(trial, experiment, track_memory) if use_store else None
+                for trial in trials]
+        results = [None] * len(trials)
+        if use_store and not self.force:
+            for i, key in enumerate(keys):
+                record = self.store.find_trial(key)
+                if (record is not None
+                        and record['estadisticas'].get('estado') not in FAILED_STATES):
+                    results[i] = (record['solucion'], record['estadisticas'], record['memoria'])
+                    if stream is not None:
+                        stream.write(trial_row(experiment, trials[i], record['estadisticas'],
+                                                    record['memoria'], cached=True))
+        pending = [i for i, outcome in enumerate(results) if outcome is None]
+        if use_store:
+            hits, misses = self.cache_stats.setdefault(experiment, [0, 0])
+            self.cache_stats[experiment] = [hits + len(trials) - len(pending), misses + len(pending)]
+        if not pending:
+            return results
+        
+        todo = [trials[i] for i in pending]
+        if self.timeout is not None or self.memory_limit_mb is not None:
+            self._collect(pending, todo, self._run_isolated(todo, track_memory), keys,
+                          results, experiment, stream)
+            return results
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import Value, get_context
+
+        workers = min(self.workers, len(todo))
+        func = partial(run_trial, track_memory=track_memory)
+        if track_memory:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'),
+                                       max_tasks_per_child=1)
+        elif workers <= 1:
+            self._collect(pending, todo, map(func, todo), keys, results, experiment, stream)
+            return results
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(Value('i', 0), self._available_cpus()))
+        with pool:
+            # map conserva el orden de entrada independientemente del orden de finalización
+            self._collect(pending, todo, pool.map(func, todo), keys, results, experiment, stream)
+        return results
+    
+    def _run_isolated(self, trials: List[Trial], track_memory: bool):
+        """
+        Ejecuta cada ensayo en su propio proceso hijo con límites de tiempo y memoria.
+        
+        Mantiene hasta `workers` hijos a la vez. Un hijo que supera el timeout se
+        mata (SIGKILL); uno que agota su límite de memoria informa MemoryError o
+        muere por señal. En ambos casos el ensayo se registra como fallido y se
+        continúa con el siguiente.
+        
+        Args:
+            trials: Ensayos a ejecutar
+            track_memory: Si es True, mide la memoria (hijos con spawn)
+            
+        Returns:
+            Iterador de resultados en el mismo orden que trials
+        """
+        from multiprocessing import connection, get_context
+
+        ctx = get_context('spawn') if track_memory else get_context()
+        workers = max(1, min(self.workers, len(trials)))
+        active = {}   # conexión -> (índice, proceso, inicio)
+        ready = {}
+        next_start = 0
+        next_yield = 0
+        
+        while next_yield < len(trials):
+            while next_start < len(trials) and len(active) < workers:
+                parent, child = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_isolated_trial, daemon=True,
+                                      args=(child, trials[next_start], track_memory,
+                                            self.memory_limit_mb))
+                process.start()
+                child.close()
+                active[parent] = (next_start, process, time.perf_counter())
+                next_start += 1
+            
+            wait_time = None
+            if self.timeout is not None:
+                earliest = min(start for _, _, start in active.values())
+                wait_time = max(0.0, earliest + self.timeout - time.perf_counter())
+            for conn in connection.wait(list(active), wait_time):
+                index, process, start = active.pop(conn)
+                try:
+                    state, payload = conn.recv()
+                    process.join()
+                except EOFError:
+                    # El hijo murió sin responder: SIGKILL suele ser el OOM killer del sistema
+                    process.join()
+                    state = 'oom' if process.exitcode == -signal.SIGKILL else 'error'
+                    payload = f"exitcode={process.exitcode}"
+                conn.close()
+                elapsed = time.perf_counter() - start
+                if state == 'ok':
+                    ready[index] = payload
+                else:
+                    ready[index] = failed_trial(trials[index], state, elapsed, payload)
+            
+            if self.timeout is not None:
+                now = time.perf_counter()
+                for conn, (index, process, start) in list(active.items()):
+                    if now - start >= self.timeout:
+                        process.kill()
+                        process.join()
+                        conn.close()
+                        del active[conn]
+                        ready[index] = failed_trial(trials[index], 'timeout', now - start)
+            
+            while next_yield in ready:
+                yield ready.pop(next_yield)
+                next_yield += 1
+    
+    def _collect(self, pending: List[int], trials: List[Trial], outcomes, keys: list,
+                 results: list, experiment: Optional[str],
+                 stream: Optional[TrialStreamWriter]) -> None:
+        """
+        Coloca los resultados en su posición, anexando cada ensayo al almacén y
+        al flujo de salida (si lo hay) al recibirlo.
+        """
+        for i, trial, (solution, stats, memory) in zip(pending, trials, outcomes):
+            if keys[i] is not None:
+                self.store.append_trial(experiment, trial.algorithm, trial.n, trial.variant,
+                                        trial.seed, {'solucion': solution, 'estadisticas': stats,
+                                                     'memoria': memory}, cache_key=keys[i])
+            if stream is not None:
+                stream.write(trial_row(experiment, trial, stats, memory))
+            results[i] = (solution, stats, memory)
+    
+    def cache_report(self) -> None:
+        """Imprime los aciertos y fallos de caché de cada experimento."""
+        if not self.cache_stats:
+            return
+        print("\n" + "-"*80)
+        print("CACHÉ DE ENSAYOS" + (" (desactivada con --force)" if self.force else ""))
+        print("-"*80)
+        for experiment, (hits, misses) in self.cache_stats.items():
+            print(f"{experiment:<25} aciertos={hits:<6} fallos={misses}")
+    
+    def profile_report(self) -> None:
+        """Escribe los perfiles de cada configuración e imprime sus funciones principales."""
+        if self.profiler is not None:
+            self.profiler.report()
+    
+    def store_summary(self, experiment: str) -> None:
+        """
+        Anexa al almacén el resumen de un experimento terminado.
+        
+        Args:
+            experiment: Clave de self.results
+        """
+        if self.store is not None:
+            self.store.append_summary(experiment, self.results[experiment])
     
-    def experimento1_escalabilidad(self):
+    def experimento1_escalabilidad(self, n_values: List[int] = None, hc_attempts: int = 3):
         """
         Experimento 1: Escalabilidad
         Prueba con n = 4, 8, 12, 16, 20 reinas
         Mide tiempo de ejecución y memoria utilizada
+        
+        Args:
+            n_values: Tamaños de tablero (por defecto [4, 8, 12, 16, 20])
+            hc_attempts: Intentos de Hill Climbing por tamaño
         """
         print("\n" + "="*80)
         print("EXPERIMENTO 1: ESCALABILIDAD")
         print("="*80)
         
-        n_values = [4, 8, 12, 16, 20]
+        if n_values is None:
+            n_values = [4, 8, 12, 16, 20]
         results_hc = []
         results_bt = []
         
+        # Hill Climbing (varios intentos por n para obtener mejor resultado) y Backtracking
+        specs = []
+        for n in n_values:
+            specs += [('hill_climbing', n, 'original')] * hc_attempts
+            specs.append(('backtracking', n, 'original'))
+        trials = self.make_trials(specs)
+        outcomes = iter(self.run_trials(trials, experiment='experimento1'))
+        # Segunda pasada con las mismas semillas, en subprocesos, solo para memoria.
+        # Un ensayo que no terminó (timeout, oom) no tiene medida: queda como None
+        memory = iter([None if mem is None or stats.get('estado') in FAILED_STATES else mem
+                       for _, stats, mem in self.run_trials(trials, track_memory=True,
+                                                            experiment='experimento1_memoria',
+                                                            stream_rows=False)])
+        
         for n in n_values:
             print(f"\nProbando con n = {n}...")
             
-            # Hill Climbing (3 intentos para obtener mejor resultado)
             hc_times = []
             hc_iterations = []
             hc_solutions_found = 0
             hc_memory = []
+            hc_rss = []
+            hc_hot_lines = None
             
-            for attempt in range(3):
-                hc = HillClimbingNQueens(n, use_random_restart=False)
-                if MEMORY_AVAILABLE:
-                    (solution, stats), mem = self.measure_memory(hc.solve)
-                    hc_memory.append(mem)
-                else:
-                    solution, stats = hc.solve()
-                    mem = None
+            for attempt in range(hc_attempts):
+                solution, stats, _ = next(outcomes)
+                mem = next(memory)
+                if mem is not None:
+                    hc_memory.append(mem['pico_mb'])
+                    hc_hot_lines = mem['lineas_calientes']
+                    if mem['rss_max_mb'] is not None:
+                        hc_rss.append(mem['rss_max_mb'])
                 
                 hc_times.append(stats['execution_time'])
                 hc_iterations.append(stats['iterations'])
@@ -102,28 +653,29 @@ class ExperimentRunner:
                 'iteraciones_min': min(hc_iterations),
                 'iteraciones_max': max(hc_iterations),
                 'soluciones_encontradas': hc_solutions_found,
-                'memoria_promedio': statistics.mean(hc_memory) if hc_memory else None
+                'intentos': hc_attempts,
+                'memoria_promedio': statistics.mean(hc_memory) if hc_memory else None,
+                'rss_max_promedio': statistics.mean(hc_rss) if hc_rss else None,
+                'lineas_calientes': hc_hot_lines
             })
             
             # Backtracking
-            bt = BacktrackingNQueens(n, use_optimized_pruning=False)
-            if MEMORY_AVAILABLE:
-                (solution, stats), mem = self.measure_memory(bt.solve)
-            else:
-                solution, stats = bt.solve()
-                mem = None
+            solution, stats, _ = next(outcomes)
+            mem = next(memory)
             
             results_bt.append({
                 'n': n,
                 'tiempo': stats['execution_time'],
                 'nodos_explorados': stats['nodes_explored'],
                 'solucion_encontrada': stats['solution_found'],
-                'memoria': mem
+                'memoria': mem['pico_mb'] if mem is not None else None,
+                'rss_max': mem['rss_max_mb'] if mem is not None else None,
+                'lineas_calientes': mem['lineas_calientes'] if mem is not None else None
             })
             
             print(f"  Hill Climbing: tiempo={statistics.mean(hc_times):.6f}s, "
                   f"iteraciones={statistics.mean(hc_iterations):.0f}, "
-                  f"soluciones={hc_solutions_found}/3")
+                  f"soluciones={hc_solutions_found}/{hc_attempts}")
             print(f"  Backtracking: tiempo={stats['execution_time']:.6f}s, "
                   f"nodos={stats['nodes_explored']}, "
                   f"solucion={'Sí' if stats['solution_found'] else 'No'}")
@@ -133,35 +685,62 @@ class ExperimentRunner:
             'hill_climbing': results_hc,
             'backtracking': results_bt
         }
+        self.store_summary('experimento1')
         
         # Generar tabla
         self._print_experimento1_table(results_hc, results_bt)
         
         return results_hc, results_bt
     
-    def experimento2_consistencia(self):
+    def experimento2_consistencia(self, n: int = 8, num_runs: int = 10, sequential: bool = False,
+                                  criterion: str = 'tiempo', target: float = 0.10,
+                                  min_runs: int = 5, max_runs: int = 1000):
         """
         Experimento 2: Consistencia de resultados
         Ejecuta cada algoritmo 10 veces para n = 8
         Analiza variabilidad en tiempo y soluciones
+        
+        Con sequential=True el número de ejecuciones no es fijo: se lanzan por
+        lotes hasta que el intervalo de confianza del criterio es más estrecho
+        que target, el algoritmo resulta determinista o se llega a max_runs
+        (ver sequential.py).
+        
+        Args:
+            n: Tamaño del tablero
+            num_runs: Ejecuciones por algoritmo (modo fijo)
+            sequential: Si es True, usa muestreo secuencial
+            criterion: 'tiempo' (IC del tiempo medio) o 'exito' (IC de la tasa de éxito)
+            target: Anchura objetivo del intervalo (relativa a la media para el tiempo)
+            min_runs: Ejecuciones mínimas por algoritmo (modo secuencial)
+            max_runs: Ejecuciones máximas por algoritmo (modo secuencial)
         """
         print("\n" + "="*80)
         print("EXPERIMENTO 2: CONSISTENCIA DE RESULTADOS")
         print("="*80)
         
-        n = 8
-        num_runs = 10
-        
-        print(f"\nEjecutando cada algoritmo {num_runs} veces para n = {n}...\n")
+        if sequential:
+            print(f"\nMuestreo secuencial para n = {n} (criterio: {criterion}, "
+                  f"anchura objetivo {target:.0%}, máximo {max_runs} ejecuciones)...\n")
+            hc_outcomes, hc_stop = self._sequential_trials('hill_climbing', n, criterion, target,
+                                                           min_runs, max_runs)
+            bt_outcomes, bt_stop = self._sequential_trials('backtracking', n, criterion, target,
+                                                           min_runs, max_runs)
+            print()
+        else:
+            print(f"\nEjecutando cada algoritmo {num_runs} veces para n = {n}...\n")
+            specs = ([('hill_climbing', n, 'original')] * num_runs
+                     + [('backtracking', n, 'original')] * num_runs)
+            outcomes = self.run_trials(self.make_trials(specs), experiment='experimento2')
+            hc_outcomes, bt_outcomes = outcomes[:num_runs], outcomes[num_runs:]
+            hc_stop = bt_stop = 'fijo'
+        # Con muchas ejecuciones solo se imprime el resumen
+        verbose = max(len(hc_outcomes), len(bt_outcomes)) <= 20
         
         # Hill Climbing
         hc_results = []
         hc_solutions = []
         
-        for run in range(1, num_runs + 1):
-            hc = HillClimbingNQueens(n, use_random_restart=False)
-            solution, stats = hc.solve()
-            
+        for run, (solution, stats, _) in enumerate(hc_outcomes, 1):
             solution_str = str(solution) if stats['solution_found'] else "No solución"
             hc_results.append({
                 'ejecucion': run,
@@ -173,18 +752,16 @@ class ExperimentRunner:
             if stats['solution_found']:
                 hc_solutions.append(tuple(solution))
             
-            print(f"HC Ejecución {run}: tiempo={stats['execution_time']:.6f}s, "
-                  f"iteraciones={stats['iterations']}, "
-                  f"solución={'Sí' if stats['solution_found'] else 'No'}")
+            if verbose:
+                print(f"HC Ejecución {run}: tiempo={stats['execution_time']:.6f}s, "
+                      f"iteraciones={stats['iterations']}, "
+                      f"solución={'Sí' if stats['solution_found'] else 'No'}")
         
         # Backtracking
         bt_results = []
         bt_solutions = []
         
-        for run in range(1, num_runs + 1):
-            bt = BacktrackingNQueens(n, use_optimized_pruning=False)
-            solution, stats = bt.solve()
-            
+        for run, (solution, stats, _) in enumerate(bt_outcomes, 1):
             solution_str = str(solution) if stats['solution_found'] else "No solución"
             bt_results.append({
                 'ejecucion': run,
@@ -196,8 +773,9 @@ class ExperimentRunner:
             if stats['solution_found']:
                 bt_solutions.append(tuple(solution))
             
-            print(f"BT Ejecución {run}: tiempo={stats['execution_time']:.6f}s, "
-                  f"nodos={stats['nodes_explored']}")
+            if verbose:
+                print(f"BT Ejecución {run}: tiempo={stats['execution_time']:.6f}s, "
+                      f"nodos={stats['nodes_explored']}")
         
         # Calcular estadísticas
         hc_times = [r['tiempo'] for r in hc_results]
@@ -211,7 +789,7 @@ class ExperimentRunner:
             'iteraciones_promedio': statistics.mean(hc_iterations),
             'iteraciones_desv_est': statistics.stdev(hc_iterations) if len(hc_iterations) > 1 else 0,
             'soluciones_unicas': len(set(hc_solutions)),
-            'tasa_exito': sum(r['solucion_encontrada'] for r in hc_results) / num_runs
+            **self._consistency_intervals(hc_results, hc_stop)
         }
         
         bt_stats = {
@@ -220,7 +798,7 @@ class ExperimentRunner:
             'nodos_promedio': statistics.mean(bt_nodes),
             'nodos_desv_est': statistics.stdev(bt_nodes) if len(bt_nodes) > 1 else 0,
             'soluciones_unicas': len(set(bt_solutions)),
-            'tasa_exito': sum(r['solucion_encontrada'] for r in bt_results) / num_runs
+            **self._consistency_intervals(bt_results, bt_stop)
         }
         
         # Guardar resultados
@@ -230,42 +808,95 @@ class ExperimentRunner:
             'estadisticas_hc': hc_stats,
             'estadisticas_bt': bt_stats
         }
+        self.store_summary('experimento2')
         
         # Generar tabla comparativa
         self._print_experimento2_table(hc_results, bt_results, hc_stats, bt_stats)
         
         return hc_results, bt_results, hc_stats, bt_stats
     
-    def experimento3_optimizacion(self):
+    def _sequential_trials(self, algorithm: str, n: int, criterion: str, target: float,
+                           min_runs: int, max_runs: int) -> Tuple[list, str]:
+        """
+        Ejecuta ensayos por lotes hasta que stop_reason indique parar.
+        
+        El primer lote tiene min_runs ensayos y cada lote siguiente la mitad de
+        los ya hechos, para que con muchas ejecuciones el pool siga ocupado.
+        
+        Returns:
+            Tupla (resultados de run_trial, motivo de parada)
+        """
+        from sequential import stop_reason
+
+        outcomes = []
+        reason = None
+        while reason is None:
+            batch = min(max(min_runs, len(outcomes) // 2), max_runs - len(outcomes))
+            trials = self.make_trials([(algorithm, n, 'original')] * batch, start=len(outcomes))
+            outcomes += self.run_trials(trials, experiment='experimento2')
+            stats = [st for _, st, _ in outcomes]
+            reason = stop_reason([st['execution_time'] for st in stats],
+                                 [st['solution_found'] for st in stats],
+                                 [(tuple(sol), st.get('nodes_explored', st.get('iterations')))
+                                  for sol, st, _ in outcomes],
+                                 criterion, target, min_runs, max_runs)
+            print(f"  {algorithm}: {len(outcomes)} ejecuciones"
+                  + (f" -> parada: {reason}" if reason else ""))
+        return outcomes, reason
+    
+    @staticmethod
+    def _consistency_intervals(results: List[dict], stop: str) -> dict:
+        """Tasa de éxito e intervalos de confianza del 95% de un algoritmo del Experimento 2."""
+        from sequential import mean_ci, wilson_ci
+
+        runs = len(results)
+        successes = sum(r['solucion_encontrada'] for r in results)
+        return {
+            'tasa_exito': successes / runs,
+            'ejecuciones': runs,
+            'tiempo_ic95': list(mean_ci([r['tiempo'] for r in results])),
+            'tasa_exito_ic95': list(wilson_ci(successes, runs)),
+            'parada': stop
+        }
+    
+    def experimento3_optimizacion(self, n_values: List[int] = None):
         """
         Experimento 3: Optimización y modificaciones
         Compara versión original vs. mejorada
         - Hill Climbing: random restart
         - Backtracking: poda adicional optimizada
+        
+        Args:
+            n_values: Tamaños de tablero (por defecto [8, 12, 16])
         """
         print("\n" + "="*80)
         print("EXPERIMENTO 3: OPTIMIZACIÓN Y MODIFICACIONES")
         print("="*80)
         
-        n_values = [8, 12, 16]
+        if n_values is None:
+            n_values = [8, 12, 16]
         results_hc = []
         results_bt = []
         
+        specs = []
+        for n in n_values:
+            specs += [('hill_climbing', n, 'original'), ('hill_climbing', n, 'random_restart'),
+                      ('backtracking', n, 'original'), ('backtracking', n, 'optimizada')]
+        outcomes = iter(self.run_trials(self.make_trials(specs), experiment='experimento3'))
+        
         for n in n_values:
             print(f"\nProbando con n = {n}...")
             
             # Hill Climbing: Original vs. Random Restart
             print("  Hill Climbing Original:")
-            hc_original = HillClimbingNQueens(n, use_random_restart=False)
-            solution_orig, stats_orig = hc_original.solve()
+            solution_orig, stats_orig, _ = next(outcomes)
             
             print(f"    Tiempo: {stats_orig['execution_time']:.6f}s, "
                   f"Iteraciones: {stats_orig['iterations']}, "
                   f"Solución: {'Sí' if stats_orig['solution_found'] else 'No'}")
             
             print("  Hill Climbing con Random Restart:")
-            hc_restart = HillClimbingNQueens(n, use_random_restart=True, max_restarts=50)
-            solution_restart, stats_restart = hc_restart.solve()
+            solution_restart, stats_restart, _ = next(outcomes)
             
             print(f"    Tiempo: {stats_restart['execution_time']:.6f}s, "
                   f"Iteraciones: {stats_restart['iterations']}, "
@@ -280,16 +911,14 @@ class ExperimentRunner:
             
             # Backtracking: Original vs. Poda Optimizada
             print("  Backtracking Original:")
-            bt_original = BacktrackingNQueens(n, use_optimized_pruning=False)
-            solution_bt_orig, stats_bt_orig = bt_original.solve()
+            solution_bt_orig, stats_bt_orig, _ = next(outcomes)
             
             print(f"    Tiempo: {stats_bt_orig['execution_time']:.6f}s, "
                   f"Nodos: {stats_bt_orig['nodes_explored']}, "
                   f"Solución: {'Sí' if stats_bt_orig['solution_found'] else 'No'}")
             
             print("  Backtracking con Poda Optimizada:")
-            bt_optimized = BacktrackingNQueens(n, use_optimized_pruning=True)
-            solution_bt_opt, stats_bt_opt = bt_optimized.solve()
+            solution_bt_opt, stats_bt_opt, _ = next(outcomes)
             
             print(f"    Tiempo: {stats_bt_opt['execution_time']:.6f}s, "
                   f"Nodos: {stats_bt_opt['nodes_explored']}, "
@@ -306,47 +935,521 @@ class ExperimentRunner:
             'hill_climbing': results_hc,
             'backtracking': results_bt
         }
+        self.store_summary('experimento3')
         
         # Generar tablas
         self._print_experimento3_tables(results_hc, results_bt)
         
         return results_hc, results_bt
     
+    def experimento_estrategias(self, n_values: List[int] = None, num_runs: int = 20,
+                                strategies: Dict[str, dict] = None,
+                                use_permutation: bool = False):
+        """
+        Benchmark de estrategias de búsqueda local para Hill Climbing.
+        Compara tasa de éxito frente a tiempo de CPU para cada estrategia.
+        
+        Args:
+            n_values: Tamaños de tablero a probar
+            num_runs: Ejecuciones por estrategia y tamaño
+            strategies: Diccionario nombre -> parámetros del constructor
+                (por defecto, todas las estrategias con parámetros por defecto)
+            use_permutation: Si es True, usa la representación por permutaciones
+        """
+        print("\n" + "="*80)
+        print("BENCHMARK: ESTRATEGIAS DE BÚSQUEDA LOCAL")
+        print("="*80)
+        
+        if n_values is None:
+            n_values = [8, 16, 32]
+        if strategies is None:
+            strategies = {name: {} for name in STRATEGIES}
+        results = []
+        
+        # La variante de cada ensayo es el nombre de la estrategia
+        groups = [(('hill_climbing', n, name, (('strategy', name),
+                                               ('strategy_params', tuple(sorted(params.items()))),
+                                               ('use_permutation', use_permutation))), num_runs)
+                  for n in n_values for name, params in strategies.items()]
+        outcomes = iter(self.run_groups(groups, 'estrategias'))
+        
+        for n in n_values:
+            print(f"\nProbando con n = {n}...")
+            for name, params in strategies.items():
+                group = [stats for _, stats, _ in next(outcomes)]
+                # Un ensayo cortado por un límite no tiene tiempo de CPU: cuenta su tiempo de reloj
+                cpu_times = [stats.get('cpu_time', stats['execution_time']) for stats in group]
+                iterations = [stats['iterations'] for stats in group]
+                found = sum(stats['solution_found'] for stats in group)
+                
+                total_cpu = sum(cpu_times)
+                results.append({
+                    'n': n,
+                    'estrategia': name,
+                    'parametros': params,
+                    'representacion': 'permutation' if use_permutation else 'columns',
+                    'ejecuciones': num_runs,
+                    'tasa_exito': found / num_runs,
+                    'tiempo_cpu_promedio': statistics.mean(cpu_times),
+                    'tiempo_cpu_por_exito': total_cpu / found if found else None,
+                    'iteraciones_promedio': statistics.mean(iterations)
+                })
+                
+                print(f"  {name:<12} éxito={found}/{num_runs}, "
+                      f"cpu={statistics.mean(cpu_times):.6f}s, "
+                      f"iteraciones={statistics.mean(iterations):.0f}")
+        
+        self.results['estrategias'] = results
+        self.store_summary('estrategias')
+        self._print_estrategias_table(results)
+        
+        return results
+    
+    def experimento_inicializacion(self, n_values: List[int] = None, num_runs: int = 3,
+                                   strategy: str = 'sideways', use_permutation: bool = True):
+        """
+        Benchmark de inicialización: estado aleatorio vs. voraz.
+        Mide conflictos iniciales, iteraciones y tiempo hasta la solución.
+        
+        Args:
+            n_values: Tamaños de tablero a probar
+            num_runs: Ejecuciones por inicialización y tamaño
+            strategy: Estrategia de búsqueda local a usar
+            use_permutation: Si es True, usa la representación por permutaciones
+        """
+        print("\n" + "="*80)
+        print("BENCHMARK: INICIALIZACIÓN ALEATORIA VS. VORAZ")
+        print("="*80)
+        
+        if n_values is None:
+            n_values = [32, 64, 128]
+        results = []
+        
+        # El estado inicial se genera dentro de solve(), así que el tiempo incluye
+        # la inicialización; la variante de cada ensayo es 'random' o 'greedy'
+        groups = [(('hill_climbing', n, 'greedy' if greedy else 'random',
+                    (('strategy', strategy), ('use_permutation', use_permutation),
+                     ('use_greedy_init', greedy))), num_runs)
+                  for n in n_values for greedy in (False, True)]
+        outcomes = iter(self.run_groups(groups, 'inicializacion'))
+        
+        for n in n_values:
+            print(f"\nProbando con n = {n}...")
+            for name in ('random', 'greedy'):
+                group = [stats for _, stats, _ in next(outcomes)]
+                # Los ensayos cortados por un límite no informan sus conflictos iniciales
+                initial_conflicts = [stats['initial_conflicts'] for stats in group
+                                     if stats.get('initial_conflicts') is not None]
+                times = [stats['execution_time'] for stats in group]
+                iterations = [stats['iterations'] for stats in group]
+                found = sum(stats['solution_found'] for stats in group)
+                mean_initial = statistics.mean(initial_conflicts) if initial_conflicts else None
+                
+                results.append({
+                    'n': n,
+                    'inicializacion': name,
+                    'estrategia': strategy,
+                    'conflictos_iniciales_promedio': mean_initial,
+                    'iteraciones_promedio': statistics.mean(iterations),
+                    'tiempo_promedio': statistics.mean(times),
+                    'tasa_exito': found / num_runs
+                })
+                
+                initial_text = f"{mean_initial:.1f}" if mean_initial is not None else "N/A"
+                print(f"  {name:<8} conflictos iniciales={initial_text}, "
+                      f"iteraciones={statistics.mean(iterations):.1f}, "
+                      f"tiempo={statistics.mean(times):.6f}s, éxito={found}/{num_runs}")
+        
+        self.results['inicializacion'] = results
+        self.store_summary('inicializacion')
+        
+        return results
+    
+    def experimento_confiabilidad(self, n_values: List[int] = None, num_trials: int = 1000,
+                                  max_sideways: int = 0, seed: int = None):
+        """
+        Barrido de confiabilidad de Hill Climbing usando el modo por lotes.
+        Ejecuta num_trials tableros independientes por cada n en un solo lote.
+        
+        Args:
+            n_values: Tamaños de tablero a probar (por defecto 8..32)
+            num_trials: Tableros (ensayos) por tamaño
+            max_sideways: Movimientos laterales permitidos (0 = ascenso estricto)
+            seed: Semilla del generador aleatorio
+        """
+        from batch_hill_climbing import BatchHillClimbingNQueens
+
+        print("\n" + "="*80)
+        print("BARRIDO DE CONFIABILIDAD: HILL CLIMBING POR LOTES")
+        print("="*80)
+        
+        if n_values is None:
+            n_values = list(range(8, 33))
+        results = []
+        
+        for n in n_values:
+            solver = BatchHillClimbingNQueens(n, num_trials, max_sideways=max_sideways,
+                                              seed=None if seed is None else seed + n)
+            boards, stats = solver.solve()
+            results.append({
+                'n': n,
+                'ensayos': num_trials,
+                'tasa_exito': stats['success_rate'],
+                'iteraciones_promedio': float(stats['iterations'].mean()),
+                'iteraciones_desv_est': float(stats['iterations'].std()),
+                'conflictos_finales_promedio': float(stats['conflicts'].mean()),
+                'tiempo_total': stats['execution_time']
+            })
+            print(f"  n={n:<4} éxito={stats['success_rate']:.3f}, "
+                  f"iteraciones={stats['iterations'].mean():.2f}, "
+                  f"tiempo={stats['execution_time']:.3f}s")
+        
+        self.results['confiabilidad'] = results
+        self.store_summary('confiabilidad')
+        
+        return results
+    
+    def experimento_reinicios(self, n_values: List[int] = None, num_runs: int = 10,
+                              strategy: str = 'sideways', strategy_params: dict = None,
+                              max_restarts: int = 1000, time_budget: float = None):
+        """
+        Benchmark de políticas de reinicio para Random Restart Hill Climbing.
+        Compara el tiempo esperado hasta la solución de cada política.
+        
+        Args:
+            n_values: Tamaños de tablero a probar
+            num_runs: Ejecuciones por política y tamaño
+            strategy: Estrategia de búsqueda local a usar
+            strategy_params: Parámetros de la estrategia (por defecto, movimientos
+                laterales prácticamente ilimitados, de modo que sea la política
+                la que decida cuándo reiniciar)
+            max_restarts: Número máximo de reinicios por ejecución
+            time_budget: Presupuesto de tiempo por ejecución en segundos (opcional)
+        """
+        print("\n" + "="*80)
+        print("BENCHMARK: POLÍTICAS DE REINICIO")
+        print("="*80)
+        
+        if n_values is None:
+            n_values = [16, 32, 48]
+        if strategy_params is None:
+            strategy_params = {'max_sideways': 100000} if strategy == 'sideways' else {}
+        results = []
+        
+        # La variante de cada ensayo es el nombre de la política
+        groups = [(('hill_climbing', n, policy,
+                    (('use_random_restart', True), ('max_restarts', max_restarts),
+                     ('strategy', strategy),
+                     ('strategy_params', tuple(sorted(strategy_params.items()))),
+                     ('restart_policy', policy), ('time_budget', time_budget))), num_runs)
+                  for n in n_values for policy in RESTART_POLICIES]
+        outcomes = iter(self.run_groups(groups, 'reinicios'))
+        
+        for n in n_values:
+            print(f"\nProbando con n = {n}...")
+            for policy in RESTART_POLICIES:
+                group = [stats for _, stats, _ in next(outcomes)]
+                times = [stats['execution_time'] for stats in group]
+                restarts = [stats['restarts'] for stats in group]
+                iterations = [stats['iterations'] for stats in group]
+                found = sum(stats['solution_found'] for stats in group)
+                
+                results.append({
+                    'n': n,
+                    'politica': policy,
+                    'estrategia': strategy,
+                    'presupuesto_tiempo': time_budget,
+                    'tasa_exito': found / num_runs,
+                    'tiempo_promedio': statistics.mean(times),
+                    'tiempo_por_exito': sum(times) / found if found else None,
+                    'reinicios_promedio': statistics.mean(restarts),
+                    'iteraciones_promedio': statistics.mean(iterations)
+                })
+                
+                print(f"  {policy:<10} éxito={found}/{num_runs}, "
+                      f"tiempo={statistics.mean(times):.6f}s, "
+                      f"reinicios={statistics.mean(restarts):.1f}")
+        
+        self.results['reinicios'] = results
+        self.store_summary('reinicios')
+        
+        return results
+    
+    def experimento_hibrido(self, n_values: List[int] = None, num_runs: int = 5,
+                            bt_max_nodes: int = 1000000, hc_max_restarts: int = 100):
+        """
+        Compara el solver híbrido (prefijo por Backtracking + mínimos conflictos)
+        con Hill Climbing con Random Restart y Backtracking puros.
+        
+        Args:
+            n_values: Tamaños de tablero a probar
+            num_runs: Ejecuciones por algoritmo y tamaño (Backtracking es
+                determinista y se ejecuta una vez)
+            bt_max_nodes: Presupuesto de nodos del Backtracking puro
+            hc_max_restarts: Reinicios máximos de Hill Climbing
+        """
+        print("\n" + "="*80)
+        print("BENCHMARK: SOLVER HÍBRIDO VS. ALGORITMOS PUROS")
+        print("="*80)
+        
+        if n_values is None:
+            n_values = [16, 32, 64, 128]
+        # Nombre en los resultados -> (algoritmo, variante, opciones, ejecuciones)
+        solvers = [
+            ('hibrido', 'hybrid', 'original', (), num_runs),
+            ('hill_climbing', 'hill_climbing', 'random_restart',
+             (('max_restarts', hc_max_restarts), ('strategy', 'sideways')), num_runs),
+            ('backtracking', 'backtracking', 'original', (('max_nodes', bt_max_nodes),), 1)
+        ]
+        results = []
+        groups = [((algorithm, n, variant, options), runs)
+                  for n in n_values for _, algorithm, variant, options, runs in solvers]
+        outcomes = iter(self.run_groups(groups, 'hibrido'))
+        
+        for n in n_values:
+            print(f"\nProbando con n = {n}...")
+            for name, _, _, _, runs in solvers:
+                group = [stats for _, stats, _ in next(outcomes)]
+                times = [stats['execution_time'] for stats in group]
+                found = sum(stats['solution_found'] for stats in group)
+                
+                results.append({
+                    'n': n,
+                    'algoritmo': name,
+                    'ejecuciones': runs,
+                    'tasa_exito': found / runs,
+                    'tiempo_promedio': statistics.mean(times)
+                })
+                
+                print(f"  {name:<14} éxito={found}/{runs}, "
+                      f"tiempo={statistics.mean(times):.6f}s")
+        
+        self.results['hibrido'] = results
+        self.store_summary('hibrido')
+        
+        return results
+    
+    def experimento_escalabilidad_adaptativa(self, configs: List[Tuple[str, str]] = None,
+                                            budget: float = 1.0, n_start: int = 4,
+                                            growth: float = 1.25, runs: int = 3,
+                                            max_n: int = 5000,
+                                            predict_budgets: Tuple[float, ...] = (1, 10, 60)):
+        """
+        Escalabilidad adaptativa: aumenta n para cada solver hasta agotar el
+        presupuesto de tiempo por ensayo, ajusta modelos de crecimiento a las
+        curvas de tiempo y de nodos/iteraciones (ver scaling.py) y extrapola el
+        mayor n que cabe en cada presupuesto de predict_budgets.
+        
+        Cada ensayo corre con límite de tiempo (el timeout del ejecutor o, si no
+        hay, 4 veces el presupuesto), así que un n demasiado grande se corta sin
+        bloquear el barrido.
+        
+        Args:
+            configs: Pares (algoritmo, variante) a barrer
+            budget: Segundos por ensayo; el barrido de un solver se detiene cuando
+                la mediana de tiempo lo supera o algún ensayo falla
+            n_start: Tamaño inicial
+            growth: Factor de crecimiento de n entre pasos (al menos +1)
+            runs: Ensayos por tamaño (Backtracking es determinista y usa uno)
+            max_n: Tamaño máximo
+            predict_budgets: Presupuestos en segundos para los que se predice n máximo
+        """
+        from scaling import best_fit, max_n_within
+
+        print("\n" + "="*80)
+        print(f"ESCALABILIDAD ADAPTATIVA (presupuesto {budget:g}s por ensayo)")
+        print("="*80)
+        
+        if configs is None:
+            configs = [('hill_climbing', 'random_restart'), ('backtracking', 'original'),
+                       ('backtracking', 'optimizada'), ('hybrid', 'original')]
+        previous_timeout = self.timeout
+        if self.timeout is None:
+            self.timeout = 4 * budget
+        results = []
+        
+        try:
+            for algorithm, variant in configs:
+                print(f"\n{algorithm} ({variant})...")
+                reps = 1 if algorithm == 'backtracking' else runs
+                points = []
+                n = n_start
+                while n <= max_n:
+                    outcomes = self.run_trials(self.make_trials([(algorithm, n, variant)] * reps),
+                                               experiment='escalabilidad_adaptativa')
+                    stats = [st for _, st, _ in outcomes]
+                    failed = [st['estado'] for st in stats if st.get('estado') in FAILED_STATES]
+                    median_time = statistics.median(st['execution_time'] for st in stats)
+                    points.append({
+                        'n': n,
+                        'tiempo_mediano': median_time,
+                        'nodos_mediano': statistics.median(
+                            st.get('nodes_explored', st.get('iterations', 0)) for st in stats),
+                        'tasa_exito': sum(st['solution_found'] for st in stats) / reps,
+                        'fallos': len(failed)
+                    })
+                    print(f"  n={n:<6} tiempo={median_time:.6f}s"
+                          + (f" ({', '.join(failed)})" if failed else ""))
+                    if failed or median_time > budget:
+                        break
+                    n = max(n + 1, math.ceil(n * growth))
+                
+                # Solo los puntos sin fallos entran en el ajuste
+                valid = [p for p in points if not p['fallos']]
+                n_values = [p['n'] for p in valid]
+                time_fit = best_fit(n_values, [p['tiempo_mediano'] for p in valid])
+                nodes_fit = best_fit(n_values, [p['nodos_mediano'] for p in valid])
+                predicted = {str(b): max_n_within(time_fit, b) if time_fit else None
+                             for b in predict_budgets}
+                results.append({
+                    'algoritmo': algorithm,
+                    'variante': variant,
+                    'puntos': points,
+                    'n_max_medido': max(n_values) if n_values else None,
+                    'ajuste_tiempo': time_fit,
+                    'ajuste_nodos': nodes_fit,
+                    'n_max_predicho': predicted
+                })
+        finally:
+            self.timeout = previous_timeout
+        
+        self.results['escalabilidad_adaptativa'] = results
+        self.store_summary('escalabilidad_adaptativa')
+        
+        self._print_escalabilidad_adaptativa_table(results, predict_budgets)
+        
+        return results
+    
+    def experimento_barrido(self, spec: dict, chunk_size: int = 256):
+        """
+        Ejecuta un barrido declarativo (ver sweep.py).
+        
+        Los ensayos se generan de forma perezosa y se ejecutan en bloques de
+        chunk_size; de cada bloque solo se conservan acumuladores por
+        configuración (algoritmo, n, variante), así que la memoria no crece con
+        el número de ensayos. Con almacén, cada ensayo se anexa al terminar y
+        los ya almacenados se toman de la caché.
+        
+        Args:
+            spec: Especificación del barrido (clave opcional 'experimento' con el
+                nombre bajo el que se guardan los resultados; por defecto 'barrido')
+            chunk_size: Ensayos por bloque
+        """
+        from sweep import chunked, count_trials, expand_sweep, validate_sweep
+        
+        validate_sweep(spec)
+        experiment = spec.get('experimento', 'barrido')
+        total = count_trials(spec)
+        
+        print("\n" + "="*80)
+        print(f"BARRIDO: {experiment} ({total} ensayos)")
+        print("="*80)
+        
+        # Acumuladores por configuración: se preserva el orden de aparición
+        totals = {}
+        done = 0
+        for chunk in chunked(expand_sweep(spec), chunk_size):
+            for trial, (solution, stats, _) in zip(chunk, self.run_trials(chunk, experiment=experiment)):
+                acc = totals.setdefault((trial.algorithm, trial.n, trial.variant), {
+                    'ejecuciones': 0, 'exitos': 0, 'tiempo_total': 0.0,
+                    'tiempo_min': None, 'tiempo_max': None, 'trabajo_total': 0,
+                    'timeout': 0, 'oom': 0, 'error': 0
+                })
+                if stats.get('estado') in FAILED_STATES:
+                    acc[stats['estado']] += 1
+                elapsed = stats['execution_time']
+                acc['ejecuciones'] += 1
+                acc['exitos'] += bool(stats['solution_found'])
+                acc['tiempo_total'] += elapsed
+                acc['tiempo_min'] = elapsed if acc['tiempo_min'] is None else min(acc['tiempo_min'], elapsed)
+                acc['tiempo_max'] = elapsed if acc['tiempo_max'] is None else max(acc['tiempo_max'], elapsed)
+                acc['trabajo_total'] += stats.get('iterations', stats.get('nodes_explored', 0))
+            done += len(chunk)
+            print(f"  {done}/{total} ensayos")
+        
+        results = []
+        for (algorithm, n, variant), acc in totals.items():
+            runs = acc['ejecuciones']
+            results.append({
+                'algoritmo': algorithm,
+                'n': n,
+                'variante': variant,
+                'ejecuciones': runs,
+                'tasa_exito': acc['exitos'] / runs,
+                'tiempo_promedio': acc['tiempo_total'] / runs,
+                'tiempo_min': acc['tiempo_min'],
+                'tiempo_max': acc['tiempo_max'],
+                'iteraciones_nodos_promedio': acc['trabajo_total'] / runs,
+                'timeouts': acc['timeout'],
+                'sin_memoria': acc['oom'],
+                'errores': acc['error']
+            })
+            failures = acc['timeout'] + acc['oom'] + acc['error']
+            print(f"  {algorithm:<14} {variant:<15} n={n:<5} éxito={acc['exitos']}/{runs}, "
+                  f"tiempo={acc['tiempo_total'] / runs:.6f}s"
+                  + (f", timeout={acc['timeout']}, oom={acc['oom']}" if failures else ""))
+        
+        self.results[experiment] = results
+        self.store_summary(experiment)
+        
+        return results
+    
     def _print_experimento1_table(self, hc_results, bt_results):
         """Imprime tabla del Experimento 1."""
         print("\n" + "-"*80)
         print("TABLA EXPERIMENTO 1: ESCALABILIDAD")
         print("-"*80)
-        print(f"{'n':<5} {'Algoritmo':<20} {'Tiempo (s)':<15} {'Iter/Nodos':<15} {'Memoria (MB)':<15}")
+        print(f"{'n':<5} {'Algoritmo':<20} {'Tiempo (s)':<15} {'Iter/Nodos':<15} {'Pico (MB)':<15}")
         print("-"*80)
         
+        def memory_cell(value):
+            # Sin medida de memoria (el ensayo superó un límite)
+            return f"{value:<15.4f}" if value is not None else f"{'N/A':<15}"
+        
         for hc, bt in zip(hc_results, bt_results):
             print(f"{hc['n']:<5} {'Hill Climbing':<20} {hc['tiempo_promedio']:<15.6f} "
                   f"{hc['iteraciones_promedio']:<15.0f} "
-                  f"{hc['memoria_promedio'] if hc['memoria_promedio'] else 'N/A':<15}")
+                  f"{memory_cell(hc['memoria_promedio'])}")
             print(f"{bt['n']:<5} {'Backtracking':<20} {bt['tiempo']:<15.6f} "
                   f"{bt['nodos_explorados']:<15} "
-                  f"{bt['memoria'] if bt['memoria'] else 'N/A':<15}")
+                  f"{memory_cell(bt['memoria'])}")
             print("-"*80)
+        
+        # Líneas que más memoria reservan en el tamaño más grande
+        for name, result in (('Hill Climbing', hc_results[-1]), ('Backtracking', bt_results[-1])):
+            print(f"\nLíneas calientes de {name} (n = {result['n']}):")
+            if result['lineas_calientes'] is None:
+                print("  N/A")
+                continue
+            for line in result['lineas_calientes']:
+                print(f"  {line['archivo']}:{line['linea']:<6} {line['kb']:>10.1f} KB "
+                      f"{line['bloques']:>8} bloques")
     
     def _print_experimento2_table(self, hc_results, bt_results, hc_stats, bt_stats):
         """Imprime tabla comparativa del Experimento 2."""
         print("\n" + "-"*100)
-        print("TABLA EXPERIMENTO 2: CONSISTENCIA (n=8, 10 ejecuciones)")
+        print(f"TABLA EXPERIMENTO 2: CONSISTENCIA ({len(hc_results)} ejecuciones HC, "
+              f"{len(bt_results)} BT)")
         print("-"*100)
         print(f"{'Ejec.':<7} {'Hill Climbing':<50} {'Backtracking':<50}")
         print(f"{'':<7} {'Tiempo (s)':<15} {'Iter.':<10} {'Solución':<20} "
               f"{'Tiempo (s)':<15} {'Nodos':<15} {'Solución':<20}")
         print("-"*100)
         
-        for i in range(len(hc_results)):
-            hc = hc_results[i]
-            bt = bt_results[i]
-            hc_sol = "Sí" if hc['solucion_encontrada'] else "No"
-            bt_sol = "Sí" if bt['solucion_encontrada'] else "No"
-            
-            print(f"{hc['ejecucion']:<7} {hc['tiempo']:<15.6f} {hc['iteraciones']:<10} "
-                  f"{hc_sol:<20} {bt['tiempo']:<15.6f} {bt['nodos_explorados']:<15} {bt_sol:<20}")
+        # Con muchas ejecuciones (muestreo secuencial) solo se muestran las primeras
+        for i in range(min(max(len(hc_results), len(bt_results)), 20)):
+            row = f"{i + 1:<7} "
+            if i < len(hc_results):
+                hc = hc_results[i]
+                row += (f"{hc['tiempo']:<15.6f} {hc['iteraciones']:<10} "
+                        f"{'Sí' if hc['solucion_encontrada'] else 'No':<20} ")
+            else:
+                row += f"{'':<47} "
+            if i < len(bt_results):
+                bt = bt_results[i]
+                row += (f"{bt['tiempo']:<15.6f} {bt['nodos_explorados']:<15} "
+                        f"{'Sí' if bt['solucion_encontrada'] else 'No':<20}")
+            print(row)
         
         print("-"*100)
         print(f"{'Promedio':<7} {hc_stats['tiempo_promedio']:<15.6f} "
@@ -360,6 +1463,12 @@ class ExperimentRunner:
               f"{bt_stats['tiempo_desv_est']:<15.6f} "
               f"{bt_stats['nodos_desv_est']:<15.0f} {'':<20}")
         print("-"*100)
+        for name, st in (('Hill Climbing', hc_stats), ('Backtracking', bt_stats)):
+            low, high = st['tiempo_ic95']
+            s_low, s_high = st['tasa_exito_ic95']
+            print(f"{name:<14} IC95 tiempo=[{low:.6f}, {high:.6f}]s  "
+                  f"IC95 éxito=[{s_low:.2f}, {s_high:.2f}]  "
+                  f"ejecuciones={st['ejecuciones']} (parada: {st['parada']})")
     
     def _print_experimento3_tables(self, hc_results, bt_results):
         """Imprime tablas del Experimento 3."""
@@ -397,6 +1506,38 @@ class ExperimentRunner:
                   f"{'Sí' if result['optimizada']['solution_found'] else 'No':<10}")
             print("-"*80)
     
+    def _print_escalabilidad_adaptativa_table(self, results, predict_budgets):
+        """Imprime los ajustes y el n máximo predicho de cada solver."""
+        from scaling import describe
+
+        print("\n" + "-"*80)
+        print("AJUSTES DE CRECIMIENTO (mínimos cuadrados sobre log y)")
+        print("-"*80)
+        for r in results:
+            name = f"{r['algoritmo']} ({r['variante']})"
+            predicted = ", ".join(f"{b}s→{r['n_max_predicho'][str(b)]}" for b in predict_budgets)
+            print(f"{name}")
+            print(f"  tiempo: {describe(r['ajuste_tiempo'])}")
+            print(f"  nodos:  {describe(r['ajuste_nodos'])}")
+            print(f"  n máximo medido: {r['n_max_medido']}, predicho: {predicted}")
+    
+    def _print_estrategias_table(self, results):
+        """Imprime tabla del benchmark de estrategias."""
+        print("\n" + "-"*80)
+        print("TABLA: ESTRATEGIAS DE BÚSQUEDA LOCAL (éxito vs. tiempo de CPU)")
+        print("-"*80)
+        print(f"{'n':<5} {'Estrategia':<15} {'Éxito':<10} {'CPU prom. (s)':<15} "
+              f"{'CPU/éxito (s)':<15} {'Iteraciones':<15}")
+        print("-"*80)
+        
+        for r in results:
+            por_exito = (f"{r['tiempo_cpu_por_exito']:.6f}"
+                         if r['tiempo_cpu_por_exito'] is not None else 'N/A')
+            print(f"{r['n']:<5} {r['estrategia']:<15} {r['tasa_exito']:<10.2f} "
+                  f"{r['tiempo_cpu_promedio']:<15.6f} {por_exito:<15} "
+                  f"{r['iteraciones_promedio']:<15.0f}")
+        print("-"*80)
+    
     def save_results_to_json(self, filename: str = "resultados_experimentos.json"):
         """Guarda los resultados en un archivo JSON."""
         with open(filename, 'w', encoding='utf-8') as f:
@@ -413,11 +1554,13 @@ class ExperimentRunner:
                                'memoria_mb', 'solucion_encontrada'])
                 for hc in self.results['experimento1']['hill_climbing']:
                     writer.writerow([hc['n'], 'Hill Climbing', hc['tiempo_promedio'], 
-                                   hc['iteraciones_promedio'], hc['memoria_promedio'] or 0,
+                                   hc['iteraciones_promedio'],
+                                   'N/A' if hc['memoria_promedio'] is None else hc['memoria_promedio'],
                                    hc['soluciones_encontradas'] > 0])
                 for bt in self.results['experimento1']['backtracking']:
                     writer.writerow([bt['n'], 'Backtracking', bt['tiempo'], 
-                                   bt['nodos_explorados'], bt['memoria'] or 0,
+                                   bt['nodos_explorados'],
+                                   'N/A' if bt['memoria'] is None else bt['memoria'],
                                    bt['solucion_encontrada']])
         
         # Experimento 2
@@ -432,6 +1575,19 @@ class ExperimentRunner:
                 for bt in self.results['experimento2']['backtracking']:
                     writer.writerow([bt['ejecucion'], 'Backtracking', bt['tiempo'], 
                                    bt['nodos_explorados'], bt['solucion'], bt['solucion_encontrada']])
+            
+            # Resumen con los intervalos de confianza del 95%
+            with open('experimento2_resumen.csv', 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['algoritmo', 'ejecuciones', 'tiempo_promedio', 'tiempo_ic95_inf',
+                                 'tiempo_ic95_sup', 'tasa_exito', 'tasa_exito_ic95_inf',
+                                 'tasa_exito_ic95_sup', 'parada'])
+                for name, key in (('Hill Climbing', 'estadisticas_hc'),
+                                  ('Backtracking', 'estadisticas_bt')):
+                    st = self.results['experimento2'][key]
+                    writer.writerow([name, st['ejecuciones'], st['tiempo_promedio'],
+                                     *st['tiempo_ic95'], st['tasa_exito'],
+                                     *st['tasa_exito_ic95'], st['parada']])
         
         print("\nResultados guardados en archivos CSV.")
 
@@ -442,17 +1598,35 @@ def main():
     print("ANÁLISIS COMPARATIVO DE ALGORITMOS PARA EL PROBLEMA DE LAS N-REINAS")
     print("="*80)
     
-    runner = ExperimentRunner()
+    # --profile [--profile-mode sample]: perfila los ensayos (ver profiling.py)
+    args = sys.argv[1:]
+    profile = None
+    if '--profile' in args:
+        profile = 'cprofile'
+        if '--profile-mode' in args and args.index('--profile-mode') + 1 < len(args):
+            profile = args[args.index('--profile-mode') + 1]
     
-    # Ejecutar experimentos
+    # --stream ARCHIVO: cada ensayo se escribe al terminar (ver streaming.py)
+    stream = None
+    if '--stream' in args and args.index('--stream') + 1 < len(args):
+        stream = TrialStreamWriter(args[args.index('--stream') + 1])
+    
+    # --force: ejecutar todos los ensayos aunque ya estén en el almacén
+    force = '--force' in args
+    
+    from results_store import ResultsStore
+    runner = ExperimentRunner(store=ResultsStore(), force=force, profile=profile, stream=stream)
+    
+    # Ejecutar experimentos (cada ensayo y cada resumen se anexan al almacén)
     try:
         runner.experimento1_escalabilidad()
         runner.experimento2_consistencia()
         runner.experimento3_optimizacion()
         
-        # Guardar resultados
-        runner.save_results_to_json()
+        # Exportar tablas CSV
         runner.save_results_to_csv()
+        runner.cache_report()
+        runner.profile_report()
         
         print("\n" + "="*80)
         print("TODOS LOS EXPERIMENTOS COMPLETADOS EXITOSAMENTE")
@@ -460,15 +1634,16 @@ def main():
         
     except KeyboardInterrupt:
         print("\n\nExperimentos interrumpidos por el usuario.")
-        runner.save_results_to_json()
-        runner.save_results_to_csv()
+        print(f"Los ensayos terminados quedaron en {runner.store.path}")
     except Exception as e:
         print(f"\n\nError durante la ejecución: {e}")
         import traceback
         traceback.print_exc()
-        runner.save_results_to_json()
-        runner.save_results_to_csv()
-
+        print(f"Los ensayos terminados quedaron en {runner.store.path}")
+    finally:
+        runner.store.close()
+        if stream is not None:
+            stream.close()
 
 if __name__ == "__main__":
     main()
@@ -1,23 +1,49 @@
 """
 Script para generar gráficos a partir de los resultados de los experimentos.
-Este script lee los resultados de resultados_experimentos.json y genera gráficos
-comparativos para incluir en el reporte técnico.
+Este script consulta el almacén de resultados (resultados.db, con
+resultados_experimentos.json como respaldo) y genera gráficos comparativos para
+incluir en el reporte técnico.
+
+La regeneración es incremental: cada grupo de gráficos (GRAFICOS) depende del
+resumen de un experimento. Se calcula un hash del texto JSON de ese resumen,
+leído tal cual del almacén sin decodificarlo, junto con el código de la función
+que dibuja el gráfico. Solo se vuelven a dibujar los grupos cuyo hash cambió
+respecto al manifiesto (MANIFIESTO) o a los que les falta algún archivo. Los
+grupos pendientes se dibujan en paralelo en procesos separados.
+
+Uso:
+    python generar_graficos.py [--force] [--workers N]
 """
 
+import hashlib
+import inspect
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')  # Solo se guardan archivos: no hace falta pantalla
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
-def cargar_resultados(archivo='resultados_experimentos.json'):
-    """Carga los resultados desde un archivo JSON."""
-    try:
-        with open(archivo, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"Error: No se encontró el archivo {archivo}")
-        print("Ejecuta primero los experimentos con: python experiments.py")
-        return None
+from results_store import DEFAULT_PATH, load_summary_texts
+
+# Grupo de gráficos -> (experimento del que depende, archivos que genera)
+GRAFICOS = {
+    'grafico_escalabilidad': ('experimento1', ['grafico_escalabilidad_tiempo.png',
+                                               'grafico_escalabilidad_estados.png']),
+    'grafico_consistencia': ('experimento2', ['grafico_consistencia_tiempo.png',
+                                              'grafico_consistencia_comparacion.png']),
+    'grafico_optimizacion': ('experimento3', ['grafico_optimizacion_hc.png',
+                                              'grafico_optimizacion_bt_tiempo.png',
+                                              'grafico_optimizacion_bt_nodos.png']),
+}
+
+# Hashes de los gráficos ya generados
+MANIFIESTO = '.graficos_hashes.json'
 
 def grafico_escalabilidad(resultados):
     """Genera gráfico de escalabilidad (Experimento 1)."""
@@ -78,14 +104,16 @@ def grafico_consistencia(resultados):
     bt_data = exp2['backtracking']
     
     # Extraer datos
-    ejecuciones = [d['ejecucion'] for d in hc_data]
+    # Con muestreo secuencial cada algoritmo puede tener un número distinto de ejecuciones
+    ejecuciones_hc = [d['ejecucion'] for d in hc_data]
+    ejecuciones_bt = [d['ejecucion'] for d in bt_data]
     hc_times = [d['tiempo'] for d in hc_data]
     bt_times = [d['tiempo'] for d in bt_data]
     
     # Crear gráfico
     plt.figure(figsize=(12, 6))
-    plt.plot(ejecuciones, hc_times, 'o-', label='Hill Climbing', linewidth=2, markersize=6, alpha=0.7)
-    plt.plot(ejecuciones, bt_times, 's-', label='Backtracking', linewidth=2, markersize=6, alpha=0.7)
+    plt.plot(ejecuciones_hc, hc_times, 'o-', label='Hill Climbing', linewidth=2, markersize=6, alpha=0.7)
+    plt.plot(ejecuciones_bt, bt_times, 's-', label='Backtracking', linewidth=2, markersize=6, alpha=0.7)
     plt.axhline(y=exp2['estadisticas_hc']['tiempo_promedio'], 
                 color='blue', linestyle='--', alpha=0.5, label='Promedio HC')
     plt.axhline(y=exp2['estadisticas_bt']['tiempo_promedio'], 
@@ -187,25 +215,113 @@ def grafico_optimizacion(resultados):
     print("Gráfico guardado: grafico_optimizacion_bt_nodos.png")
     plt.close()
 
+def leer_resumenes_crudos(almacen: str = DEFAULT_PATH,
+                          archivo: str = 'resultados_experimentos.json') -> Dict[str, str]:
+    """
+    Texto JSON del resumen más reciente de cada experimento con gráficos.
+
+    Returns:
+        Diccionario experimento -> texto JSON
+    """
+    experimentos = sorted({experimento for experimento, _ in GRAFICOS.values()})
+    return load_summary_texts(experimentos, almacen, archivo)
+
+def hash_grafico(nombre: str, texto: str) -> str:
+    """Hash del código de la función del gráfico y del resumen del que depende."""
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(globals()[nombre]).encode('utf-8'))
+    digest.update(texto.encode('utf-8'))
+    return digest.hexdigest()
+
+def _dibujar(nombre: str, experimento: str, texto: str) -> str:
+    """Dibuja un grupo de gráficos (se ejecuta en un proceso del pool)."""
+    globals()[nombre]({experimento: json.loads(texto)})
+    return nombre
+
+def _leer_manifiesto(manifiesto: str) -> dict:
+    if not os.path.exists(manifiesto):
+        return {}
+    try:
+        with open(manifiesto, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _guardar_manifiesto(datos: dict, manifiesto: str) -> None:
+    """Escribe el manifiesto de forma atómica (archivo temporal + os.replace)."""
+    temporal = manifiesto + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+    os.replace(temporal, manifiesto)
+
+def regenerar_graficos(almacen: str = DEFAULT_PATH, archivo: str = 'resultados_experimentos.json',
+                       forzar: bool = False, workers: Optional[int] = None,
+                       manifiesto: str = MANIFIESTO) -> List[str]:
+    """
+    Dibuja solo los grupos de gráficos cuyos datos o código cambiaron.
+
+    Args:
+        almacen: Archivo SQLite del almacén de resultados
+        archivo: JSON combinado usado como respaldo
+        forzar: Si es True, dibuja todos los grupos con datos
+        workers: Procesos para dibujar en paralelo (None = uno por CPU)
+        manifiesto: Archivo con los hashes de los gráficos ya generados
+
+    Returns:
+        Nombres de los grupos dibujados
+    """
+    crudos = leer_resumenes_crudos(almacen, archivo)
+    previo = _leer_manifiesto(manifiesto)
+    actual = dict(previo)
+    pendientes = []
+    for nombre, (experimento, archivos) in GRAFICOS.items():
+        if experimento not in crudos:
+            print(f"No hay datos para {nombre} ({experimento})")
+            continue
+        h = hash_grafico(nombre, crudos[experimento])
+        vigente = (previo.get(nombre, {}).get('hash') == h
+                   and all(os.path.exists(a) for a in archivos))
+        if vigente and not forzar:
+            print(f"Sin cambios: {nombre}")
+            continue
+        pendientes.append((nombre, experimento, h))
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(pendientes)))
+    if workers == 1:
+        hechos = [_dibujar(nombre, experimento, crudos[experimento])
+                  for nombre, experimento, _ in pendientes]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hechos = list(pool.map(_dibujar, [p[0] for p in pendientes],
+                                   [p[1] for p in pendientes],
+                                   [crudos[p[1]] for p in pendientes]))
+    
+    for nombre, experimento, h in pendientes:
+        actual[nombre] = {'hash': h, 'experimento': experimento, 'archivos': GRAFICOS[nombre][1]}
+    if pendientes:
+        _guardar_manifiesto(actual, manifiesto)
+    return hechos
+
 def main():
     """Función principal."""
     print("="*60)
     print("GENERADOR DE GRÁFICOS PARA EXPERIMENTOS N-REINAS")
     print("="*60)
     
-    resultados = cargar_resultados()
-    if not resultados:
-        return
+    args = sys.argv[1:]
+    forzar = '--force' in args
+    workers = None
+    if '--workers' in args and args.index('--workers') + 1 < len(args):
+        workers = int(args[args.index('--workers') + 1])
     
     print("\nGenerando gráficos...")
-    grafico_escalabilidad(resultados)
-    grafico_consistencia(resultados)
-    grafico_optimizacion(resultados)
+    hechos = regenerar_graficos(forzar=forzar, workers=workers)
     
     print("\n" + "="*60)
-    print("TODOS LOS GRÁFICOS GENERADOS EXITOSAMENTE")
+    print(f"GRÁFICOS ACTUALIZADOS: {len(hechos)} de {len(GRAFICOS)} grupos")
     print("="*60)
 
 if __name__ == "__main__":
     main()
-
@@ -16,18 +16,472 @@ MODIFICACIONES REALIZADAS:
 - Agregado soporte para diferentes tamaños de tablero (n variable)
 - Implementada función de visualización opcional
 - Agregado random restart como mejora (Experimento 3)
+- Agregado evaluador incremental de conflictos (contadores por fila y diagonal)
+- El estado interno usa el tablero compacto Board (array('i') con __slots__)
+- Agregada representación por permutaciones con vecindario de intercambios
+- Agregada inicialización voraz con pocos conflictos (sondeos aleatorios)
+- Agregado callback de progreso y buffer circular con la trayectoria de conflictos
+- Agregadas políticas de reinicio por estancamiento (Luby, geométrica, meseta)
+  y presupuesto de tiempo repartido entre reinicios
+- Agregadas estrategias de búsqueda local intercambiables: movimientos laterales,
+  recocido simulado (simulated annealing) y búsqueda tabú
 """
 
+import math
 import random
 import time
 import copy
-from typing import List, Tuple, Optional
+from array import array
+from typing import Callable, Dict, List, Tuple, Optional, Union
+
+from board import Board, PermutationBoard
+
+
+# El evaluador incremental de conflictos es el propio tablero compacto:
+# Board mantiene los contadores por fila y diagonal y calcula deltas en O(1).
+ConflictEvaluator = Board
+
+
+class LocalSearchStrategy:
+    """
+    Interfaz para las estrategias de búsqueda local.
+
+    Una estrategia decide, en cada iteración, qué movimiento aplicar sobre el
+    evaluador, o devuelve None para detener la búsqueda. Los movimientos son
+    opacos para la estrategia: (columna, fila) en Board e intercambios (i, j)
+    en PermutationBoard; se enumeran y evalúan a través del propio evaluador.
+    """
+
+    name = 'base'
+
+    def reset(self, n: int) -> None:
+        """Reinicia el estado interno de la estrategia para una nueva ejecución."""
+
+    def next_move(self, evaluator: ConflictEvaluator) -> Optional[Tuple[int, int]]:
+        """
+        Elige el siguiente movimiento.
+
+        Args:
+            evaluator: Evaluador incremental con el estado actual
+
+        Returns:
+            Movimiento (a, b) a aplicar, o None si la búsqueda debe detenerse
+        """
+        raise NotImplementedError
+
+    def _best_moves(self, evaluator: ConflictEvaluator,
+                    allowed: Optional[Callable[[int, int, int], bool]] = None
+                    ) -> Tuple[Optional[int], List[Tuple[int, int]]]:
+        """
+        Recorre todos los vecinos y devuelve el menor delta y sus movimientos.
+
+        Args:
+            evaluator: Evaluador incremental con el estado actual
+            allowed: Filtro opcional (a, b, delta) -> bool
+
+        Returns:
+            Tupla (mejor_delta, movimientos_con_ese_delta)
+        """
+        best_delta = None
+        best_moves = []
+        move_delta = evaluator.move_delta
+        for a, b in evaluator.moves():
+            d = move_delta(a, b)
+            if best_delta is not None and d > best_delta:
+                continue
+            if allowed is not None and not allowed(a, b, d):
+                continue
+            if best_delta is None or d < best_delta:
+                best_delta = d
+                best_moves = [(a, b)]
+            else:
+                best_moves.append((a, b))
+        return best_delta, best_moves
+
+
+class SteepestAscentStrategy(LocalSearchStrategy):
+    """Hill Climbing clásico: solo acepta mejoras estrictas."""
+
+    name = 'steepest'
+
+    def next_move(self, evaluator: ConflictEvaluator) -> Optional[Tuple[int, int]]:
+        best_delta, best_moves = self._best_moves(evaluator)
+        if best_delta is None or best_delta >= 0:
+            # No hay mejoras, estamos en un óptimo local
+            return None
+        # Elegir aleatoriamente entre los mejores vecinos
+        return random.choice(best_moves)
+
+
+class SidewaysMovesStrategy(LocalSearchStrategy):
+    """
+    Hill Climbing con movimientos laterales.
+
+    Cuando no hay mejoras estrictas acepta vecinos con el mismo número de
+    conflictos, hasta max_sideways movimientos laterales consecutivos.
+    """
+
+    name = 'sideways'
+
+    def __init__(self, max_sideways: int = 100):
+        """
+        Args:
+            max_sideways: Máximo de movimientos laterales consecutivos
+        """
+        self.max_sideways = max_sideways
+        self.sideways = 0
+
+    def reset(self, n: int) -> None:
+        self.sideways = 0
+
+    def next_move(self, evaluator: ConflictEvaluator) -> Optional[Tuple[int, int]]:
+        best_delta, best_moves = self._best_moves(evaluator)
+        if best_delta is None or best_delta > 0:
+            return None
+        if best_delta == 0:
+            if self.sideways >= self.max_sideways:
+                return None
+            self.sideways += 1
+        else:
+            self.sideways = 0
+        return random.choice(best_moves)
+
+
+def geometric_cooling(t0: float, k: int, alpha: float = 0.999) -> float:
+    """Enfriamiento geométrico: T_k = t0 * alpha^k."""
+    return t0 * alpha ** k
+
+
+def linear_cooling(t0: float, k: int, alpha: float = 0.0002) -> float:
+    """Enfriamiento lineal: T_k = t0 - alpha * k (acotado en 0)."""
+    return max(0.0, t0 - alpha * k)
+
+
+def logarithmic_cooling(t0: float, k: int, alpha: float = 1.0) -> float:
+    """Enfriamiento logarítmico: T_k = t0 / (1 + alpha * ln(1 + k))."""
+    return t0 / (1 + alpha * math.log(1 + k))
+
+
+COOLING_SCHEDULES = {
+    'geometric': geometric_cooling,
+    'linear': linear_cooling,
+    'logarithmic': logarithmic_cooling,
+}
+
+
+class SimulatedAnnealingStrategy(LocalSearchStrategy):
+    """
+    Recocido simulado con vecino aleatorio.
+
+    Propone un movimiento aleatorio del vecindario; acepta siempre si no
+    empeora y, si empeora, con probabilidad exp(-delta / T).
+    """
+
+    name = 'annealing'
+
+    def __init__(self, initial_temperature: float = 2.0,
+                 cooling: Union[str, Callable[..., float]] = 'geometric',
+                 alpha: Optional[float] = None, min_temperature: float = 1e-3):
+        """
+        Args:
+            initial_temperature: Temperatura inicial T0
+            cooling: Nombre del esquema ('geometric', 'linear', 'logarithmic')
+                o función (t0, k, alpha) -> T_k
+            alpha: Parámetro del esquema de enfriamiento (None usa el valor por defecto)
+            min_temperature: Temperatura a la que se detiene la búsqueda
+        """
+        if isinstance(cooling, str):
+            if cooling not in COOLING_SCHEDULES:
+                raise ValueError(f"Esquema de enfriamiento desconocido: {cooling}")
+            cooling = COOLING_SCHEDULES[cooling]
+        self.initial_temperature = initial_temperature
+        self.cooling = cooling
+        self.alpha = alpha
+        self.min_temperature = min_temperature
+        self.step = 0
+
+    def reset(self, n: int) -> None:
+        self.step = 0
+
+    def temperature(self) -> float:
+        """Temperatura correspondiente al paso actual."""
+        if self.alpha is None:
+            return self.cooling(self.initial_temperature, self.step)
+        return self.cooling(self.initial_temperature, self.step, self.alpha)
+
+    def next_move(self, evaluator: ConflictEvaluator) -> Optional[Tuple[int, int]]:
+        n = evaluator.n
+        if n < 2:
+            return None
+        while True:
+            t = self.temperature()
+            if t < self.min_temperature:
+                return None
+            self.step += 1
+            move = evaluator.random_move()
+            d = evaluator.move_delta(*move)
+            if d <= 0 or random.random() < math.exp(-d / t):
+                return move
+
+
+class TabuSearchStrategy(LocalSearchStrategy):
+    """
+    Búsqueda tabú con lista de recencia sobre posiciones (columna, fila).
+
+    En cada iteración toma el mejor vecino no tabú aunque empeore. Las
+    posiciones que abandonan las reinas movidas quedan prohibidas durante
+    tenure iteraciones, salvo que volver a ellas mejore el mejor número de
+    conflictos visto (aspiración).
+    """
+
+    name = 'tabu'
+
+    def __init__(self, tenure: int = 10):
+        """
+        Args:
+            tenure: Iteraciones que una posición permanece en la lista tabú
+        """
+        self.tenure = tenure
+        self.tabu: Dict[Tuple[int, int], int] = {}
+        self.step = 0
+        self.best_conflicts = float('inf')
+
+    def reset(self, n: int) -> None:
+        self.tabu = {}
+        self.step = 0
+        self.best_conflicts = float('inf')
+
+    def next_move(self, evaluator: ConflictEvaluator) -> Optional[Tuple[int, int]]:
+        self.step += 1
+        self.best_conflicts = min(self.best_conflicts, evaluator.conflicts)
+        current = evaluator.conflicts
+        step = self.step
+        tabu = self.tabu
+
+        def allowed(a: int, b: int, d: int) -> bool:
+            if all(tabu.get(pos, 0) < step for pos in evaluator.entered(a, b)):
+                return True
+            return current + d < self.best_conflicts
+
+        best_delta, best_moves = self._best_moves(evaluator, allowed)
+        if best_delta is None:
+            return None
+        move = random.choice(best_moves)
+        for pos in evaluator.vacated(*move):
+            tabu[pos] = step + self.tenure
+        if len(tabu) > 8 * self.tenure:
+            self.tabu = {pos: until for pos, until in tabu.items() if until >= step}
+        return move
+
+
+STRATEGIES = {
+    SteepestAscentStrategy.name: SteepestAscentStrategy,
+    SidewaysMovesStrategy.name: SidewaysMovesStrategy,
+    SimulatedAnnealingStrategy.name: SimulatedAnnealingStrategy,
+    TabuSearchStrategy.name: TabuSearchStrategy,
+}
+
+
+def make_strategy(name: str, **kwargs) -> LocalSearchStrategy:
+    """
+    Crea una estrategia de búsqueda local a partir de su nombre.
+
+    Args:
+        name: 'steepest', 'sideways', 'annealing' o 'tabu'
+        **kwargs: Parámetros del constructor de la estrategia
+
+    Returns:
+        Instancia de la estrategia
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Estrategia desconocida: {name}")
+    return STRATEGIES[name](**kwargs)
+
+
+def luby(i: int) -> int:
+    """
+    Término i-ésimo (i >= 1) de la secuencia de Luby: 1, 1, 2, 1, 1, 2, 4, 1, ...
+
+    Args:
+        i: Posición en la secuencia (desde 1)
+
+    Returns:
+        Valor de la secuencia
+    """
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+class RestartPolicy:
+    """
+    Política de reinicio para Random Restart Hill Climbing.
+
+    Decide cuántas iteraciones sin mejora (estancamiento) se toleran en cada
+    ejecución antes de abandonarla y reiniciar. La política base no impone
+    límite: solo se reinicia cuando la estrategia se detiene por sí misma.
+    """
+
+    name = 'none'
+
+    def reset(self, n: int) -> None:
+        """Reinicia el estado interno de la política para una nueva resolución."""
+        self.n = n
+
+    def stagnation_limit(self, restart: int) -> Optional[int]:
+        """
+        Límite de estancamiento para la ejecución número `restart` (desde 1).
+
+        Args:
+            restart: Número de la ejecución
+
+        Returns:
+            Iteraciones sin mejora toleradas, o None si no hay límite
+        """
+        return None
+
+
+class LubyRestartPolicy(RestartPolicy):
+    """Límite de estancamiento unit * luby(k): óptima ante distribuciones desconocidas."""
+
+    name = 'luby'
+
+    def __init__(self, unit: Optional[int] = None):
+        """
+        Args:
+            unit: Iteraciones de la unidad de Luby (None = n)
+        """
+        self.unit = unit
+
+    def stagnation_limit(self, restart: int) -> Optional[int]:
+        unit = self.unit if self.unit is not None else self.n
+        return unit * luby(restart)
+
+
+class GeometricRestartPolicy(RestartPolicy):
+    """Límite de estancamiento base * factor^(k - 1), creciente entre reinicios."""
+
+    name = 'geometric'
+
+    def __init__(self, base: Optional[int] = None, factor: float = 1.5):
+        """
+        Args:
+            base: Límite de la primera ejecución (None = n)
+            factor: Factor de crecimiento entre ejecuciones
+        """
+        self.base = base
+        self.factor = factor
+
+    def stagnation_limit(self, restart: int) -> Optional[int]:
+        base = self.base if self.base is not None else self.n
+        return int(base * self.factor ** (restart - 1))
+
+
+class PlateauRestartPolicy(RestartPolicy):
+    """Detección de meseta: abandona tras max_plateau iteraciones sin mejora."""
+
+    name = 'plateau'
+
+    def __init__(self, max_plateau: Optional[int] = None):
+        """
+        Args:
+            max_plateau: Longitud máxima de meseta tolerada (None = 2n)
+        """
+        self.max_plateau = max_plateau
+
+    def stagnation_limit(self, restart: int) -> Optional[int]:
+        return self.max_plateau if self.max_plateau is not None else 2 * self.n
+
+
+RESTART_POLICIES = {
+    RestartPolicy.name: RestartPolicy,
+    LubyRestartPolicy.name: LubyRestartPolicy,
+    GeometricRestartPolicy.name: GeometricRestartPolicy,
+    PlateauRestartPolicy.name: PlateauRestartPolicy,
+}
+
+
+def make_restart_policy(name: str, **kwargs) -> RestartPolicy:
+    """
+    Crea una política de reinicio a partir de su nombre.
+
+    Args:
+        name: 'none', 'luby', 'geometric' o 'plateau'
+        **kwargs: Parámetros del constructor de la política
+
+    Returns:
+        Instancia de la política
+    """
+    if name not in RESTART_POLICIES:
+        raise ValueError(f"Política de reinicio desconocida: {name}")
+    return RESTART_POLICIES[name](**kwargs)
+
+
+class ConflictTrajectory:
+    """
+    Buffer circular de tamaño fijo con la trayectoria de conflictos.
+
+    Guarda los últimos `size` valores en un array('i') preasignado, de modo que
+    registrar una iteración es O(1) y la memoria no crece con la búsqueda.
+    """
+
+    __slots__ = ('size', 'values', 'count')
+
+    def __init__(self, size: int):
+        """
+        Args:
+            size: Número de valores que se conservan
+        """
+        if size <= 0:
+            raise ValueError("El tamaño del buffer debe ser positivo")
+        self.size = size
+        self.values = array('i', [0]) * size
+        self.count = 0
+
+    def append(self, conflicts: int) -> None:
+        """Registra un valor, sobrescribiendo el más antiguo si está lleno."""
+        self.values[self.count % self.size] = conflicts
+        self.count += 1
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    def to_list(self) -> List[int]:
+        """
+        Valores registrados del más antiguo al más reciente.
+
+        Returns:
+            Lista con los últimos min(count, size) valores
+        """
+        if self.count <= self.size:
+            return self.values[:self.count].tolist()
+        start = self.count % self.size
+        return (self.values[start:] + self.values[:start]).tolist()
 
 
 class HillClimbingNQueens:
     """Implementación del algoritmo Hill Climbing para N-Reinas."""
     
-    def __init__(self, n: int, use_random_restart: bool = False, max_restarts: int = 100):
+    __slots__ = ('n', 'use_random_restart', 'max_restarts', 'strategy', 'use_permutation',
+                 'use_greedy_init', 'greedy_probes', 'progress_callback', 'progress_every',
+                 'progress_interval_ms', 'trajectory_size', 'trajectory', 'best_conflicts',
+                 'max_iterations', 'restart_policy', 'time_budget', 'stagnation_limit',
+                 'deadline', 'iterations', 'restarts', 'initial_conflicts', 'start_time',
+                 'end_time')
+    
+    def __init__(self, n: int, use_random_restart: bool = False, max_restarts: int = 100,
+                 strategy: Optional[LocalSearchStrategy] = None,
+                 use_permutation: bool = False, use_greedy_init: bool = False,
+                 greedy_probes: int = 8,
+                 progress_callback: Optional[Callable[[dict], None]] = None,
+                 progress_every: int = 1000,
+                 progress_interval_ms: Optional[float] = None,
+                 trajectory_size: int = 0,
+                 max_iterations: int = 10000,
+                 restart_policy: Optional[RestartPolicy] = None,
+                 time_budget: Optional[float] = None):
         """
         Inicializa el algoritmo Hill Climbing.
         
@@ -35,12 +489,47 @@ class HillClimbingNQueens:
             n: Tamaño del tablero (número de reinas)
             use_random_restart: Si es True, usa random restart
             max_restarts: Número máximo de reinicios aleatorios
+            strategy: Estrategia de búsqueda local (por defecto, ascenso estricto)
+            use_permutation: Si es True, el estado es siempre una permutación
+                (una reina por fila) y los vecinos se obtienen intercambiando
+                dos columnas; el espacio de búsqueda pasa de n^n a n!
+            use_greedy_init: Si es True, los estados iniciales (incluidos los
+                de cada reinicio) se generan con generate_greedy_state
+            greedy_probes: Sondeos aleatorios por columna en la inicialización voraz
+            progress_callback: Función opcional que recibe un diccionario con
+                'iteration', 'restart', 'conflicts', 'best_conflicts' y 'elapsed'
+            progress_every: Invoca el callback cada K iteraciones (0 = desactivado)
+            progress_interval_ms: Invoca el callback cada T milisegundos (opcional)
+            trajectory_size: Tamaño del buffer circular con la trayectoria de
+                conflictos que se devuelve en las estadísticas (0 = desactivado)
+            max_iterations: Límite de iteraciones por ejecución de hill_climbing
+            restart_policy: Política que decide cuándo abandonar una ejecución
+                estancada en modo random restart (por defecto, sin límite)
+            time_budget: Presupuesto de tiempo total en segundos para el modo
+                random restart; el tiempo restante se reparte entre los
+                reinicios pendientes
         """
         self.n = n
         self.use_random_restart = use_random_restart
         self.max_restarts = max_restarts
+        self.strategy = strategy if strategy is not None else SteepestAscentStrategy()
+        self.use_permutation = use_permutation
+        self.use_greedy_init = use_greedy_init
+        self.greedy_probes = greedy_probes
+        self.progress_callback = progress_callback
+        self.progress_every = progress_every
+        self.progress_interval_ms = progress_interval_ms
+        self.trajectory_size = trajectory_size
+        self.trajectory = None
+        self.best_conflicts = float('inf')
+        self.max_iterations = max_iterations
+        self.restart_policy = restart_policy if restart_policy is not None else RestartPolicy()
+        self.time_budget = time_budget
+        self.stagnation_limit = None
+        self.deadline = None
         self.iterations = 0
         self.restarts = 0
+        self.initial_conflicts = None
         self.start_time = 0
         self.end_time = 0
     
@@ -54,6 +543,61 @@ class HillClimbingNQueens:
         """
         return [random.randint(0, self.n - 1) for _ in range(self.n)]
     
+    def generate_random_permutation(self) -> List[int]:
+        """
+        Genera un estado inicial aleatorio sin conflictos de fila.
+        
+        Returns:
+            Permutación aleatoria de range(n)
+        """
+        state = list(range(self.n))
+        random.shuffle(state)
+        return state
+    
+    def generate_greedy_state(self, probes: Optional[int] = None) -> List[int]:
+        """
+        Genera un estado inicial voraz con pocos conflictos en O(n) esperado.
+        
+        Recorre las columnas y, para cada una, prueba hasta `probes` filas
+        aleatorias entre las aún no usadas, quedándose con la primera cuyas dos
+        diagonales estén libres. Si ningún sondeo tiene éxito se conserva el
+        último (que dejará algún conflicto). El resultado es una permutación,
+        válida también para la representación por columnas.
+        
+        Args:
+            probes: Sondeos por columna (None usa greedy_probes)
+            
+        Returns:
+            Lista donde board[i] = fila de la reina en la columna i
+        """
+        n = self.n
+        if probes is None:
+            probes = self.greedy_probes
+        state = list(range(n))
+        diag1 = [False] * (2 * n - 1)
+        diag2 = [False] * (2 * n - 1)
+        for col in range(n):
+            for _ in range(probes):
+                j = random.randrange(col, n)
+                row = state[j]
+                if not diag1[row - col + n - 1] and not diag2[row + col]:
+                    break
+            state[col], state[j] = state[j], state[col]
+            row = state[col]
+            diag1[row - col + n - 1] = True
+            diag2[row + col] = True
+        return state
+    
+    @property
+    def representation(self) -> str:
+        """Nombre de la representación del estado ('columns' o 'permutation')."""
+        return 'permutation' if self.use_permutation else 'columns'
+    
+    @property
+    def initialization(self) -> str:
+        """Nombre de la inicialización ('random' o 'greedy')."""
+        return 'greedy' if self.use_greedy_init else 'random'
+    
     def calculate_conflicts(self, board: List[int]) -> int:
         """
         Calcula el número de conflictos (pares de reinas que se atacan).
@@ -104,7 +648,7 @@ class HillClimbingNQueens:
     
     def hill_climbing(self, initial_state: Optional[List[int]] = None) -> Tuple[List[int], bool]:
         """
-        Ejecuta el algoritmo Hill Climbing.
+        Ejecuta el algoritmo Hill Climbing con la estrategia configurada.
         
         Args:
             initial_state: Estado inicial (si es None, se genera aleatoriamente)
@@ -113,45 +657,93 @@ class HillClimbingNQueens:
             Tupla (mejor_estado_encontrado, encontro_solucion)
         """
         if initial_state is None:
-            current_state = self.generate_random_state()
+            if self.use_greedy_init:
+                current_state = self.generate_greedy_state()
+            elif self.use_permutation:
+                current_state = self.generate_random_permutation()
+            else:
+                current_state = self.generate_random_state()
         else:
-            current_state = initial_state.copy()
+            current_state = initial_state
         
-        current_conflicts = self.calculate_conflicts(current_state)
+        if self.use_permutation:
+            board = PermutationBoard(self.n, current_state)
+        else:
+            board = Board(self.n, current_state)
+        self.strategy.reset(self.n)
         self.iterations = 0
+        if self.initial_conflicts is None:
+            # Conflictos del primer estado inicial de solve()
+            self.initial_conflicts = board.conflicts
+        
+        trajectory = self.trajectory
+        if trajectory is not None:
+            trajectory.append(board.conflicts)
+        self.best_conflicts = min(self.best_conflicts, board.conflicts)
         
         # Si ya es solución
-        if current_conflicts == 0:
-            return current_state, True
+        if board.conflicts == 0:
+            return board.to_list(), True
+        
+        best_state = board.queens[:]
+        best_conflicts = board.conflicts
+        max_iterations = self.max_iterations  # Límite para evitar bucles infinitos
+        stagnation_limit = self.stagnation_limit
+        deadline = self.deadline
+        last_improvement = 0
         
-        max_iterations = 10000  # Límite para evitar bucles infinitos
+        callback = self.progress_callback
+        every = self.progress_every
+        interval = (self.progress_interval_ms / 1000.0
+                    if self.progress_interval_ms else None)
+        next_report = time.perf_counter() + interval if interval else None
         
         while self.iterations < max_iterations:
             self.iterations += 1
             
-            # Obtener vecinos
-            neighbors = self.get_neighbors(current_state)
-            
-            # Hill Climbing: solo acepta mejoras estrictas
-            # Filtrar solo vecinos mejores (menos conflictos)
-            better_neighbors = [n for n in neighbors if n[2] < current_conflicts]
-            if not better_neighbors:
-                # No hay mejoras, estamos en un óptimo local
+            move = self.strategy.next_move(board)
+            if move is None:
+                # La estrategia se detiene (p. ej. óptimo local)
                 break
-            # Elegir aleatoriamente entre los mejores vecinos
-            best_conflict = min(n[2] for n in better_neighbors)
-            best_neighbors = [n for n in better_neighbors if n[2] == best_conflict]
-            next_state, _, next_conflicts = random.choice(best_neighbors)
+            board.apply_move(*move)
             
-            # Actualizar estado
-            current_state = next_state
-            current_conflicts = next_conflicts
+            if trajectory is not None:
+                trajectory.append(board.conflicts)
             
             # Verificar si encontramos solución
-            if current_conflicts == 0:
-                return current_state, True
+            if board.conflicts == 0:
+                self.best_conflicts = 0
+                return board.to_list(), True
+            if board.conflicts < best_conflicts:
+                best_conflicts = board.conflicts
+                best_state = board.queens[:]
+                self.best_conflicts = min(self.best_conflicts, best_conflicts)
+                last_improvement = self.iterations
+            elif (stagnation_limit is not None
+                  and self.iterations - last_improvement >= stagnation_limit):
+                # Ejecución estancada: la política de reinicio la abandona
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            
+            if callback is not None:
+                if every and self.iterations % every == 0:
+                    self._report_progress(board.conflicts)
+                elif interval and time.perf_counter() >= next_report:
+                    self._report_progress(board.conflicts)
+                    next_report = time.perf_counter() + interval
         
-        return current_state, False
+        return best_state.tolist(), False
+    
+    def _report_progress(self, conflicts: int) -> None:
+        """Invoca el callback de progreso con el estado actual de la búsqueda."""
+        self.progress_callback({
+            'iteration': self.iterations,
+            'restart': self.restarts,
+            'conflicts': conflicts,
+            'best_conflicts': self.best_conflicts,
+            'elapsed': time.perf_counter() - self.start_time
+        })
     
     def solve(self, initial_state: Optional[List[int]] = None) -> Tuple[List[int], dict]:
         """
@@ -163,56 +755,78 @@ class HillClimbingNQueens:
         Returns:
             Tupla (solución, estadísticas)
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+        self.restarts = 0
+        self.initial_conflicts = None
+        self.best_conflicts = float('inf')
+        self.trajectory = (ConflictTrajectory(self.trajectory_size)
+                           if self.trajectory_size > 0 else None)
         
         if self.use_random_restart:
             # Random Restart Hill Climbing
             best_solution = None
             best_conflicts = float('inf')
             total_iterations = 0
+            self.restart_policy.reset(self.n)
+            budget_start = time.perf_counter()
             
             for restart in range(self.max_restarts):
+                if self.time_budget is not None:
+                    # Repartir el presupuesto restante entre los reinicios pendientes
+                    now = time.perf_counter()
+                    remaining = self.time_budget - (now - budget_start)
+                    if remaining <= 0:
+                        break
+                    self.deadline = now + remaining / (self.max_restarts - restart)
                 self.restarts = restart + 1
+                self.stagnation_limit = self.restart_policy.stagnation_limit(self.restarts)
                 solution, found = self.hill_climbing()
                 total_iterations += self.iterations
                 conflicts = self.calculate_conflicts(solution)
                 
                 if conflicts == 0:
-                    self.end_time = time.time()
+                    self.end_time = time.perf_counter()
                     self.iterations = total_iterations
-                    return solution, {
-                        'solution_found': True,
-                        'iterations': total_iterations,
-                        'restarts': self.restarts,
-                        'execution_time': self.end_time - self.start_time,
-                        'conflicts': conflicts
-                    }
+                    self._clear_run_limits()
+                    return solution, self._stats(True, conflicts)
                 
                 if conflicts < best_conflicts:
                     best_conflicts = conflicts
                     best_solution = solution
             
-            self.end_time = time.time()
+            self.end_time = time.perf_counter()
             self.iterations = total_iterations
-            return best_solution, {
-                'solution_found': False,
-                'iterations': total_iterations,
-                'restarts': self.restarts,
-                'execution_time': self.end_time - self.start_time,
-                'conflicts': best_conflicts
-            }
+            self._clear_run_limits()
+            return best_solution, self._stats(False, best_conflicts)
         else:
             # Hill Climbing estándar
             solution, found = self.hill_climbing(initial_state)
-            self.end_time = time.time()
+            self.end_time = time.perf_counter()
             
-            return solution, {
-                'solution_found': found,
-                'iterations': self.iterations,
-                'restarts': 0,
-                'execution_time': self.end_time - self.start_time,
-                'conflicts': self.calculate_conflicts(solution)
-            }
+            return solution, self._stats(found, self.calculate_conflicts(solution))
+    
+    def _clear_run_limits(self) -> None:
+        """Quita los límites por ejecución para llamadas directas a hill_climbing."""
+        self.stagnation_limit = None
+        self.deadline = None
+    
+    def _stats(self, solution_found: bool, conflicts: int) -> dict:
+        """Construye el diccionario de estadísticas de solve()."""
+        stats = {
+            'solution_found': solution_found,
+            'iterations': self.iterations,
+            'restarts': self.restarts,
+            'execution_time': self.end_time - self.start_time,
+            'conflicts': conflicts,
+            'initial_conflicts': self.initial_conflicts,
+            'strategy': self.strategy.name,
+            'representation': self.representation,
+            'initialization': self.initialization,
+            'restart_policy': self.restart_policy.name if self.use_random_restart else None
+        }
+        if self.trajectory is not None:
+            stats['trajectory'] = self.trajectory.to_list()
+        return stats
 
 
 def visualize_board(board: List[int], n: int):
@@ -0,0 +1,286 @@
+"""
+Búsqueda local para N-Reinas con n muy grande (decenas de millones)
+
+Modo de memoria acotada: el tablero (una permutación) y los 2n - 1 contadores de
+cada familia de diagonales se guardan en buffers array con el tipo entero más
+pequeño que admite sus valores, y nunca se crean objetos de Python por reina
+(no hay listas de n elementos). Para n = 10^7 el estado ocupa ~200 MB.
+
+FUENTES Y REFERENCIAS:
+- Sosic, R., & Gu, J. (1994). Efficient local search with conflict minimization:
+  a case study of the n-queens problem. IEEE Transactions on Knowledge and Data
+  Engineering, 6(5), 661-668. (Inicialización voraz con sondeos aleatorios y
+  reparación por intercambios, algoritmo QS4)
+
+El algoritmo tiene dos fases:
+1. Inicialización voraz: columna a columna se elige, entre las filas aún no
+   usadas, una cuyas dos diagonales estén libres (con un número acotado de
+   sondeos aleatorios); las últimas `tail` columnas se colocan al azar.
+2. Reparación: para cada reina atacada se prueban intercambios con columnas
+   aleatorias y se aplican los que reducen los conflictos. Si varias pasadas
+   seguidas no mejoran (algo que solo ocurre con n pequeño) se reinicia.
+
+Medición de memoria: tracemalloc registra cada objeto int que crean los bucles
+de Python, lo que multiplica por ~15 el tiempo de la inicialización. Por eso
+se traza la reserva de los buffers y la fase de reparación (donde vive toda la
+memoria persistente) y no el bucle de llenado, que solo crea enteros
+temporales; el pico reportado es la suma de ambos picos.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Optional, Tuple
+
+from board import pairs_change, smallest_typecode, zeros
+
+try:
+    import resource
+except ImportError:  # Windows: sin getrusage, solo se reporta tracemalloc
+    resource = None
+
+
+class HugeNQueensLocalSearch:
+    """Búsqueda local con memoria acotada para N-Reinas con n muy grande."""
+
+    __slots__ = ('n', 'max_probes', 'tail', 'max_passes', 'swap_attempts',
+                 'max_stalled_passes', 'max_restarts', 'track_memory', 'queens',
+                 'diag1', 'diag2', 'conflicts', 'iterations', 'restarts',
+                 'start_time', 'end_time')
+
+    def __init__(self, n: int, max_probes: int = 32, tail: Optional[int] = None,
+                 max_passes: int = 1000, swap_attempts: int = 32,
+                 max_stalled_passes: int = 10, max_restarts: int = 100,
+                 track_memory: bool = True):
+        """
+        Inicializa el solver.
+
+        Args:
+            n: Tamaño del tablero (número de reinas)
+            max_probes: Sondeos aleatorios por columna en la inicialización
+            tail: Columnas finales colocadas al azar (None = min(n, 32))
+            max_passes: Pasadas máximas de reparación sobre las reinas atacadas
+            swap_attempts: Intercambios aleatorios probados por reina en cada pasada
+            max_stalled_passes: Pasadas seguidas sin mejora antes de reiniciar
+            max_restarts: Número máximo de reinicios
+            track_memory: Si es True, mide el pico de memoria con tracemalloc
+        """
+        self.n = n
+        self.max_probes = max_probes
+        self.tail = min(n, 32) if tail is None else tail
+        self.max_passes = max_passes
+        self.swap_attempts = swap_attempts
+        self.max_stalled_passes = max_stalled_passes
+        self.max_restarts = max_restarts
+        self.track_memory = track_memory
+        self.queens = None
+        self.diag1 = None
+        self.diag2 = None
+        self.conflicts = 0
+        self.iterations = 0
+        self.restarts = 0
+        self.start_time = 0
+        self.end_time = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por el tablero y los contadores diagonales."""
+        if self.queens is None:
+            return 0
+        return sum(buf.itemsize * len(buf) for buf in (self.queens, self.diag1, self.diag2))
+
+    def _allocate(self) -> None:
+        """Reserva el tablero (identidad) y los contadores diagonales a cero."""
+        n = self.n
+        # Liberar los buffers de un intento anterior antes de reservar los nuevos
+        self.queens = self.diag1 = self.diag2 = None
+        self.queens = array(smallest_typecode(max(n - 1, 0)), range(n))
+        counter_code = smallest_typecode(n)
+        self.diag1 = zeros(counter_code, max(0, 2 * n - 1))
+        self.diag2 = zeros(counter_code, max(0, 2 * n - 1))
+        self.conflicts = 0
+
+    def _initialize(self) -> None:
+        """Fase 1: inicialización voraz sobre la permutación identidad."""
+        n = self.n
+        off = n - 1
+        rnd = random.random
+        max_probes = self.max_probes
+        free_cols = n - self.tail
+        queens, diag1, diag2 = self.queens, self.diag1, self.diag2
+        conflicts = 0
+
+        for col in range(n):
+            remaining = n - col
+            if col < free_cols:
+                for _ in range(max_probes):
+                    j = col + int(rnd() * remaining)
+                    row = queens[j]
+                    if diag1[row - col + off] == 0 and diag2[row + col] == 0:
+                        break
+            else:
+                j = col + int(rnd() * remaining)
+            queens[col], queens[j] = queens[j], queens[col]
+            row = queens[col]
+            conflicts += diag1[row - col + off] + diag2[row + col]
+            diag1[row - col + off] += 1
+            diag2[row + col] += 1
+
+        self.conflicts = conflicts
+
+    def _attacked(self, col: int) -> bool:
+        """Indica si la reina de la columna col comparte alguna diagonal."""
+        row = self.queens[col]
+        return self.diag1[row - col + self.n - 1] > 1 or self.diag2[row + col] > 1
+
+    def swap_delta(self, i: int, j: int) -> int:
+        """Cambio en conflictos al intercambiar las filas de las columnas i y j."""
+        ri, rj = self.queens[i], self.queens[j]
+        off = self.n - 1
+        return (pairs_change(self.diag1, ((ri - i + off, -1), (rj - j + off, -1),
+                                          (rj - i + off, 1), (ri - j + off, 1)))
+                + pairs_change(self.diag2, ((ri + i, -1), (rj + j, -1),
+                                            (rj + i, 1), (ri + j, 1))))
+
+    def _swap(self, i: int, j: int) -> None:
+        """Intercambia las filas de las columnas i y j actualizando contadores."""
+        queens, diag1, diag2 = self.queens, self.diag1, self.diag2
+        ri, rj = queens[i], queens[j]
+        off = self.n - 1
+        diag1[ri - i + off] -= 1
+        diag2[ri + i] -= 1
+        diag1[rj - j + off] -= 1
+        diag2[rj + j] -= 1
+        diag1[rj - i + off] += 1
+        diag2[rj + i] += 1
+        diag1[ri - j + off] += 1
+        diag2[ri + j] += 1
+        queens[i], queens[j] = rj, ri
+
+    def _repair(self) -> bool:
+        """
+        Fase 2: intercambios que reducen conflictos sobre las reinas atacadas.
+
+        Returns:
+            True si se eliminaron todos los conflictos
+        """
+        n = self.n
+        rnd = random.random
+        # Solo las reinas atacadas se guardan en una lista (pocas tras la fase 1)
+        candidates = [col for col in range(n) if self._attacked(col)]
+        passes = 0
+        stalled = 0
+        while self.conflicts > 0 and passes < self.max_passes:
+            passes += 1
+            before = self.conflicts
+            next_candidates = []
+            for i in candidates:
+                if not self._attacked(i):
+                    continue
+                for _ in range(self.swap_attempts):
+                    self.iterations += 1
+                    j = int(rnd() * n)
+                    if j == i:
+                        continue
+                    d = self.swap_delta(i, j)
+                    if d < 0:
+                        self._swap(i, j)
+                        self.conflicts += d
+                        next_candidates.append(j)
+                        break
+                next_candidates.append(i)
+            candidates = [col for col in set(next_candidates) if self._attacked(col)]
+            stalled = stalled + 1 if self.conflicts == before else 0
+            if stalled >= self.max_stalled_passes:
+                break
+        return self.conflicts == 0
+
+    def _traced(self, func) -> int:
+        """
+        Ejecuta func midiendo con tracemalloc el pico de memoria que reserva.
+
+        Returns:
+            Pico en bytes (0 si track_memory es False)
+        """
+        if not self.track_memory:
+            func()
+            return 0
+        if tracemalloc.is_tracing():
+            # Trazado externo en curso: medir sin detenerlo
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            func()
+            return tracemalloc.get_traced_memory()[1] - start
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def solve(self) -> Tuple[array, dict]:
+        """
+        Resuelve el problema de N-Reinas con memoria acotada.
+
+        Returns:
+            Tupla (solución como array de filas por columna, estadísticas)
+        """
+        self.start_time = time.perf_counter()
+        self.iterations = 0
+        self.restarts = 0
+        peak = 0
+        initial_conflicts = None
+
+        while True:
+            peak_alloc = self._traced(self._allocate)
+            self._initialize()
+            if initial_conflicts is None:
+                initial_conflicts = self.conflicts
+            found = []
+            peak_repair = self._traced(lambda: found.append(self._repair()))
+            peak = max(peak, peak_alloc + peak_repair)
+            if found[0] or self.restarts >= self.max_restarts:
+                break
+            self.restarts += 1
+
+        self.end_time = time.perf_counter()
+        # ru_maxrss está en KB en Linux y en bytes en macOS
+        max_rss_mb = None
+        if resource is not None:
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            max_rss_mb = max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+        return self.queens, {
+            'solution_found': self.conflicts == 0,
+            'iterations': self.iterations,
+            'execution_time': self.end_time - self.start_time,
+            'conflicts': self.conflicts,
+            'initial_conflicts': initial_conflicts,
+            'state_bytes': self.nbytes,
+            'board_typecode': self.queens.typecode,
+            'counter_typecode': self.diag1.typecode,
+            'restarts': self.restarts,
+            'peak_memory_mb': peak / (1024 * 1024) if self.track_memory else None,
+            'max_rss_mb': max_rss_mb
+        }
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso: python huge_local_search.py [n]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"Resolviendo problema de {n}-Reinas con búsqueda local de memoria acotada")
+
+    solver = HugeNQueensLocalSearch(n)
+    solution, stats = solver.solve()
+
+    print(f"Solución encontrada: {stats['solution_found']}")
+    print(f"Conflictos iniciales: {stats['initial_conflicts']}")
+    print(f"Intercambios probados: {stats['iterations']}")
+    print(f"Tiempo de ejecución: {stats['execution_time']:.3f} segundos")
+    print(f"Estado: {stats['state_bytes'] / (1024 * 1024):.1f} MB "
+          f"(tablero '{stats['board_typecode']}', contadores '{stats['counter_typecode']}')")
+    print(f"Pico de memoria (tracemalloc): {stats['peak_memory_mb']:.1f} MB")
+    if stats['max_rss_mb'] is not None:
+        print(f"RSS máximo: {stats['max_rss_mb']:.1f} MB")
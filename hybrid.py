@@ -0,0 +1,188 @@
+"""
+Solver híbrido para el Problema de las N-Reinas: prefijo por Backtracking y
+completado por búsqueda local de mínimos conflictos
+
+Para n grande el Backtracking se atasca en lo profundo del árbol y Hill Climbing
+parte de estados lejanos a una solución. El solver híbrido combina ambos:
+1. Backtracking (BacktrackingNQueens.solve_prefix) coloca sin conflictos las
+   primeras k reinas dentro de un presupuesto pequeño de nodos. Las filas se
+   prueban en orden aleatorio: el prefijo lexicográfico (0, 2, 4, ...) casi
+   nunca se puede extender a una solución completa.
+2. Las columnas restantes se llenan de forma voraz: para cada columna se prueban
+   algunas filas aleatorias y se elige la de menos conflictos.
+3. Una búsqueda local de mínimos conflictos (Minton et al., 1992) mueve solo las
+   reinas de las columnas libres; el prefijo queda fijo.
+
+FUENTES Y REFERENCIAS:
+- Minton, S., Johnston, M. D., Philips, A. B., & Laird, P. (1992). Minimizing
+  conflicts: a heuristic repair method for constraint satisfaction and
+  scheduling problems. Artificial Intelligence, 58(1-3), 161-205.
+"""
+
+import random
+import time
+from typing import List, Optional, Tuple
+
+from backtracking import BacktrackingNQueens
+from board import Board
+
+
+class HybridNQueens:
+    """Backtracking para un prefijo de k columnas más mínimos conflictos para el resto."""
+
+    __slots__ = ('n', 'prefix_size', 'node_budget', 'fill_probes', 'max_steps',
+                 'max_restarts', 'iterations', 'restarts', 'prefix_nodes',
+                 'start_time', 'end_time')
+
+    def __init__(self, n: int, prefix_size: Optional[int] = None, node_budget: int = 10000,
+                 fill_probes: int = 8, max_steps: Optional[int] = None, max_restarts: int = 10):
+        """
+        Inicializa el solver híbrido.
+
+        Args:
+            n: Tamaño del tablero (número de reinas)
+            prefix_size: Columnas colocadas por Backtracking (None = min(n // 4, 500);
+                con prefijos más largos el resto del tablero suele quedar sin
+                solución, y el límite evita superar la profundidad de recursión)
+            node_budget: Presupuesto de nodos del Backtracking para el prefijo
+            fill_probes: Filas aleatorias probadas por columna en el llenado voraz
+            max_steps: Pasos máximos de mínimos conflictos por intento (None = 10n)
+            max_restarts: Reintentos del llenado y la búsqueda local con el mismo prefijo
+        """
+        self.n = n
+        self.prefix_size = min(n // 4, 500) if prefix_size is None else prefix_size
+        self.node_budget = node_budget
+        self.fill_probes = fill_probes
+        self.max_steps = 10 * n if max_steps is None else max_steps
+        self.max_restarts = max_restarts
+        self.iterations = 0
+        self.restarts = 0
+        self.prefix_nodes = 0
+        self.start_time = 0
+        self.end_time = 0
+
+    def build_prefix(self) -> Tuple[Board, int]:
+        """
+        Coloca el prefijo con Backtracking dentro del presupuesto de nodos.
+
+        Returns:
+            Tupla (tablero con el prefijo, tamaño del prefijo logrado). Si el
+            presupuesto se agota, el prefijo queda vacío.
+        """
+        bt = BacktrackingNQueens(self.n, max_nodes=self.node_budget, shuffle_rows=True)
+        board, stats = bt.solve_prefix(self.prefix_size)
+        self.prefix_nodes = stats['nodes_explored']
+        if board is None:
+            return Board(self.n), 0
+        return board, self.prefix_size
+
+    def greedy_fill(self, board: Board, start: int) -> None:
+        """
+        Llena las columnas vacías desde start eligiendo, entre fill_probes filas
+        aleatorias, la que menos conflictos añade.
+
+        Args:
+            board: Tablero con las columnas [0, start) ocupadas
+            start: Primera columna vacía
+        """
+        n = self.n
+        for col in range(start, n):
+            best_row = random.randrange(n)
+            best_added = board.delta(col, best_row)
+            for _ in range(self.fill_probes - 1):
+                if best_added == 0:
+                    break
+                row = random.randrange(n)
+                added = board.delta(col, row)
+                if added < best_added:
+                    best_row, best_added = row, added
+            board.place(col, best_row)
+
+    def min_conflicts(self, board: Board, start: int) -> bool:
+        """
+        Búsqueda local de mínimos conflictos sobre las columnas [start, n).
+
+        En cada paso elige al azar una reina atacada de las columnas libres y
+        la mueve a la fila de su columna con menos conflictos (desempate
+        aleatorio). Las reinas del prefijo nunca se mueven.
+
+        Args:
+            board: Tablero completo
+            start: Primera columna libre
+
+        Returns:
+            True si se eliminaron todos los conflictos
+        """
+        n = self.n
+        rows, diag1, diag2 = board.rows, board.diag1, board.diag2
+        for _ in range(self.max_steps):
+            if board.conflicts == 0:
+                return True
+            self.iterations += 1
+            attacked = [col for col in range(start, n) if board.queen_conflicts(col) > 0]
+            col = random.choice(attacked)
+            current = board[col]
+            best_rows: List[int] = []
+            best_value = None
+            for row in range(n):
+                # Conflictos de la reina en (row, col) sin contarse a sí misma
+                value = rows[row] + diag1[row - col + n - 1] + diag2[row + col]
+                if row == current:
+                    value -= 3
+                if best_value is None or value < best_value:
+                    best_value = value
+                    best_rows = [row]
+                elif value == best_value:
+                    best_rows.append(row)
+            board.move(col, random.choice(best_rows))
+        return board.conflicts == 0
+
+    def solve(self) -> Tuple[List[int], dict]:
+        """
+        Resuelve el problema de N-Reinas con el esquema híbrido.
+
+        Returns:
+            Tupla (solución, estadísticas)
+        """
+        self.start_time = time.perf_counter()
+        self.iterations = 0
+        self.restarts = 0
+
+        prefix, k = self.build_prefix()
+        prefix_snapshot = prefix.snapshot()
+        board = prefix
+        found = False
+
+        for attempt in range(self.max_restarts + 1):
+            if attempt > 0:
+                self.restarts += 1
+                board.restore(prefix_snapshot)
+            self.greedy_fill(board, k)
+            if self.min_conflicts(board, k):
+                found = True
+                break
+
+        self.end_time = time.perf_counter()
+        return board.to_list(), {
+            'solution_found': found,
+            'iterations': self.iterations,
+            'restarts': self.restarts,
+            'execution_time': self.end_time - self.start_time,
+            'conflicts': board.conflicts,
+            'prefix_size': k,
+            'prefix_nodes': self.prefix_nodes
+        }
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    n = 200
+    print(f"Resolviendo problema de {n}-Reinas con el solver híbrido")
+
+    hybrid = HybridNQueens(n)
+    solution, stats = hybrid.solve()
+
+    print(f"Solución encontrada: {stats['solution_found']}")
+    print(f"Prefijo: {stats['prefix_size']} reinas ({stats['prefix_nodes']} nodos)")
+    print(f"Pasos de mínimos conflictos: {stats['iterations']}")
+    print(f"Tiempo de ejecución: {stats['execution_time']:.6f} segundos")
@@ -0,0 +1,249 @@
+"""
+Perfilado de ensayos para los experimentos de N-Reinas
+
+Dos modos:
+- 'cprofile': cProfile determinista. Además, un muestreador por señal de
+  temporizador (ITIMER_PROF, cada 5 ms de CPU) registra las pilas para los
+  gráficos de llama; su sobrecarga es despreciable frente a la de cProfile.
+- 'sample': solo el muestreador, de baja sobrecarga (útil para n grande, donde
+  cProfile multiplica el tiempo de las funciones pequeñas como is_safe).
+
+Los perfiles se acumulan por configuración (experimento, algoritmo, n, variante)
+y se escriben como:
+- <prefijo>.pstats: estadísticas de cProfile (pstats, snakeviz, gprof2dot)
+- <prefijo>.folded: pilas colapsadas "f1;f2;f3 muestras" (flamegraph.pl, speedscope)
+
+El muestreador usa signal.setitimer, disponible solo en Unix y en el hilo
+principal; en otro caso se omite el archivo .folded.
+"""
+
+import cProfile
+import os
+import pstats
+import signal
+import threading
+from collections import Counter
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+# Funciones de los solvers que se destacan en el reporte aunque no estén entre las primeras
+HIGHLIGHT = ('is_safe', 'calculate_conflicts', 'get_neighbors', 'solve_util', 'hill_climbing')
+
+
+def _frame_label(code) -> str:
+    """Etiqueta 'módulo:función' de un objeto código."""
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+class StackSampler:
+    """Muestreador de pilas por señal de temporizador de CPU."""
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: Segundos de CPU entre muestras
+        """
+        self.interval = interval
+        self.samples = Counter()
+
+    @staticmethod
+    def available() -> bool:
+        """Indica si se puede muestrear (Unix, hilo principal)."""
+        return (hasattr(signal, 'setitimer')
+                and threading.current_thread() is threading.main_thread())
+
+    def _handler(self, signum, frame) -> None:
+        # La pila se corta en el marco de run(); las muestras tomadas fuera de
+        # func (antes o después de la llamada) no llegan a él y se descartan
+        stack = []
+        while frame is not None and frame.f_code is not StackSampler.run.__code__:
+            if frame.f_code.co_filename != cProfile.__file__:
+                stack.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        if frame is not None and stack:
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def run(self, func: Callable):
+        """
+        Ejecuta func muestreando su pila (los marcos por encima de func no se registran).
+
+        Args:
+            func: Función sin argumentos
+
+        Returns:
+            Lo que devuelva func
+        """
+        if not self.available():
+            return func()
+        previous = signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+
+class ConfigProfile:
+    """Perfil acumulado de todos los ensayos de una configuración."""
+
+    def __init__(self, label: str):
+        """
+        Args:
+            label: Descripción de la configuración (para los reportes)
+        """
+        self.label = label
+        self.trials = 0
+        self.stats: Optional[pstats.Stats] = None
+        self.samples = Counter()
+
+    def run(self, func: Callable, mode: str = 'cprofile', interval: float = 0.005):
+        """
+        Ejecuta func perfilándola y acumula el resultado.
+
+        Args:
+            func: Función sin argumentos (p. ej. solver.solve)
+            mode: 'cprofile' o 'sample'
+            interval: Periodo del muestreador en segundos de CPU
+
+        Returns:
+            Lo que devuelva func
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfilado desconocido: {mode}")
+        sampler = StackSampler(interval)
+        self.trials += 1
+        if mode == 'sample':
+            result = sampler.run(func)
+        else:
+            profiler = cProfile.Profile()
+            result = sampler.run(partial(profiler.runcall, func))
+            if self.stats is None:
+                self.stats = pstats.Stats(profiler)
+            else:
+                self.stats.add(profiler)
+        self.samples.update(sampler.samples)
+        return result
+
+    def write(self, prefix: str) -> List[str]:
+        """
+        Escribe los archivos .pstats y .folded disponibles.
+
+        Args:
+            prefix: Ruta sin extensión
+
+        Returns:
+            Rutas escritas
+        """
+        written = []
+        if self.stats is not None:
+            self.stats.dump_stats(prefix + '.pstats')
+            written.append(prefix + '.pstats')
+        if self.samples:
+            with open(prefix + '.folded', 'w', encoding='utf-8') as f:
+                for stack, count in sorted(self.samples.items()):
+                    f.write(f"{stack} {count}\n")
+            written.append(prefix + '.folded')
+        return written
+
+    def top_functions(self, limit: int = 8) -> List[Tuple[str, int, float, float]]:
+        """
+        Funciones con mayor tiempo acumulado.
+
+        Con cProfile el tiempo es exacto; en modo muestreo se estima con el
+        número de muestras en las que la función aparece en la pila.
+
+        Args:
+            limit: Número de funciones (las de HIGHLIGHT se añaden siempre)
+
+        Returns:
+            Lista de (función, llamadas o muestras, tiempo propio, tiempo acumulado)
+        """
+        rows = []
+        if self.stats is not None:
+            for (filename, line, name), (cc, nc, tt, ct, _) in self.stats.stats.items():
+                module = os.path.splitext(os.path.basename(filename))[0]
+                label = f"{module}:{name}" if filename != '~' else name
+                rows.append((label, nc, tt, ct))
+        elif self.samples:
+            inclusive = Counter()
+            own = Counter()
+            for stack, count in self.samples.items():
+                frames = stack.split(';')
+                own[frames[-1]] += count
+                for label in set(frames):
+                    inclusive[label] += count
+            total = sum(self.samples.values())
+            rows = [(label, count, own[label] / total, count / total)
+                    for label, count in inclusive.items()]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        top = rows[:limit]
+        top += [row for row in rows[limit:] if row[0].split(':')[-1] in HIGHLIGHT]
+        return top
+
+
+class ProfileCollector:
+    """Perfiles por configuración de todos los ensayos perfilados."""
+
+    def __init__(self, mode: str = 'cprofile', output_dir: str = 'perfiles',
+                 interval: float = 0.005):
+        """
+        Args:
+            mode: 'cprofile' o 'sample'
+            output_dir: Directorio de salida de .pstats y .folded
+            interval: Periodo del muestreador en segundos de CPU
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfilado desconocido: {mode}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.interval = interval
+        self.profiles: Dict[Tuple, ConfigProfile] = {}
+
+    def run(self, key: Tuple, func: Callable):
+        """
+        Ejecuta func perfilándola bajo la configuración key.
+
+        Args:
+            key: (experimento, algoritmo, n, variante)
+            func: Función sin argumentos
+
+        Returns:
+            Lo que devuelva func
+        """
+        profile = self.profiles.get(key)
+        if profile is None:
+            experiment, algorithm, n, variant = key
+            profile = self.profiles[key] = ConfigProfile(f"{experiment}_{algorithm}_n{n}_{variant}")
+        return profile.run(func, self.mode, self.interval)
+
+    def report(self, limit: int = 8) -> List[str]:
+        """
+        Escribe los archivos de cada configuración e imprime sus funciones principales.
+
+        Args:
+            limit: Funciones por configuración
+
+        Returns:
+            Rutas escritas
+        """
+        if not self.profiles:
+            return []
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = []
+        unit = 'llamadas' if self.mode == 'cprofile' else 'muestras'
+        print("\n" + "="*80)
+        print(f"PERFILES ({self.mode}) — por tiempo acumulado")
+        print("="*80)
+        for profile in self.profiles.values():
+            written += profile.write(os.path.join(self.output_dir, profile.label))
+            print(f"\n{profile.label} ({profile.trials} ensayos)")
+            print(f"  {'Función':<40} {unit:>10} {'propio':>10} {'acumulado':>10}")
+            for label, calls, own, cumulative in profile.top_functions(limit):
+                fmt = '.4f' if self.mode == 'cprofile' else '.1%'
+                print(f"  {label[:40]:<40} {calls:>10} {own:>10{fmt}} {cumulative:>10{fmt}}")
+        print(f"\nArchivos de perfil en: {self.output_dir}/")
+        return written
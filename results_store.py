@@ -0,0 +1,277 @@
+"""
+Almacén de resultados de solo anexado sobre SQLite (módulo estándar sqlite3)
+
+Sustituye la reescritura completa de los JSON/CSV al final de cada corrida:
+- Cada ensayo se inserta en la tabla `trials` en cuanto termina (una
+  transacción por ensayo, diario WAL), de modo que una corrida interrumpida
+  conserva todo lo que ya se midió.
+- Al terminar un experimento se anexa su resumen (el mismo diccionario que
+  ExperimentRunner.results[experimento]) a la tabla `summaries`.
+- Nunca se actualizan ni borran filas: cada corrida tiene su run_id y las
+  consultas toman el resumen más reciente de cada experimento.
+
+Las consultas de ensayos recorren el cursor fila a fila, así que leer un
+barrido enorme no carga todos los ensayos en memoria.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+DEFAULT_PATH = 'resultados.db'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    experiment TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    seed INTEGER,
+    created REAL NOT NULL,
+    payload TEXT NOT NULL,
+    cache_key TEXT
+);
+CREATE INDEX IF NOT EXISTS trials_config
+    ON trials (experiment, algorithm, n, variant);
+CREATE TABLE IF NOT EXISTS summaries (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    experiment TEXT NOT NULL,
+    created REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summaries_experiment
+    ON summaries (experiment, id);
+"""
+
+
+def _to_json(value: Any) -> str:
+    """Serializa a JSON convirtiendo tipos no estándar (arrays, NumPy) a listas o texto."""
+    def default(obj):
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        return str(obj)
+    return json.dumps(value, ensure_ascii=False, default=default)
+
+
+class ResultsStore:
+    """Almacén de ensayos y resúmenes de experimentos de solo anexado."""
+
+    def __init__(self, path: str = DEFAULT_PATH, run_id: Optional[str] = None):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            path: Archivo SQLite (':memory:' para un almacén temporal)
+            run_id: Identificador de la corrida (None = uno nuevo aleatorio)
+        """
+        self.path = path
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        # Almacenes creados antes de la caché de ensayos no tienen cache_key
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(trials)")]
+        if 'cache_key' not in columns:
+            self.conn.execute("ALTER TABLE trials ADD COLUMN cache_key TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS trials_cache_key ON trials (cache_key)")
+
+    def close(self) -> None:
+        """Cierra la conexión."""
+        self.conn.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append_trial(self, experiment: str, algorithm: str, n: int, variant: str,
+                     seed: Optional[int], record: Dict[str, Any],
+                     cache_key: Optional[str] = None) -> None:
+        """
+        Anexa el resultado de un ensayo y lo confirma de inmediato.
+
+        Args:
+            experiment: Clave del experimento (p. ej. 'experimento1')
+            algorithm: Algoritmo del ensayo
+            n: Tamaño del tablero
+            variant: Variante del solver
+            seed: Semilla del ensayo (o None)
+            record: Datos del ensayo (solución, estadísticas, memoria...)
+            cache_key: Clave de caché del ensayo (ver find_trial)
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO trials (run_id, experiment, algorithm, n, variant, seed, created,"
+                " payload, cache_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, experiment, algorithm, n, variant, seed, time.time(),
+                 _to_json(record), cache_key))
+
+    def find_trial(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca el ensayo más reciente con una clave de caché.
+
+        Args:
+            cache_key: Clave de caché
+
+        Returns:
+            Datos del ensayo o None si no está almacenado
+        """
+        row = self.conn.execute(
+            "SELECT payload FROM trials WHERE cache_key = ? ORDER BY id DESC LIMIT 1",
+            (cache_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def append_summary(self, experiment: str, data: Any) -> None:
+        """
+        Anexa el resumen de un experimento terminado.
+
+        Args:
+            experiment: Clave del experimento
+            data: Resultados agregados (serializables a JSON)
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO summaries (run_id, experiment, created, payload) VALUES (?, ?, ?, ?)",
+                (self.run_id, experiment, time.time(), _to_json(data)))
+
+    def iter_trials(self, experiment: Optional[str] = None, algorithm: Optional[str] = None,
+                    n: Optional[int] = None, variant: Optional[str] = None,
+                    run_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los ensayos que cumplen los filtros, en orden de inserción.
+
+        Args:
+            experiment, algorithm, n, variant, run_id: Filtros (None = cualquiera)
+
+        Returns:
+            Iterador de diccionarios con las columnas de la fila y el contenido
+            del ensayo en 'record'
+        """
+        filters = {'experiment': experiment, 'algorithm': algorithm, 'n': n,
+                   'variant': variant, 'run_id': run_id}
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        query = "SELECT run_id, experiment, algorithm, n, variant, seed, created, payload FROM trials"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY id"
+        for run, exp, alg, size, var, seed, created, payload in self.conn.execute(query, params):
+            yield {'run_id': run, 'experiment': exp, 'algorithm': alg, 'n': size,
+                   'variant': var, 'seed': seed, 'created': created,
+                   'record': json.loads(payload)}
+
+    def count_trials(self, experiment: Optional[str] = None) -> int:
+        """Número de ensayos almacenados (de un experimento o de todos)."""
+        if experiment is None:
+            return self.conn.execute("SELECT COUNT(*) FROM trials").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM trials WHERE experiment = ?",
+                                 (experiment,)).fetchone()[0]
+
+    def latest_summary(self, experiment: str) -> Optional[Any]:
+        """
+        Resumen más reciente de un experimento.
+
+        Args:
+            experiment: Clave del experimento
+
+        Returns:
+            Resultados agregados o None si el experimento no se ha ejecutado
+        """
+        text = self.latest_summary_text(experiment)
+        return json.loads(text) if text is not None else None
+
+    def latest_summary_text(self, experiment: str) -> Optional[str]:
+        """
+        Texto JSON del resumen más reciente de un experimento, sin decodificarlo
+        (para calcular hashes de contenido sin cargar los datos).
+
+        Args:
+            experiment: Clave del experimento
+
+        Returns:
+            JSON del resumen o None si el experimento no se ha ejecutado
+        """
+        row = self.conn.execute(
+            "SELECT payload FROM summaries WHERE experiment = ? ORDER BY id DESC LIMIT 1",
+            (experiment,)).fetchone()
+        return row[0] if row else None
+
+    def latest_results(self) -> Dict[str, Any]:
+        """
+        Resumen más reciente de cada experimento almacenado.
+
+        Returns:
+            Diccionario experimento -> resultados, con el mismo formato que
+            ExperimentRunner.results
+        """
+        experiments = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT experiment FROM summaries ORDER BY experiment")]
+        return {experiment: self.latest_summary(experiment) for experiment in experiments}
+
+
+def load_results(path: str = DEFAULT_PATH,
+                 fallback_json: Optional[str] = 'resultados_experimentos.json') -> Optional[Dict[str, Any]]:
+    """
+    Carga el resumen más reciente de cada experimento.
+
+    Consulta el almacén si existe; los experimentos que no estén en él se toman
+    del JSON combinado de versiones anteriores (si existe).
+
+    Args:
+        path: Archivo SQLite del almacén
+        fallback_json: JSON combinado usado como respaldo (None = sin respaldo)
+
+    Returns:
+        Diccionario experimento -> resultados, o None si no hay ninguna fuente
+    """
+    results = None
+    if fallback_json and os.path.exists(fallback_json):
+        with open(fallback_json, 'r', encoding='utf-8') as f:
+            results = {key: value for key, value in json.load(f).items() if value}
+    if os.path.exists(path):
+        with ResultsStore(path) as store:
+            results = {**(results or {}), **store.latest_results()}
+    return results
+
+
+def load_summary_texts(experiments: Iterable[str], path: str = DEFAULT_PATH,
+                       fallback_json: Optional[str] = 'resultados_experimentos.json') -> Dict[str, str]:
+    """
+    Texto JSON del resumen más reciente de cada experimento, sin decodificarlo.
+
+    Sirve para calcular hashes de contenido (gráficos, secciones del reporte)
+    sin cargar los datos. Los experimentos que no estén en el almacén se toman
+    del JSON combinado, serializados igual que en el almacén: mismo contenido,
+    mismo texto.
+
+    Args:
+        experiments: Claves de los experimentos
+        path: Archivo SQLite del almacén
+        fallback_json: JSON combinado usado como respaldo (None = sin respaldo)
+
+    Returns:
+        Diccionario experimento -> texto JSON (solo los que tienen resumen)
+    """
+    experiments = list(experiments)
+    texts = {}
+    if os.path.exists(path):
+        with ResultsStore(path) as store:
+            for experiment in experiments:
+                text = store.latest_summary_text(experiment)
+                if text is not None:
+                    texts[experiment] = text
+    missing = [experiment for experiment in experiments if experiment not in texts]
+    if missing and fallback_json and os.path.exists(fallback_json):
+        with open(fallback_json, 'r', encoding='utf-8') as f:
+            fallback = json.load(f)
+        for experiment in missing:
+            if fallback.get(experiment):
+                texts[experiment] = _to_json(fallback[experiment])
+    return texts
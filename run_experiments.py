@@ -1,40 +1,189 @@
 """
 Script auxiliar para ejecutar experimentos individuales.
 Permite ejecutar cada experimento por separado si se desea.
+
+El ejecutor de experimentos y los módulos pesados (almacén SQLite, NumPy,
+matplotlib, multiprocessing) se importan solo cuando se ejecuta un experimento,
+de modo que `python run_experiments.py solve --n 8` solo carga los solvers.
 """
 
 import sys
-from experiments import ExperimentRunner
+
+def pop_option(args, name, default=None, cast=str):
+    """
+    Extrae de args una opción "--nombre valor" (la elimina de la lista).
+    
+    Args:
+        args: Argumentos de línea de comandos (se modifica)
+        name: Nombre de la opción, p. ej. "--workers"
+        default: Valor si la opción no aparece
+        cast: Conversión aplicada al valor
+        
+    Returns:
+        Valor de la opción
+    """
+    if name not in args:
+        return default
+    i = args.index(name)
+    if i + 1 >= len(args):
+        print(f"Falta el valor de {name}")
+        sys.exit(1)
+    value = cast(args[i + 1])
+    del args[i:i + 2]
+    return value
+
+def pop_flag(args, name):
+    """
+    Extrae de args una opción booleana "--nombre" (la elimina de la lista).
+    
+    Returns:
+        True si la opción aparecía
+    """
+    if name not in args:
+        return False
+    args.remove(name)
+    return True
+
+def solve(args, seed=None):
+    """
+    Resuelve un solo tablero y muestra el resultado, sin almacén ni experimento.
+    
+    Args:
+        args: Opciones "--n N [--algorithm A] [--variant V]" (se modifica)
+        seed: Semilla del módulo random (None = sin fijar)
+    """
+    import random
+    from solvers import Trial, make_solver
+    n = pop_option(args, "--n", None, int)
+    algorithm = pop_option(args, "--algorithm", "backtracking")
+    variant = pop_option(args, "--variant", "original")
+    if n is None:
+        print("Uso: python run_experiments.py solve --n N [--algorithm hill_climbing|backtracking|hybrid]"
+              " [--variant VARIANTE] [--seed S]")
+        sys.exit(1)
+    if seed is not None:
+        random.seed(seed)
+    solution, stats = make_solver(Trial(algorithm, n, variant, seed)).solve()
+    print(f"{algorithm} ({variant}), n={n}: "
+          f"{'solución encontrada' if stats['solution_found'] else 'sin solución'} "
+          f"en {stats['execution_time']:.6f}s, "
+          f"iteraciones/nodos={stats.get('nodes_explored', stats.get('iterations'))}")
+    print(list(solution))
 
 def main():
-    if len(sys.argv) < 2:
-        print("Uso: python run_experiments.py <numero_experimento>")
+    args = sys.argv[1:]
+    workers = pop_option(args, "--workers", 1, int)
+    seed = pop_option(args, "--seed", None, int)
+    if args and args[0].lower() == "solve":
+        solve(args[1:], seed)
+        return
+    
+    from experiments import ExperimentRunner
+    from results_store import DEFAULT_PATH, ResultsStore
+    from streaming import FSYNC_POLICIES, TrialStreamWriter
+    store_path = pop_option(args, "--store", DEFAULT_PATH)
+    force = pop_flag(args, "--force")
+    timeout = pop_option(args, "--timeout", None, float)
+    memory_limit = pop_option(args, "--memory-limit", None, float)
+    profile = pop_flag(args, "--profile")
+    profile_mode = pop_option(args, "--profile-mode", "cprofile")
+    profile_dir = pop_option(args, "--profile-dir", "perfiles")
+    stream_path = pop_option(args, "--stream")
+    fsync = pop_option(args, "--fsync", "interval")
+    rotate_mb = pop_option(args, "--rotate-mb", None, float)
+    if fsync not in FSYNC_POLICIES:
+        print(f"--fsync debe ser uno de: {', '.join(FSYNC_POLICIES)}")
+        sys.exit(1)
+    
+    if len(args) < 1:
+        print("Uso: python run_experiments.py <numero_experimento> [--workers N] [--seed S] [--store ARCHIVO] [--force]"
+              " [--timeout S] [--memory-limit MB] [--profile [--profile-mode MODO] [--profile-dir DIR]]"
+              " [--stream ARCHIVO [--fsync POLITICA] [--rotate-mb MB]]")
         print("  Experimento 1: Escalabilidad")
-        print("  Experimento 2: Consistencia")
+        print("  Experimento 2: Consistencia (2 secuencial [tiempo|exito] [anchura]: muestreo secuencial)")
         print("  Experimento 3: Optimización")
+        print("  Estrategias: Benchmark de estrategias de búsqueda local")
+        print("  Inicializacion: Benchmark de inicialización aleatoria vs. voraz")
+        print("  Confiabilidad: Barrido de 1000 ensayos HC por lotes (n = 8..32)")
+        print("  Reinicios: Benchmark de políticas de reinicio")
+        print("  Hibrido: Solver híbrido vs. algoritmos puros")
+        print("  Adaptativo [segundos]: Escalabilidad adaptativa con ajuste de curvas (por defecto 1s por ensayo)")
+        print("  Barrido <archivo.json>: Barrido declarativo de parámetros (ver sweep.py)")
+        print("  Solve --n N [--algorithm A] [--variant V]: Resolver un solo tablero (sin almacén)")
         print("  Todos: Ejecutar todos los experimentos")
+        print("  --workers N: procesos para los ensayos de los experimentos 1-3 (0 = uno por CPU)")
+        print("  --seed S: semilla base para ensayos reproducibles")
+        print(f"  --store ARCHIVO: almacén SQLite de resultados (por defecto {DEFAULT_PATH})")
+        print("  --force: ejecutar todos los ensayos aunque ya estén en el almacén")
+        print("  --timeout S: segundos máximos por ensayo (se registra como 'timeout')")
+        print("  --memory-limit MB: memoria adicional máxima por ensayo (se registra como 'oom')")
+        print("  --profile: perfilar los ensayos y escribir .pstats y .folded por configuración")
+        print("  --profile-mode MODO: 'cprofile' (por defecto) o 'sample' (muestreo por temporizador)")
+        print("  --profile-dir DIR: directorio de los perfiles (por defecto perfiles)")
+        print("  --stream ARCHIVO: escribir cada ensayo al terminar (.csv o .jsonl)")
+        print("  --fsync POLITICA: never, interval (por defecto, cada segundo) o each")
+        print("  --rotate-mb MB: rotar el archivo de --stream al superar este tamaño")
         sys.exit(1)
     
-    experiment_num = sys.argv[1].lower()
-    runner = ExperimentRunner()
-    
+    experiment_num = args[0].lower()
+    stream = None
+    if stream_path:
+        max_bytes = int(rotate_mb * 1024 * 1024) if rotate_mb else None
+        stream = TrialStreamWriter(stream_path, fsync=fsync, max_bytes=max_bytes)
+    try:
+        with ResultsStore(store_path) as store:
+            runner = ExperimentRunner(workers=workers or None, seed=seed, store=store, force=force,
+                                      timeout=timeout, memory_limit_mb=memory_limit,
+                                      profile=profile_mode if profile else None,
+                                      profile_dir=profile_dir, stream=stream)
+            run(experiment_num, runner, args[1:])
+            runner.cache_report()
+            runner.profile_report()
+    finally:
+        if stream is not None:
+            stream.close()
+            print(f"Ensayos escritos en flujo: {stream.rows} filas en {stream_path}")
+
+def run(experiment_num, runner, extra_args):
+    """Ejecuta un experimento; los ensayos y resúmenes se anexan al almacén del runner."""
     if experiment_num == "1" or experiment_num == "escalabilidad":
         runner.experimento1_escalabilidad()
-        runner.save_results_to_json("resultados_experimento1.json")
         runner.save_results_to_csv()
     elif experiment_num == "2" or experiment_num == "consistencia":
-        runner.experimento2_consistencia()
-        runner.save_results_to_json("resultados_experimento2.json")
+        # 2 secuencial [tiempo|exito] [anchura]: muestreo secuencial (ver sequential.py)
+        if extra_args and extra_args[0] == "secuencial":
+            criterion = extra_args[1] if len(extra_args) > 1 else "tiempo"
+            target = float(extra_args[2]) if len(extra_args) > 2 else 0.10
+            runner.experimento2_consistencia(sequential=True, criterion=criterion, target=target)
+        else:
+            runner.experimento2_consistencia()
         runner.save_results_to_csv()
     elif experiment_num == "3" or experiment_num == "optimizacion":
         runner.experimento3_optimizacion()
-        runner.save_results_to_json("resultados_experimento3.json")
         runner.save_results_to_csv()
+    elif experiment_num == "estrategias":
+        runner.experimento_estrategias()
+    elif experiment_num == "inicializacion":
+        runner.experimento_inicializacion()
+    elif experiment_num == "confiabilidad":
+        runner.experimento_confiabilidad()
+    elif experiment_num == "reinicios":
+        runner.experimento_reinicios()
+    elif experiment_num == "hibrido":
+        runner.experimento_hibrido()
+    elif experiment_num == "adaptativo":
+        budget = float(extra_args[0]) if extra_args else 1.0
+        runner.experimento_escalabilidad_adaptativa(budget=budget)
+    elif experiment_num == "barrido":
+        if not extra_args:
+            print("Uso: python run_experiments.py barrido <archivo.json>")
+            sys.exit(1)
+        from sweep import load_sweep
+        runner.experimento_barrido(load_sweep(extra_args[0]))
     elif experiment_num == "todos" or experiment_num == "all":
         runner.experimento1_escalabilidad()
         runner.experimento2_consistencia()
         runner.experimento3_optimizacion()
-        runner.save_results_to_json()
         runner.save_results_to_csv()
     else:
         print(f"Experimento '{experiment_num}' no reconocido.")
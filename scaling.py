@@ -0,0 +1,110 @@
+"""
+Ajuste de curvas de crecimiento para el barrido adaptativo de escalabilidad
+
+Se ajustan dos modelos a los puntos (n, y), donde y es el tiempo o el número de
+nodos/iteraciones:
+- exponencial: y = a * exp(b * n)   (log y lineal en n)
+- polinómico:  y = a * n^k          (log y lineal en log n)
+
+Ambos se ajustan por mínimos cuadrados sobre log y, de modo que los puntos
+pequeños y grandes pesan por igual (el error es relativo). La bondad de ajuste
+es el R² en escala logarítmica; el mejor modelo es el de mayor R².
+
+Con el modelo elegido se extrapola el mayor n cuyo valor predicho cabe en un
+presupuesto dado (p. ej. segundos por ensayo).
+"""
+
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+MODELS = ('exponencial', 'polinomico')
+
+
+def fit_model(n_values: List[int], y_values: List[float], model: str) -> Optional[Dict]:
+    """
+    Ajusta un modelo de crecimiento por mínimos cuadrados en escala logarítmica.
+
+    Args:
+        n_values: Tamaños de tablero
+        y_values: Valores medidos (se ignoran los no positivos)
+        model: 'exponencial' o 'polinomico'
+
+    Returns:
+        Diccionario con el modelo, sus parámetros (a y b o k), r2 y puntos
+        usados, o None si hay menos de tres puntos válidos
+    """
+    if model not in MODELS:
+        raise ValueError(f"Modelo desconocido: {model}")
+    points = [(n, y) for n, y in zip(n_values, y_values) if n > 0 and y > 0]
+    if len(points) < 3:
+        return None
+    n = np.array([p[0] for p in points], dtype=float)
+    log_y = np.log([p[1] for p in points])
+    x = n if model == 'exponencial' else np.log(n)
+    slope, intercept = np.polyfit(x, log_y, 1)
+    residual = log_y - (intercept + slope * x)
+    total = np.sum((log_y - log_y.mean()) ** 2)
+    r2 = 1.0 - float(np.sum(residual ** 2) / total) if total > 0 else 0.0
+    fit = {'modelo': model, 'a': math.exp(intercept), 'r2': r2, 'puntos': len(points)}
+    fit['b' if model == 'exponencial' else 'k'] = float(slope)
+    return fit
+
+
+def best_fit(n_values: List[int], y_values: List[float]) -> Optional[Dict]:
+    """
+    Ajusta ambos modelos y devuelve el de mayor R².
+
+    Args:
+        n_values: Tamaños de tablero
+        y_values: Valores medidos
+
+    Returns:
+        Ajuste elegido, con los R² de ambos modelos en 'r2_modelos', o None
+        si no hay puntos suficientes
+    """
+    fits = [fit for fit in (fit_model(n_values, y_values, model) for model in MODELS) if fit]
+    if not fits:
+        return None
+    best = dict(max(fits, key=lambda fit: fit['r2']))
+    best['r2_modelos'] = {fit['modelo']: fit['r2'] for fit in fits}
+    return best
+
+
+def predict(fit: Dict, n: float) -> float:
+    """Valor predicho por un ajuste para un tamaño n."""
+    if fit['modelo'] == 'exponencial':
+        return fit['a'] * math.exp(fit['b'] * n)
+    return fit['a'] * n ** fit['k']
+
+
+def max_n_within(fit: Dict, budget: float) -> Optional[int]:
+    """
+    Mayor n cuyo valor predicho no supera el presupuesto.
+
+    Args:
+        fit: Ajuste de fit_model o best_fit
+        budget: Presupuesto en las unidades de y (p. ej. segundos)
+
+    Returns:
+        Tamaño máximo predicho, o None si el modelo no crece (pendiente <= 0)
+    """
+    slope = fit['b'] if fit['modelo'] == 'exponencial' else fit['k']
+    if slope <= 0:
+        return None
+    log_ratio = math.log(budget / fit['a'])
+    if fit['modelo'] == 'exponencial':
+        return max(0, math.floor(log_ratio / fit['b']))
+    # Evita desbordar math.exp con modelos casi planos
+    exponent = log_ratio / fit['k']
+    return math.floor(math.exp(exponent)) if exponent < 700 else None
+
+
+def describe(fit: Optional[Dict]) -> str:
+    """Fórmula legible de un ajuste (para las tablas)."""
+    if fit is None:
+        return "sin ajuste"
+    if fit['modelo'] == 'exponencial':
+        return f"{fit['a']:.3g}·e^({fit['b']:.3g}·n)  R²={fit['r2']:.3f}"
+    return f"{fit['a']:.3g}·n^{fit['k']:.3g}  R²={fit['r2']:.3f}"
@@ -0,0 +1,108 @@
+"""
+Muestreo secuencial para los experimentos de consistencia
+
+En lugar de un número fijo de ejecuciones, los ensayos se lanzan por lotes y
+después de cada lote se decide si parar:
+- 'precision': el intervalo de confianza del 95% (tiempo medio o tasa de éxito)
+  es más estrecho que la anchura relativa objetivo.
+- 'determinista': las primeras ejecuciones dieron exactamente la misma solución
+  y el mismo número de nodos/iteraciones (p. ej. Backtracking); repetirlas solo
+  mide el ruido del reloj.
+- 'limite': se alcanzó el máximo de ejecuciones.
+
+El intervalo del tiempo medio usa la aproximación normal (media ± z·s/√m); el
+de la tasa de éxito es el de Wilson, que se comporta bien cerca de 0 y de 1.
+"""
+
+import math
+import statistics
+from typing import List, Optional, Sequence, Tuple
+
+# z para un intervalo de confianza bilateral del 95%
+Z_95 = 1.959964
+
+CRITERIA = ('tiempo', 'exito')
+
+
+def mean_ci(values: Sequence[float], z: float = Z_95) -> Tuple[float, float]:
+    """
+    Intervalo de confianza de la media por aproximación normal.
+
+    Args:
+        values: Muestras
+        z: Cuantil de la normal estándar
+
+    Returns:
+        Tupla (límite inferior, límite superior); con una muestra el intervalo es degenerado
+    """
+    mean = statistics.mean(values)
+    if len(values) < 2:
+        return mean, mean
+    half_width = z * statistics.stdev(values) / math.sqrt(len(values))
+    return mean - half_width, mean + half_width
+
+
+def wilson_ci(successes: int, total: int, z: float = Z_95) -> Tuple[float, float]:
+    """
+    Intervalo de confianza de Wilson para una proporción.
+
+    Args:
+        successes: Éxitos
+        total: Ensayos
+        z: Cuantil de la normal estándar
+
+    Returns:
+        Tupla (límite inferior, límite superior) dentro de [0, 1]
+    """
+    if total == 0:
+        return 0.0, 1.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def relative_width(interval: Tuple[float, float], reference: float) -> float:
+    """Anchura del intervalo relativa a reference (infinita si reference es 0)."""
+    width = interval[1] - interval[0]
+    return width / abs(reference) if reference else math.inf
+
+
+def stop_reason(times: List[float], successes: List[bool], outcomes: List[tuple],
+                criterion: str = 'tiempo', target: float = 0.10, min_runs: int = 5,
+                max_runs: int = 1000, deterministic_runs: int = 3) -> Optional[str]:
+    """
+    Decide si el muestreo secuencial debe parar.
+
+    Args:
+        times: Tiempos de las ejecuciones hasta ahora
+        successes: Si cada ejecución encontró solución
+        outcomes: Resultado comparable de cada ejecución (p. ej. (solución, nodos))
+        criterion: 'tiempo' (IC del tiempo medio, anchura relativa a la media) o
+            'exito' (IC de Wilson de la tasa de éxito, anchura absoluta)
+        target: Anchura máxima del intervalo
+        min_runs: Ejecuciones mínimas antes de evaluar la precisión
+        max_runs: Ejecuciones máximas
+        deterministic_runs: Ejecuciones idénticas que bastan para declarar el
+            algoritmo determinista
+
+    Returns:
+        'determinista', 'precision', 'limite' o None si hay que seguir
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"Criterio desconocido: {criterion}")
+    runs = len(times)
+    if runs >= deterministic_runs and len(set(outcomes)) == 1:
+        return 'determinista'
+    if runs >= min_runs:
+        if criterion == 'tiempo':
+            width = relative_width(mean_ci(times), statistics.mean(times))
+        else:
+            lower, upper = wilson_ci(sum(successes), runs)
+            width = upper - lower
+        if width <= target:
+            return 'precision'
+    if runs >= max_runs:
+        return 'limite'
+    return None
@@ -0,0 +1,57 @@
+"""
+Construcción de solvers a partir de la descripción de un ensayo
+
+Trial y make_solver están separados de experiments.py para que resolver un
+tablero suelto (run_experiments.py solve) no cargue el ejecutor de experimentos.
+experiments.py los reexporta.
+"""
+
+from typing import Any, NamedTuple, Optional, Tuple
+
+from backtracking import BacktrackingNQueens
+from hill_climbing import HillClimbingNQueens, make_restart_policy, make_strategy
+from hybrid import HybridNQueens
+
+
+class Trial(NamedTuple):
+    """Ensayo independiente de un experimento."""
+    algorithm: str          # 'hill_climbing', 'backtracking' o 'hybrid'
+    n: int
+    variant: str            # 'original', 'random_restart' u 'optimizada' (o una etiqueta)
+    seed: Optional[int]     # Semilla del módulo random (None = sin fijar)
+    repetition: int = 0     # Número de ensayos idénticos anteriores en el experimento
+    options: Tuple[Tuple[str, Any], ...] = ()   # Parámetros del constructor (nombre, valor)
+
+
+def make_solver(trial: Trial):
+    """
+    Construye el solver correspondiente a un ensayo.
+    
+    La variante fija los parámetros por defecto y trial.options los sustituye.
+    En Hill Climbing, 'strategy' y 'restart_policy' se indican por nombre (con
+    'strategy_params' para los parámetros de la estrategia). Una variante que
+    no es ninguna de las conocidas solo etiqueta el ensayo en el almacén y en
+    el flujo de salida, y usa los valores por defecto de 'original'.
+    
+    Args:
+        trial: Ensayo a ejecutar
+        
+    Returns:
+        Instancia de HillClimbingNQueens, BacktrackingNQueens o HybridNQueens
+    """
+    options = dict(trial.options)
+    if trial.algorithm == 'hill_climbing':
+        if 'strategy' in options:
+            options['strategy'] = make_strategy(options['strategy'],
+                                                **dict(options.pop('strategy_params', ())))
+        if 'restart_policy' in options:
+            options['restart_policy'] = make_restart_policy(options['restart_policy'])
+        defaults = ({'use_random_restart': True, 'max_restarts': 50}
+                    if trial.variant == 'random_restart' else {'use_random_restart': False})
+        return HillClimbingNQueens(trial.n, **{**defaults, **options})
+    if trial.algorithm == 'backtracking':
+        defaults = {'use_optimized_pruning': trial.variant == 'optimizada'}
+        return BacktrackingNQueens(trial.n, **{**defaults, **options})
+    if trial.algorithm == 'hybrid':
+        return HybridNQueens(trial.n, **options)
+    raise ValueError(f"Algoritmo desconocido: {trial.algorithm}")
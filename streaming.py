@@ -0,0 +1,177 @@
+"""
+Escritura en flujo de los ensayos a CSV o JSONL
+
+Cada ensayo se escribe como una fila en cuanto termina, así que la memoria no
+crece con la longitud del barrido y una corrida interrumpida deja un archivo
+válido:
+- Cada fila se escribe completa y se vacía el búfer de Python (flush).
+- Política de fsync: 'never' (el sistema operativo decide), 'interval' (como
+  mucho una vez cada fsync_interval segundos) o 'each' (tras cada fila: lo más
+  seguro ante un corte de luz, pero lo más lento).
+- Rotación atómica: al superar max_bytes el archivo se cierra y se renombra con
+  os.replace (archivo.1, archivo.2, ...; se conservan `backups` copias), y se
+  abre uno nuevo (con cabecera si es CSV). Un lector nunca ve un archivo a medias.
+- Al reabrir un archivo existente se descarta una última línea incompleta (un
+  proceso muerto a mitad de escritura) y se continúa anexando.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Sequence
+
+FSYNC_POLICIES = ('never', 'interval', 'each')
+
+# Columnas de cada ensayo (las de CSV; JSONL usa las mismas claves)
+TRIAL_FIELDS = ('experimento', 'algoritmo', 'n', 'variante', 'semilla', 'repeticion',
+                'solucion_encontrada', 'tiempo', 'iteraciones_nodos', 'estado',
+                'memoria_pico_mb', 'cache')
+
+
+class TrialStreamWriter:
+    """Escritor de filas de ensayos con flush por fila, fsync configurable y rotación."""
+
+    def __init__(self, path: str, fields: Sequence[str] = TRIAL_FIELDS,
+                 fsync: str = 'interval', fsync_interval: float = 1.0,
+                 max_bytes: Optional[int] = None, backups: int = 5):
+        """
+        Abre (o continúa) el archivo de salida.
+
+        Args:
+            path: Archivo de salida; la extensión .csv elige CSV y cualquier otra JSONL
+            fields: Columnas de cada fila
+            fsync: Política de fsync: 'never', 'interval' o 'each'
+            fsync_interval: Segundos mínimos entre fsync con la política 'interval'
+            max_bytes: Tamaño a partir del cual se rota el archivo (None = sin rotación)
+            backups: Archivos rotados que se conservan
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Política de fsync desconocida: {fsync}")
+        self.path = path
+        self.fields = list(fields)
+        self.csv = path.lower().endswith('.csv')
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rows = 0
+        self._last_sync = time.monotonic()
+        self._repair_tail()
+        self._open()
+
+    def _repair_tail(self) -> None:
+        """Trunca el archivo tras la última línea completa (escritura interrumpida)."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, io.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+            # Busca el último salto de línea en bloques desde el final
+            position = size
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b'\n')
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    return
+                position = start
+            f.truncate(0)
+
+    def _open(self) -> None:
+        """Abre el archivo en modo anexar, escribiendo la cabecera CSV si está vacío."""
+        self._file = open(self.path, 'a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file) if self.csv else None
+        if self.csv and self._file.tell() == 0:
+            self._writer.writerow(self.fields)
+            self._file.flush()
+
+    def _sync(self, force: bool = False) -> None:
+        if self.fsync == 'never' and not force:
+            return
+        now = time.monotonic()
+        if force or self.fsync == 'each' or now - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """
+        Escribe una fila y la vacía al sistema operativo (y al disco según la política).
+
+        Args:
+            row: Valores por columna (las columnas ausentes quedan vacías)
+        """
+        if self.csv:
+            self._writer.writerow([row.get(field, '') for field in self.fields])
+        else:
+            record = {field: row.get(field) for field in self.fields}
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        self._sync()
+        self.rows += 1
+        if self.max_bytes is not None and self._file.tell() >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self) -> None:
+        """Cierra el archivo actual, lo renombra a path.1 (desplazando los anteriores) y abre uno nuevo."""
+        self._sync(force=True)
+        self._file.close()
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                older = f"{self.path}.{i}"
+                if os.path.exists(older):
+                    os.replace(older, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def close(self) -> None:
+        """Sincroniza y cierra el archivo."""
+        if not self._file.closed:
+            self._sync(force=True)
+            self._file.close()
+
+    def __enter__(self) -> 'TrialStreamWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def trial_row(experiment: Optional[str], trial, stats: dict, memory: Optional[dict],
+              cached: bool = False) -> Dict[str, Any]:
+    """
+    Fila de TRIAL_FIELDS para un ensayo.
+
+    Args:
+        experiment: Clave del experimento (o None)
+        trial: Ensayo (experiments.Trial)
+        stats: Estadísticas del solver
+        memory: Medición de memoria (o None)
+        cached: Si el resultado se tomó de la caché
+
+    Returns:
+        Diccionario columna -> valor
+    """
+    return {
+        'experimento': experiment,
+        'algoritmo': trial.algorithm,
+        'n': trial.n,
+        'variante': trial.variant,
+        'semilla': trial.seed,
+        'repeticion': trial.repetition,
+        'solucion_encontrada': stats.get('solution_found'),
+        'tiempo': stats.get('execution_time'),
+        'iteraciones_nodos': stats.get('nodes_explored', stats.get('iterations')),
+        'estado': stats.get('estado', 'ok'),
+        'memoria_pico_mb': memory['pico_mb'] if memory else None,
+        'cache': cached
+    }
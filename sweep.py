@@ -0,0 +1,171 @@
+"""
+Barridos declarativos de parámetros para los experimentos de N-Reinas
+
+Un barrido se describe con un JSON (o un diccionario equivalente) que define
+una o más rejillas sobre algoritmos, variantes, valores de n, semillas y
+repeticiones:
+
+    {
+      "experimento": "barrido_hc",
+      "rejillas": [
+        {
+          "algoritmos": ["hill_climbing"],
+          "variantes": ["original", "random_restart"],
+          "n": {"inicio": 8, "fin": 64, "paso": 8},
+          "semillas": {"inicio": 0, "cantidad": 20},
+          "repeticiones": 1
+        },
+        {"algoritmos": ["backtracking"], "variantes": ["original"], "n": [8, 12, 16]}
+      ]
+    }
+
+- "n" y "semillas" aceptan una lista o un rango ({"inicio", "fin", "paso"} con
+  fin incluido, o {"inicio", "cantidad"}).
+- Sin "semillas" los ensayos no fijan semilla.
+- expand_sweep() genera los ensayos de forma perezosa (itertools.product sobre
+  los ejes), de modo que un barrido de miles de configuraciones nunca construye
+  la lista completa de ensayos.
+"""
+
+import itertools
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from solvers import Trial
+
+# Variantes disponibles de cada algoritmo (ver solvers.make_solver)
+VARIANTS = {
+    'hill_climbing': ('original', 'random_restart'),
+    'backtracking': ('original', 'optimizada'),
+    'hybrid': ('original',)
+}
+
+_GRID_KEYS = {'algoritmos', 'variantes', 'n', 'semillas', 'repeticiones'}
+
+
+def load_sweep(filename: str) -> Dict[str, Any]:
+    """
+    Carga y valida una especificación de barrido desde un JSON.
+
+    Args:
+        filename: Ruta del archivo
+
+    Returns:
+        Especificación validada
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    validate_sweep(spec)
+    return spec
+
+
+def _axis(value: Union[None, int, List[int], Dict[str, int]], name: str) -> Optional[range]:
+    """
+    Convierte un eje numérico (lista o rango) en un iterable sin materializarlo.
+
+    Args:
+        value: Lista, entero, o diccionario {"inicio", "fin", "paso"} / {"inicio", "cantidad"}
+        name: Nombre del eje (para los mensajes de error)
+
+    Returns:
+        range o lista de enteros (None si value es None)
+    """
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return [value]
+    if isinstance(value, list):
+        if not all(isinstance(v, int) for v in value):
+            raise ValueError(f"'{name}' debe contener enteros: {value}")
+        return value
+    if isinstance(value, dict):
+        start = value.get('inicio', 0)
+        step = value.get('paso', 1)
+        if 'cantidad' in value:
+            return range(start, start + value['cantidad'] * step, step)
+        if 'fin' in value:
+            return range(start, value['fin'] + 1, step)
+        raise ValueError(f"El rango '{name}' necesita 'fin' o 'cantidad': {value}")
+    raise ValueError(f"Formato no válido para '{name}': {value}")
+
+
+def validate_sweep(spec: Dict[str, Any]) -> None:
+    """
+    Verifica una especificación de barrido (lanza ValueError si no es válida).
+
+    Args:
+        spec: Especificación con la clave 'rejillas'
+    """
+    grids = spec.get('rejillas')
+    if not isinstance(grids, list) or not grids:
+        raise ValueError("La especificación necesita una lista no vacía 'rejillas'")
+    for grid in grids:
+        unknown = set(grid) - _GRID_KEYS
+        if unknown:
+            raise ValueError(f"Claves desconocidas en la rejilla: {sorted(unknown)}")
+        if 'n' not in grid:
+            raise ValueError("Cada rejilla necesita 'n'")
+        # Sin 'algoritmos' la rejilla incluye todos (igual que en expand_sweep)
+        for algorithm in grid.get('algoritmos', list(VARIANTS)):
+            if algorithm not in VARIANTS:
+                raise ValueError(f"Algoritmo desconocido: {algorithm}")
+            for variant in grid.get('variantes', ('original',)):
+                if variant not in VARIANTS[algorithm]:
+                    raise ValueError(f"Variante '{variant}' no disponible para {algorithm}")
+        _axis(grid['n'], 'n')
+        _axis(grid.get('semillas'), 'semillas')
+        if grid.get('repeticiones', 1) < 1:
+            raise ValueError("'repeticiones' debe ser al menos 1")
+
+
+def expand_sweep(spec: Dict[str, Any]) -> Iterator[Trial]:
+    """
+    Genera perezosamente los ensayos de un barrido.
+
+    El orden es: rejilla, algoritmo, variante, n, semilla, repetición.
+
+    Args:
+        spec: Especificación validada
+
+    Returns:
+        Iterador de ensayos
+    """
+    for grid in spec['rejillas']:
+        algorithms = grid.get('algoritmos', list(VARIANTS))
+        variants = grid.get('variantes', ['original'])
+        n_values = _axis(grid['n'], 'n')
+        seeds = _axis(grid.get('semillas'), 'semillas') or [None]
+        repetitions = range(grid.get('repeticiones', 1))
+        for algorithm, variant, n, seed, repetition in itertools.product(
+                algorithms, variants, n_values, seeds, repetitions):
+            yield Trial(algorithm, n, variant, seed, repetition)
+
+
+def count_trials(spec: Dict[str, Any]) -> int:
+    """Número total de ensayos del barrido, sin generarlos."""
+    total = 0
+    for grid in spec['rejillas']:
+        seeds = _axis(grid.get('semillas'), 'semillas')
+        total += (len(grid.get('algoritmos', VARIANTS)) * len(grid.get('variantes', ['original']))
+                  * len(_axis(grid['n'], 'n')) * (len(seeds) if seeds is not None else 1)
+                  * grid.get('repeticiones', 1))
+    return total
+
+
+def chunked(trials: Iterable[Trial], size: int) -> Iterator[List[Trial]]:
+    """
+    Agrupa un flujo de ensayos en bloques de tamaño acotado.
+
+    Args:
+        trials: Flujo de ensayos
+        size: Tamaño máximo de cada bloque
+
+    Returns:
+        Iterador de listas de ensayos
+    """
+    iterator = iter(trials)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
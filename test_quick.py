@@ -2,8 +2,23 @@
 Script de prueba rápida para verificar que los algoritmos funcionan correctamente.
 """
 
-from hill_climbing import HillClimbingNQueens
+import random
+import re
+
+import pytest
+
+from hill_climbing import (HillClimbingNQueens, ConflictEvaluator, STRATEGIES, RESTART_POLICIES,
+                           make_strategy, make_restart_policy, luby)
 from backtracking import BacktrackingNQueens
+from board import Board
+from batch_hill_climbing import BatchHillClimbingNQueens
+from huge_local_search import HugeNQueensLocalSearch, smallest_typecode
+from hybrid import HybridNQueens
+from experiments import ExperimentRunner
+from benchmark import measure, compare, median_ci
+from results_store import ResultsStore
+from solvers import Trial
+from sweep import expand_sweep, count_trials
 
 def test_algorithms():
     print("="*60)
@@ -53,6 +68,460 @@ def test_algorithms():
     print("PRUEBAS COMPLETADAS")
     print("="*60)
 
+def test_conflict_evaluator():
+    """El evaluador incremental coincide con el cálculo completo de conflictos."""
+    n = 8
+    hc = HillClimbingNQueens(n)
+    board = hc.generate_random_state()
+    evaluator = ConflictEvaluator(n, board)
+    assert evaluator.conflicts == hc.calculate_conflicts(board)
+    for _ in range(50):
+        col, row = random.randrange(n), random.randrange(n)
+        expected = evaluator.conflicts + evaluator.delta(col, row)
+        evaluator.move(col, row)
+        assert evaluator.conflicts == expected == hc.calculate_conflicts(evaluator.to_list())
+
+
+def test_strategies():
+    """Todas las estrategias devuelven tableros válidos y estadísticas coherentes."""
+    for name in STRATEGIES:
+        hc = HillClimbingNQueens(8, strategy=make_strategy(name))
+        solution, stats = hc.solve()
+        assert stats['strategy'] == name
+        assert stats['conflicts'] == hc.calculate_conflicts(solution)
+        hc = HillClimbingNQueens(8, strategy=make_strategy(name), use_permutation=True)
+        solution, stats = hc.solve()
+        assert stats['representation'] == 'permutation'
+        assert sorted(solution) == list(range(8))
+
+def test_board_snapshot():
+    """Board exporta/importa listas y restaura instantáneas con sus contadores."""
+    board = Board.from_list([1, 3, 0, 2])
+    assert board.conflicts == 0 and board.to_list() == [1, 3, 0, 2]
+    snap = board.snapshot()
+    view = board.view()
+    board.move(0, 0)
+    assert board.conflicts > 0 and view[0] == 0
+    board.restore(snap)
+    assert board.conflicts == 0 and board.to_list() == [1, 3, 0, 2]
+    # Posiciones (n, 4 bytes) + filas (n) + dos familias de diagonales (2n - 1 cada una),
+    # con contadores de 2 bytes para n = 1000 y de 1 byte para n = 100
+    assert Board(1000).nbytes == 4 * 1000 + 2 * (1000 + 2 * 1999)
+    assert Board(100).nbytes == 4 * 100 + 100 + 2 * 199
+
+def test_greedy_initialization():
+    """La inicialización voraz genera permutaciones con pocos conflictos."""
+    n = 200
+    hc = HillClimbingNQueens(n, use_greedy_init=True)
+    state = hc.generate_greedy_state()
+    assert sorted(state) == list(range(n))
+    assert Board(n, state).conflicts < Board(n, hc.generate_random_state()).conflicts
+    solution, stats = HillClimbingNQueens(8, use_greedy_init=True).solve()
+    assert stats['initialization'] == 'greedy'
+
+def test_batch_hill_climbing():
+    """El modo por lotes devuelve estadísticas coherentes por tablero."""
+    n = 8
+    boards, stats = BatchHillClimbingNQueens(n, 50, seed=0).solve()
+    assert boards.shape == (50, n)
+    for board, conflicts, found in zip(boards, stats['conflicts'], stats['solution_found']):
+        assert Board(n, board.tolist()).conflicts == conflicts
+        assert found == (conflicts == 0)
+
+def test_progress_and_trajectory():
+    """El callback de progreso se invoca y la trayectoria respeta su tamaño."""
+    events = []
+    hc = HillClimbingNQueens(12, strategy=make_strategy('annealing'),
+                             progress_callback=events.append, progress_every=5,
+                             trajectory_size=8)
+    solution, stats = hc.solve()
+    assert len(stats['trajectory']) == min(8, stats['iterations'] + 1)
+    assert stats['trajectory'][-1] == stats['conflicts'] or not stats['solution_found']
+    assert all(e['best_conflicts'] <= e['conflicts'] for e in events)
+    assert all(e['iteration'] % 5 == 0 for e in events)
+
+def test_restart_policies():
+    """Las políticas de reinicio y el presupuesto de tiempo limitan cada ejecución."""
+    assert [luby(i) for i in range(1, 8)] == [1, 1, 2, 1, 1, 2, 4]
+    for name in RESTART_POLICIES:
+        hc = HillClimbingNQueens(10, use_random_restart=True, max_restarts=200,
+                                 strategy=make_strategy('sideways', max_sideways=10000),
+                                 restart_policy=make_restart_policy(name))
+        solution, stats = hc.solve()
+        assert stats['restart_policy'] == name
+    hc = HillClimbingNQueens(200, use_random_restart=True, max_restarts=5,
+                             strategy=make_strategy('sideways'), time_budget=0.05)
+    solution, stats = hc.solve()
+    assert stats['execution_time'] < 1.0
+
+def test_huge_n_local_search():
+    """El modo de n grande usa buffers compactos y resuelve tableros medianos."""
+    assert smallest_typecode(100) == 'b' and smallest_typecode(40000) == 'i'
+    n = 2000
+    solution, stats = HugeNQueensLocalSearch(n).solve()
+    assert stats['solution_found'] and Board(n, solution).conflicts == 0
+    assert stats['board_typecode'] == 'h' and stats['peak_memory_mb'] > 0
+
+def test_hybrid_solver():
+    """El prefijo por Backtracking se respeta y el híbrido completa el tablero."""
+    board, stats = BacktrackingNQueens(12, max_nodes=100000).solve_prefix(6)
+    assert board is not None and board.conflicts == 0
+    assert all(board[col] >= 0 for col in range(6)) and board[6] == -1
+    solution, stats = BacktrackingNQueens(20, max_nodes=50).solve()
+    assert not stats['solution_found'] and stats['budget_exhausted']
+    n = 100
+    solution, stats = HybridNQueens(n).solve()
+    assert stats['solution_found'] and Board(n, solution).conflicts == 0
+    assert stats['prefix_size'] == n // 4
+
+def test_parallel_trials():
+    """Con semilla fija, el pool de procesos da los mismos resultados en el mismo orden."""
+    specs = [('hill_climbing', 8, 'original'), ('hill_climbing', 8, 'random_restart'),
+             ('backtracking', 8, 'optimizada')] * 2
+    sequential = ExperimentRunner(workers=1, seed=7)
+    parallel = ExperimentRunner(workers=2, seed=7)
+    a = sequential.run_trials(sequential.make_trials(specs))
+    b = parallel.run_trials(parallel.make_trials(specs))
+    assert [(sol, st.get('iterations')) for sol, st, _ in a] == [(sol, st.get('iterations')) for sol, st, _ in b]
+
+def test_benchmark_harness():
+    """El arnés respeta las repeticiones mínimas y detecta regresiones."""
+    summary = measure('backtracking', 6, 'original', warmup=1, min_reps=3, max_reps=3, min_time=0)
+    assert summary['repeticiones'] == 3 and summary['q1_ns'] <= summary['mediana_ns'] <= summary['q3_ns']
+    assert median_ci(list(range(100))) == (40, 59)
+    base = {'resultados': {'a': {'mediana_ns': 100, 'ic95_ns': [90, 110]}}}
+    slow = {'resultados': {'a': {'mediana_ns': 200, 'ic95_ns': [180, 220]}}}
+    assert compare(base, slow)[0]['regresion'] and not compare(base, base)[0]['regresion']
+
+def test_trial_memory_subprocess():
+    """La memoria se mide en un subproceso nuevo con tracemalloc y líneas calientes."""
+    runner = ExperimentRunner(seed=0)
+    (solution, stats, mem), = runner.run_trials(runner.make_trials([('backtracking', 10, 'original')]),
+                                                track_memory=True)
+    assert stats['solution_found'] and mem['pico_mb'] > 0
+    assert mem['lineas_calientes'] and all(l['archivo'] != 'experiments.py' for l in mem['lineas_calientes'])
+
+def test_results_store():
+    """Cada ensayo se anexa al terminar y las consultas toman el resumen más reciente."""
+    with ResultsStore(':memory:') as store:
+        runner = ExperimentRunner(seed=1, store=store)
+        runner.run_trials(runner.make_trials([('backtracking', 6, 'original'),
+                                              ('hill_climbing', 6, 'original')]), experiment='prueba')
+        assert store.count_trials('prueba') == 2
+        (row,) = store.iter_trials(experiment='prueba', algorithm='backtracking', n=6)
+        assert row['record']['estadisticas']['solution_found']
+        store.append_summary('prueba', {'version': 1})
+        store.append_summary('prueba', {'version': 2})
+        assert store.latest_results() == {'prueba': {'version': 2}}
+
+def test_trial_cache():
+    """Los ensayos ya almacenados no se repiten salvo con force=True."""
+    specs = [('hill_climbing', 8, 'original')] * 3
+    with ResultsStore(':memory:') as store:
+        first = ExperimentRunner(store=store)
+        a = first.run_trials(first.make_trials(specs), experiment='cache')
+        assert [t.repetition for t in first.make_trials(specs)] == [0, 1, 2]
+        second = ExperimentRunner(store=store)
+        b = second.run_trials(second.make_trials(specs), experiment='cache')
+        assert second.cache_stats['cache'] == [3, 0] and a == b
+        forced = ExperimentRunner(store=store, force=True)
+        forced.run_trials(forced.make_trials(specs), experiment='cache')
+        assert forced.cache_stats['cache'] == [0, 3] and store.count_trials('cache') == 6
+
+def test_declarative_sweep():
+    """Las rejillas se expanden de forma perezosa y el barrido agrega por configuración."""
+    spec = {'experimento': 'mini', 'rejillas': [
+        {'algoritmos': ['hill_climbing'], 'variantes': ['original', 'random_restart'],
+         'n': {'inicio': 6, 'fin': 8, 'paso': 2}, 'semillas': {'inicio': 0, 'cantidad': 3}},
+        {'algoritmos': ['backtracking'], 'n': [6], 'repeticiones': 2}]}
+    trials = expand_sweep(spec)
+    assert next(trials) == Trial('hill_climbing', 6, 'original', 0, 0)
+    assert count_trials(spec) == 14 == 1 + sum(1 for _ in trials)
+    results = ExperimentRunner().experimento_barrido(spec, chunk_size=4)
+    assert len(results) == 5 and sum(r['ejecuciones'] for r in results) == 14
+
+def test_sweep_default_algorithms():
+    """Sin 'algoritmos' se validan las variantes contra todos los algoritmos."""
+    from sweep import validate_sweep
+    with pytest.raises(ValueError):
+        validate_sweep({'rejillas': [{'n': [8], 'variantes': ['optimizada']}]})
+    spec = {'rejillas': [{'algoritmos': ['hybrid'], 'n': [6]}]}
+    validate_sweep(spec)
+    assert list(expand_sweep(spec)) == [Trial('hybrid', 6, 'original', None, 0)]
+
+def test_trial_timeout():
+    """Un ensayo que supera el límite de tiempo se mata y el resto continúa."""
+    from experiments import Trial
+    runner = ExperimentRunner(timeout=0.5, memory_limit_mb=500)
+    slow, fast = runner.run_trials([Trial('backtracking', 32, 'original', None),
+                                    Trial('backtracking', 8, 'original', None)])
+    assert slow[1]['estado'] == 'timeout' and not slow[1]['solution_found']
+    assert fast[1]['solution_found'] and 'estado' not in fast[1]
+
+def test_experimento1_timeout(tmp_path, monkeypatch):
+    """Si Backtracking supera el límite, el Experimento 1 sigue y su memoria queda como N/A."""
+    monkeypatch.chdir(tmp_path)
+    with ResultsStore(':memory:') as store:
+        runner = ExperimentRunner(store=store, timeout=1.0)
+        results_hc, results_bt = runner.experimento1_escalabilidad(n_values=[8, 32], hc_attempts=1)
+    assert results_bt[0]['memoria'] is not None and results_hc[0]['lineas_calientes']
+    assert not results_bt[1]['solucion_encontrada']
+    assert results_bt[1]['memoria'] is None and results_bt[1]['lineas_calientes'] is None
+    runner.save_results_to_csv()
+    rows = (tmp_path / 'experimento1_escalabilidad.csv').read_text().splitlines()
+    assert rows[-1].startswith('32,Backtracking,') and ',N/A,' in rows[-1]
+
+def test_profiling_mode(tmp_path):
+    """El modo de perfilado escribe .pstats y .folded por configuración."""
+    from experiments import Trial
+    runner = ExperimentRunner(profile='cprofile', profile_dir=str(tmp_path))
+    (solution, stats, _), = runner.run_trials([Trial('backtracking', 14, 'original', 0)], experiment='exp')
+    assert stats['solution_found']
+    profile = runner.profiler.profiles[('exp', 'backtracking', 14, 'original')]
+    assert 'backtracking:is_safe' in [row[0] for row in profile.top_functions()]
+    written = profile.write(str(tmp_path / 'bt'))
+    assert written[0].endswith('.pstats')
+    if len(written) > 1:
+        assert all(line.startswith('experiments:run_trial') for line in open(written[1]))
+
+def test_adaptive_scaling():
+    """Los ajustes recuperan el modelo de crecimiento y el barrido adaptativo se detiene."""
+    import math
+    from scaling import best_fit, max_n_within
+    n_values = [4, 6, 8, 10, 12]
+    fit = best_fit(n_values, [0.001 * math.exp(0.5 * n) for n in n_values])
+    assert fit['modelo'] == 'exponencial' and abs(fit['b'] - 0.5) < 1e-9 and fit['r2'] > 0.999
+    assert max_n_within(fit, 1.0) == math.floor(math.log(1000) / 0.5)
+    assert best_fit(n_values, [2 * n ** 3 for n in n_values])['modelo'] == 'polinomico'
+    runner = ExperimentRunner()
+    result, = runner.experimento_escalabilidad_adaptativa(
+        configs=[('backtracking', 'original')], budget=0.001, max_n=16)
+    assert result['puntos'] and result['puntos'][-1]['n'] <= 16 and runner.timeout is None
+
+def test_sequential_stopping():
+    """El muestreo secuencial detecta algoritmos deterministas y respeta el máximo."""
+    from sequential import stop_reason, wilson_ci
+    low, high = wilson_ci(10, 10)
+    assert 0.6 < low < 1 and high > 0.999
+    assert stop_reason([0.1, 0.2, 0.3], [True] * 3, [((0, 1), 5)] * 3) == 'determinista'
+    assert stop_reason([0.1, 0.3] * 3, [True] * 6, list(range(6)), max_runs=6) == 'limite'
+    runner = ExperimentRunner(seed=1)
+    _, bt_results, hc_stats, bt_stats = runner.experimento2_consistencia(
+        sequential=True, target=0.5, max_runs=40)
+    assert bt_stats['parada'] == 'determinista' and len(bt_results) == 5
+    assert hc_stats['ejecuciones'] <= 40 and hc_stats['parada'] in ('precision', 'limite')
+    low, high = hc_stats['tiempo_ic95']
+    assert low <= hc_stats['tiempo_promedio'] <= high
+
+def test_streaming_writer(tmp_path):
+    """Cada ensayo se escribe al terminar; una línea cortada se descarta y el archivo rota."""
+    import json
+    from experiments import Trial
+    from streaming import TrialStreamWriter
+    path = tmp_path / 'ensayos.jsonl'
+    with TrialStreamWriter(str(path), fsync='each') as stream:
+        ExperimentRunner(stream=stream).run_trials([Trial('backtracking', 6, 'original', None)] * 2,
+                                                   experiment='exp')
+        assert stream.rows == 2
+    with open(path, 'a') as f:
+        f.write('{"experimento": "cortado"')
+    with TrialStreamWriter(str(path), max_bytes=1) as stream:
+        assert [json.loads(line)['n'] for line in open(path)] == [6, 6]
+        stream.write({'n': 8})
+    assert (tmp_path / 'ensayos.jsonl.1').exists() and path.read_text() == ''
+    csv_path = tmp_path / 'ensayos.csv'
+    with TrialStreamWriter(str(csv_path)) as stream:
+        stream.write({'algoritmo': 'backtracking', 'n': 8})
+    assert csv_path.read_text().splitlines()[1].startswith(',backtracking,8')
+
+def test_streaming_profile_and_memory_pass(tmp_path):
+    """La pasada de memoria no duplica filas y los ensayos perfilados también se escriben."""
+    import json
+    from experiments import Trial
+    from streaming import TrialStreamWriter
+    path = tmp_path / 'ensayos.jsonl'
+    with TrialStreamWriter(str(path)) as stream:
+        ExperimentRunner(stream=stream).experimento1_escalabilidad(n_values=[4], hc_attempts=2)
+        assert stream.rows == 3
+        runner = ExperimentRunner(stream=stream, profile='cprofile', profile_dir=str(tmp_path / 'perfiles'))
+        runner.run_trials([Trial('backtracking', 6, 'original', None)] * 2, experiment='perfilado')
+        assert stream.rows == 5
+    rows = [json.loads(line) for line in open(path)]
+    assert [row['experimento'] for row in rows] == ['experimento1'] * 3 + ['perfilado'] * 2
+
+def test_benchmarks_use_trials(tmp_path):
+    """Los benchmarks pasan por run_trials: almacén, caché y flujo de salida."""
+    import json
+    from streaming import TrialStreamWriter
+    path = tmp_path / 'ensayos.jsonl'
+    with ResultsStore(':memory:') as store, TrialStreamWriter(str(path)) as stream:
+        runner = ExperimentRunner(store=store, stream=stream)
+        first = runner.experimento_estrategias(n_values=[6], num_runs=2,
+                                               strategies={'sideways': {'max_sideways': 10}})
+        cached = ExperimentRunner(store=store)
+        again = cached.experimento_estrategias(n_values=[6], num_runs=2,
+                                               strategies={'sideways': {'max_sideways': 10}})
+        assert cached.cache_stats['estrategias'] == [2, 0]
+        assert again[0]['tasa_exito'] == first[0]['tasa_exito']
+        inicial = runner.experimento_inicializacion(n_values=[8], num_runs=2)
+        runner.experimento_reinicios(n_values=[6], num_runs=1, max_restarts=20)
+        hibrido = runner.experimento_hibrido(n_values=[8], num_runs=1, bt_max_nodes=1000)
+    assert all(r['conflictos_iniciales_promedio'] is not None for r in inicial)
+    assert [r['algoritmo'] for r in hibrido] == ['hibrido', 'hill_climbing', 'backtracking']
+    rows = [json.loads(line) for line in open(path)]
+    assert [row['variante'] for row in rows[:2]] == ['sideways'] * 2
+    assert {row['experimento'] for row in rows} == {'estrategias', 'inicializacion',
+                                                    'reinicios', 'hibrido'}
+
+def test_board_rendering_lod():
+    """El tablero se dibuja con un número constante de artistas para cualquier n."""
+    import random
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from visualization import choose_detail, draw_board
+    assert [choose_detail(n) for n in (8, 500, 10000)] == ['detalle', 'pixeles', 'densidad']
+    for n in (8, 500, 10000):
+        fig, ax = plt.subplots()
+        draw_board(ax, random.sample(range(n), n), n)
+        assert len(ax.images) == 1 and not ax.patches
+        assert len(ax.collections) == (1 if n == 8 else 0)
+        plt.close(fig)
+
+def test_gallery_rendering(tmp_path):
+    """La galería reparte los tableros en hojas PNG reutilizando la figura."""
+    import random
+    from visualization import GallerySheet, render_gallery
+    boards = [random.sample(range(8), 8) for _ in range(10)]
+    paths = render_gallery(boards, 8, str(tmp_path / 'galeria'), rows=2, cols=3)
+    assert [p.rsplit('_', 1)[1] for p in paths] == ['000.png', '001.png']
+    assert all(open(p, 'rb').read(8) == b'\x89PNG\r\n\x1a\n' for p in paths)
+    sheet = GallerySheet(200, rows=1, cols=2)
+    artists = [id(image) for _, image, _, _ in sheet.tiles]
+    sheet.render([random.sample(range(200), 200)], str(tmp_path / 'h.png'))
+    assert [id(image) for _, image, _, _ in sheet.tiles] == artists
+    assert not sheet.tiles[1][0].get_visible()
+
+def test_incremental_charts(tmp_path, monkeypatch):
+    """Solo se redibujan los gráficos cuyo resumen cambió o cuyos archivos faltan."""
+    import json
+    import os
+    from generar_graficos import regenerar_graficos
+    from results_store import ResultsStore
+    with open('resultados_experimentos.json', encoding='utf-8') as f:
+        exp3 = json.load(f)['experimento3']
+    monkeypatch.chdir(tmp_path)
+    with ResultsStore('r.db') as store:
+        store.append_summary('experimento3', exp3)
+    assert regenerar_graficos('r.db', None, workers=1) == ['grafico_optimizacion']
+    assert regenerar_graficos('r.db', None, workers=1) == []
+    os.remove('grafico_optimizacion_hc.png')
+    assert regenerar_graficos('r.db', None, workers=1) == ['grafico_optimizacion']
+    exp3['hill_climbing'][0]['original']['execution_time'] += 1
+    with ResultsStore('r.db') as store:
+        store.append_summary('experimento3', exp3)
+    assert regenerar_graficos('r.db', None, workers=1) == ['grafico_optimizacion']
+
+def test_incremental_report(tmp_path):
+    """Solo se reescriben las secciones marcadas cuyo resumen cambió; el resto se conserva."""
+    import json
+    from actualizar_reportes import actualizar_reportes
+    from results_store import ResultsStore
+    with open('resultados_experimentos.json', encoding='utf-8') as f:
+        resultados = json.load(f)
+    db = str(tmp_path / 'r.db')
+    tablas = str(tmp_path / 'tablas.md')
+    reporte = tmp_path / 'reporte.md'
+    reporte.write_text("Texto propio\n<!-- seccion:tabla_optimizacion hash= -->\nejemplo\n"
+                       "<!-- fin:tabla_optimizacion -->\nMás texto\n", encoding='utf-8')
+    with ResultsStore(db) as store:
+        for experimento in ('experimento1', 'experimento3'):
+            store.append_summary(experimento, resultados[experimento])
+    cambios = actualizar_reportes(db, None, tablas, str(reporte))
+    assert cambios[tablas] == ['tabla_escalabilidad', 'tabla_optimizacion']
+    assert cambios[str(reporte)] == ['tabla_optimizacion']
+    texto = reporte.read_text(encoding='utf-8')
+    assert texto.startswith("Texto propio\n") and texto.endswith("Más texto\n")
+    assert 'Tabla 4.4' in texto and 'ejemplo' not in texto
+    assert actualizar_reportes(db, None, tablas, str(reporte)) == {tablas: [], str(reporte): []}
+    resultados['experimento3']['hill_climbing'][0]['original']['execution_time'] += 1
+    with ResultsStore(db) as store:
+        store.append_summary('experimento3', resultados['experimento3'])
+    cambios = actualizar_reportes(db, None, tablas, str(reporte))
+    assert cambios == {tablas: ['tabla_optimizacion'], str(reporte): ['tabla_optimizacion']}
+    assert open(tablas, encoding='utf-8').read().count('<!-- seccion:') == 2
+
+def test_solve_cli_import_budget():
+    """`run_experiments.py solve --n 8` no carga módulos pesados e importa todo en menos de 50 ms."""
+    import os
+    import re
+    import subprocess
+    import sys
+    # Con PYTHONDONTWRITEBYTECODE cada importación recompilaría el fuente
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    command = [sys.executable, '-X', 'importtime', 'run_experiments.py', 'solve', '--n', '8']
+    best = None
+    for _ in range(5):
+        result = subprocess.run(command, capture_output=True, text=True, env=env, check=True)
+        assert 'solución encontrada' in result.stdout
+        lines = [re.match(r'import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)', line)
+                 for line in result.stderr.splitlines()]
+        modules = {m.group(3) for m in lines if m}
+        heavy = {'experiments', 'numpy', 'matplotlib', 'sqlite3', 'multiprocessing',
+                 'concurrent.futures', 'tracemalloc', 'statistics', 'cProfile'} & modules
+        assert not heavy, f"Importaciones pesadas en solve: {heavy}"
+        # Tiempo acumulado de las importaciones de primer nivel, en microsegundos
+        total = sum(int(m.group(1)) for m in lines if m and len(m.group(2)) == 1)
+        best = total if best is None else min(best, total)
+    assert best < 50_000, f"Importaciones de solve: {best / 1000:.1f} ms"
+
+def test_report_consistency_unequal_runs():
+    """Tabla 4.3 muestra todas las ejecuciones aunque HC y BT tengan distinto número."""
+    from actualizar_reportes import generar_tabla_experimento2
+    hc = [{'ejecucion': i + 1, 'tiempo': 0.001, 'iteraciones': 5, 'solucion': 'No solución',
+           'solucion_encontrada': False} for i in range(7)]
+    bt = [{'ejecucion': i + 1, 'tiempo': 0.002, 'nodos_explorados': 876, 'solucion': '[0]',
+           'solucion_encontrada': True} for i in range(3)]
+    stats = {'tiempo_promedio': 0.0, 'tiempo_desv_est': 0.0, 'iteraciones_promedio': 5,
+             'iteraciones_desv_est': 0, 'nodos_promedio': 876, 'nodos_desv_est': 0}
+    tabla = generar_tabla_experimento2({'experimento2': {
+        'hill_climbing': hc, 'backtracking': bt, 'estadisticas_hc': stats, 'estadisticas_bt': stats}})
+    filas = [linea for linea in tabla.splitlines() if re.match(r'\| \d+ \|', linea)]
+    assert len(filas) == 7
+    assert filas[2].endswith("| 0.002000 | 876 | Sí |")
+    assert filas[6] == "| 7 | 0.001000 | 5 | No | - | - | - |"
+
+def test_report_scalability_attempts():
+    """Tabla 4.1 usa el número de intentos de HC guardado con los resultados."""
+    from actualizar_reportes import generar_tabla_experimento1
+    runner = ExperimentRunner()
+    runner.experimento1_escalabilidad(n_values=[4], hc_attempts=5)
+    tabla = generar_tabla_experimento1(runner.results)
+    fila = next(linea for linea in tabla.splitlines() if linea.startswith('| 4 |'))
+    assert re.search(r'\| \d/5 \|$', fila)
+
+def test_experiments_main_force(tmp_path, monkeypatch):
+    """`python experiments.py --force` llega al ejecutor y desactiva la caché."""
+    import sys
+    import experiments
+    creados = []
+
+    class EjecutorFalso(experiments.ExperimentRunner):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            creados.append(self)
+
+        def experimento1_escalabilidad(self, *args, **kwargs):
+            raise KeyboardInterrupt
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(experiments, 'ExperimentRunner', EjecutorFalso)
+    monkeypatch.setattr(sys, 'argv', ['experiments.py', '--force'])
+    experiments.main()
+    monkeypatch.setattr(sys, 'argv', ['experiments.py'])
+    experiments.main()
+    assert [runner.force for runner in creados] == [True, False]
+
 if __name__ == "__main__":
     test_algorithms()
 
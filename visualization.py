@@ -3,16 +3,166 @@ Módulo de Visualización para el Problema de las N-Reinas
 
 Este módulo proporciona funciones para visualizar los tableros de N-Reinas
 de manera gráfica usando matplotlib.
+
+El tablero se dibuja con un número constante de artistas, sin importar n: el
+damero es una sola imagen (imshow) y las reinas una sola colección (scatter).
+El nivel de detalle se elige automáticamente según n (ver choose_detail):
+- 'detalle' (n <= 32): damero, reinas como círculos dorados, bordes de casilla
+  y etiquetas de filas y columnas.
+- 'pixeles' (n <= 1024): una imagen n x n en la que cada reina es un píxel
+  oscuro sobre el damero; los marcadores no se distinguirían.
+- 'densidad' (n mayor): histograma 2D de las reinas con resolución fija
+  (DENSITY_BINS x DENSITY_BINS), de modo que el tiempo de dibujo no crece con n.
+
+Para galerías (cientos o miles de tableros) render_gallery dibuja hojas PNG en
+mosaico con el backend Agg, sin pyplot ni show(): cada proceso crea una sola
+figura (GallerySheet) y en cada hoja solo actualiza los datos de sus artistas.
+
+matplotlib y NumPy se importan dentro de las funciones que dibujan: importar
+este módulo (p. ej. para choose_detail o desde un script que solo resuelve)
+no paga sus cientos de milisegundos de carga.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from typing import List, Optional
-import numpy as np
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+LIGHT = '#F0D9B5'
+DARK = '#B58863'
+QUEEN = '#1A1A1A'
+
+DETAIL_LEVELS = ('detalle', 'pixeles', 'densidad')
+# Límites de n para cada nivel de detalle
+DETAIL_MAX_N = 32
+PIXEL_MAX_N = 1024
+# Resolución del histograma en modo densidad
+DENSITY_BINS = 512
+
+
+def choose_detail(n: int) -> str:
+    """
+    Nivel de detalle automático para un tablero de tamaño n.
+
+    Args:
+        n: Tamaño del tablero
+
+    Returns:
+        'detalle', 'pixeles' o 'densidad'
+    """
+    if n <= DETAIL_MAX_N:
+        return 'detalle'
+    if n <= PIXEL_MAX_N:
+        return 'pixeles'
+    return 'densidad'
+
+
+def _queen_cells(board: Sequence[int], n: int):
+    """Filas y columnas (arrays de NumPy) de las reinas colocadas dentro del tablero."""
+    import numpy as np
+    rows = np.asarray(board, dtype=np.int64)[:n]
+    cols = np.arange(len(rows))
+    placed = (rows >= 0) & (rows < n)
+    return rows[placed], cols[placed]
+
+
+def _board_image(rows: 'np.ndarray', cols: 'np.ndarray', n: int, detail: str) -> 'np.ndarray':
+    """
+    Imagen del tablero para un nivel de detalle.
+
+    Returns:
+        Histograma de reinas (DENSITY_BINS x DENSITY_BINS como máximo) en modo
+        densidad; en otro caso el damero n x n (0 = claro, 1 = oscuro; la
+        casilla (0, 0) es clara) con las reinas en 2 en modo píxeles
+    """
+    import numpy as np
+    if detail == 'densidad':
+        # Histograma de reinas por bloque; la fila 0 queda arriba como en el damero
+        bins = min(n, DENSITY_BINS)
+        density, _, _ = np.histogram2d(rows, cols, bins=bins, range=[[0, n], [0, n]])
+        return density
+    squares = (np.add.outer(np.arange(n), np.arange(n)) % 2).astype(np.uint8)
+    if detail == 'pixeles':
+        squares[rows, cols] = 2
+    return squares
+
+
+def draw_board(ax, board: List[int], n: int, title: str = "",
+               detail: Optional[str] = None, labels: bool = True) -> str:
+    """
+    Dibuja un tablero en unos ejes con un número constante de artistas.
+
+    Args:
+        ax: Ejes de matplotlib
+        board: Estado del tablero (board[i] = fila de la reina en columna i;
+            las filas fuera de [0, n) se ignoran)
+        n: Tamaño del tablero
+        title: Título de los ejes
+        detail: 'detalle', 'pixeles' o 'densidad' (None = choose_detail(n))
+        labels: Si es True, numera filas y columnas en modo detalle
+
+    Returns:
+        Nivel de detalle usado
+    """
+    import numpy as np
+    from matplotlib.colors import ListedColormap
+
+    if detail is None:
+        detail = choose_detail(n)
+    if detail not in DETAIL_LEVELS:
+        raise ValueError(f"Nivel de detalle desconocido: {detail}")
+
+    rows, cols = _queen_cells(board, n)
+
+    if detail == 'densidad':
+        image = ax.imshow(_board_image(rows, cols, n, detail), cmap='magma',
+                          extent=(0, n, n, 0), origin='upper', interpolation='nearest')
+        ax.figure.colorbar(image, ax=ax, fraction=0.046, pad=0.04, label='Reinas por bloque')
+    else:
+        squares = _board_image(rows, cols, n, detail)
+        # En modo detalle el eje y va de abajo arriba (como el tablero de casillas);
+        # en los demás modos las marcas del eje y son índices de fila (fila 0 arriba)
+        extent = (0, n, 0, n) if detail == 'detalle' else (0, n, n, 0)
+        ax.imshow(squares, cmap=ListedColormap([LIGHT, DARK, QUEEN]), vmin=0, vmax=2,
+                  extent=extent, origin='upper', interpolation='nearest')
+
+    if detail == 'detalle':
+        # Tamaño del marcador proporcional a la casilla (en puntos²)
+        ax_width = ax.get_window_extent().width * 72 / ax.figure.dpi
+        size = (0.7 * ax_width / n) ** 2
+        ax.scatter(cols + 0.5, n - 1 - rows + 0.5, s=size, c='gold',
+                   edgecolors='black', linewidths=1.5, zorder=3)
+        ax.set_xticks(np.arange(n + 1), minor=True)
+        ax.set_yticks(np.arange(n + 1), minor=True)
+        ax.grid(which='minor', color='black', linewidth=0.8)
+        ax.tick_params(which='minor', length=0)
+        if labels:
+            ax.set_xticks(np.arange(n) + 0.5)
+            ax.set_yticks(np.arange(n) + 0.5)
+            ax.set_xticklabels(range(1, n + 1))
+            ax.set_yticklabels(range(n, 0, -1))
+            ax.set_xlabel('Columnas')
+            ax.set_ylabel('Filas')
+        else:
+            ax.set_xticks([])
+            ax.set_yticks([])
+        ax.set_ylim(0, n)
+    else:
+        ax.set_ylim(n, 0)
+        if labels:
+            ax.set_xlabel('Columna')
+            ax.set_ylabel('Fila')
+
+    ax.set_xlim(0, n)
+    ax.set_aspect('equal')
+    if title:
+        ax.set_title(title, fontsize=12, fontweight='bold')
+    return detail
 
 
 def visualize_board(board: List[int], n: int, title: str = "Tablero de N-Reinas", 
-                   save_path: Optional[str] = None):
+                   save_path: Optional[str] = None, detail: Optional[str] = None,
+                   show: bool = True):
     """
     Visualiza el tablero de N-Reinas de forma gráfica.
     
@@ -21,42 +171,14 @@ def visualize_board(board: List[int], n: int, title: str = "Tablero de N-Reinas"
         n: Tamaño del tablero
         title: Título del gráfico
         save_path: Ruta donde guardar la imagen (opcional)
+        detail: Nivel de detalle (None = automático según n, ver choose_detail)
+        show: Si es False, no muestra la ventana y cierra la figura (servidores sin pantalla)
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(8, 8))
-    
-    # Crear el tablero (alternando colores)
-    for row in range(n):
-        for col in range(n):
-            color = '#F0D9B5' if (row + col) % 2 == 0 else '#B58863'
-            rect = patches.Rectangle((col, n - 1 - row), 1, 1, 
-                                    linewidth=1, edgecolor='black', 
-                                    facecolor=color)
-            ax.add_patch(rect)
-    
-    # Colocar las reinas
-    for col in range(n):
-        if 0 <= board[col] < n:
-            row = board[col]
-            # Dibujar círculo para la reina
-            circle = patches.Circle((col + 0.5, n - 1 - row + 0.5), 
-                                  0.35, linewidth=2, 
-                                  edgecolor='black', facecolor='gold')
-            ax.add_patch(circle)
-            # Agregar símbolo de corona
-            ax.text(col + 0.5, n - 1 - row + 0.5, '♕', 
-                   fontsize=20, ha='center', va='center')
-    
-    ax.set_xlim(0, n)
-    ax.set_ylim(0, n)
-    ax.set_aspect('equal')
-    ax.set_xticks(range(n))
-    ax.set_yticks(range(n))
-    ax.set_xticklabels(range(1, n + 1))
-    ax.set_yticklabels(range(n, 0, -1))
-    ax.set_xlabel('Columnas')
-    ax.set_ylabel('Filas')
+    draw_board(ax, board, n, detail=detail)
     ax.set_title(title, fontsize=14, fontweight='bold')
-    ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
     
@@ -64,56 +186,38 @@ def visualize_board(board: List[int], n: int, title: str = "Tablero de N-Reinas"
         plt.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"Imagen guardada en: {save_path}")
     
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
 def visualize_comparison(boards: List[List[int]], n: int, 
-                        titles: List[str], save_path: Optional[str] = None):
+                        titles: List[str], save_path: Optional[str] = None,
+                        detail: Optional[str] = None, show: bool = True):
     """
     Visualiza múltiples tableros lado a lado para comparación.
+
+    Para muchos tableros, o sin pantalla, usar render_gallery.
     
     Args:
         boards: Lista de estados de tableros
         n: Tamaño del tablero
         titles: Lista de títulos para cada tablero
         save_path: Ruta donde guardar la imagen (opcional)
+        detail: Nivel de detalle (None = automático según n, ver choose_detail)
+        show: Si es False, no muestra la ventana y cierra la figura (servidores sin pantalla)
     """
+    import matplotlib.pyplot as plt
+
     num_boards = len(boards)
     fig, axes = plt.subplots(1, num_boards, figsize=(6 * num_boards, 6))
     
     if num_boards == 1:
         axes = [axes]
     
-    for idx, (board, title) in enumerate(zip(boards, titles)):
-        ax = axes[idx]
-        
-        # Crear el tablero
-        for row in range(n):
-            for col in range(n):
-                color = '#F0D9B5' if (row + col) % 2 == 0 else '#B58863'
-                rect = patches.Rectangle((col, n - 1 - row), 1, 1, 
-                                        linewidth=1, edgecolor='black', 
-                                        facecolor=color)
-                ax.add_patch(rect)
-        
-        # Colocar las reinas
-        for col in range(n):
-            if 0 <= board[col] < n:
-                row = board[col]
-                circle = patches.Circle((col + 0.5, n - 1 - row + 0.5), 
-                                      0.35, linewidth=2, 
-                                      edgecolor='black', facecolor='gold')
-                ax.add_patch(circle)
-                ax.text(col + 0.5, n - 1 - row + 0.5, '♕', 
-                       fontsize=20, ha='center', va='center')
-        
-        ax.set_xlim(0, n)
-        ax.set_ylim(0, n)
-        ax.set_aspect('equal')
-        ax.set_xticks(range(n))
-        ax.set_yticks(range(n))
-        ax.set_title(title, fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.3)
+    for ax, board, title in zip(axes, boards, titles):
+        draw_board(ax, board, n, title, detail=detail, labels=False)
     
     plt.tight_layout()
     
@@ -121,7 +225,153 @@ def visualize_comparison(boards: List[List[int]], n: int,
         plt.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"Imagen guardada en: {save_path}")
     
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+class GallerySheet:
+    """Hoja de galería reutilizable: una figura Agg con rows x cols tableros de tamaño n."""
+
+    def __init__(self, n: int, rows: int = 8, cols: int = 8, detail: Optional[str] = None,
+                 tile_size: float = 2.0, dpi: int = 100):
+        """
+        Crea la figura y los artistas de cada casilla del mosaico (una sola vez).
+
+        Args:
+            n: Tamaño de los tableros
+            rows: Filas de tableros por hoja
+            cols: Columnas de tableros por hoja
+            detail: Nivel de detalle (None = choose_detail(n))
+            tile_size: Lado de cada tablero en pulgadas
+            dpi: Resolución de las hojas
+        """
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.colors import ListedColormap
+        from matplotlib.figure import Figure
+
+        self.n = n
+        self.detail = detail or choose_detail(n)
+        if self.detail not in DETAIL_LEVELS:
+            raise ValueError(f"Nivel de detalle desconocido: {self.detail}")
+        self.dpi = dpi
+        # Figura sin pyplot: no depende del backend interactivo ni se registra en plt
+        self.figure = Figure(figsize=(cols * tile_size, rows * tile_size), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.figure.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.97,
+                                    wspace=0.05, hspace=0.15)
+        empty = np.empty(0, dtype=np.int64)
+        background = _board_image(empty, empty, n, self.detail)
+        # Tamaño del marcador (puntos²) para que ocupe ~70% de la casilla
+        marker = (0.7 * tile_size * 0.9 * 72 / n) ** 2
+        self.tiles = []
+        for i in range(rows * cols):
+            ax = self.figure.add_subplot(rows, cols, i + 1)
+            ax.set_xticks([])
+            ax.set_yticks([])
+            if self.detail == 'densidad':
+                image = ax.imshow(background, cmap='magma', vmin=0, extent=(0, n, n, 0),
+                                  origin='upper', interpolation='nearest')
+            else:
+                image = ax.imshow(background, cmap=ListedColormap([LIGHT, DARK, QUEEN]),
+                                  vmin=0, vmax=2, extent=(0, n, n, 0), origin='upper',
+                                  interpolation='nearest')
+            queens = None
+            if self.detail == 'detalle':
+                queens = ax.scatter([], [], s=marker, c='gold', edgecolors='black',
+                                    linewidths=0.8, zorder=3)
+            ax.set_xlim(0, n)
+            ax.set_ylim(n, 0)
+            title = ax.set_title('', fontsize=7)
+            self.tiles.append((ax, image, queens, title))
+
+    def render(self, boards: Sequence[Sequence[int]], path: str,
+               titles: Optional[Sequence[str]] = None) -> str:
+        """
+        Dibuja hasta rows x cols tableros y guarda la hoja como PNG.
+
+        Solo se actualizan los datos de los artistas existentes; las casillas
+        sobrantes de la última hoja se ocultan.
+
+        Args:
+            boards: Tableros de la hoja
+            path: Archivo PNG de salida
+            titles: Título de cada tablero (opcional)
+
+        Returns:
+            path
+        """
+        import numpy as np
+
+        if len(boards) > len(self.tiles):
+            raise ValueError(f"La hoja admite {len(self.tiles)} tableros, se recibieron {len(boards)}")
+        for i, (ax, image, queens, title) in enumerate(self.tiles):
+            if i >= len(boards):
+                ax.set_visible(False)
+                continue
+            ax.set_visible(True)
+            rows, cols = _queen_cells(boards[i], self.n)
+            if self.detail == 'detalle':
+                queens.set_offsets(np.column_stack([cols + 0.5, rows + 0.5]))
+            else:
+                data = _board_image(rows, cols, self.n, self.detail)
+                image.set_data(data)
+                if self.detail == 'densidad':
+                    image.set_clim(0, max(1, data.max()))
+            title.set_text(titles[i] if titles else '')
+        self.figure.savefig(path, dpi=self.dpi)
+        return path
+
+
+def _render_sheets(jobs, n: int, rows: int, cols: int, detail: Optional[str],
+                   tile_size: float, dpi: int) -> List[str]:
+    """Dibuja una lista de hojas (boards, path, titles) con una sola GallerySheet."""
+    sheet = GallerySheet(n, rows, cols, detail, tile_size, dpi)
+    return [sheet.render(boards, path, titles) for boards, path, titles in jobs]
+
+
+def render_gallery(boards: Sequence[Sequence[int]], n: int, output_prefix: str,
+                   titles: Optional[Sequence[str]] = None, rows: int = 8, cols: int = 8,
+                   detail: Optional[str] = None, tile_size: float = 2.0, dpi: int = 100,
+                   workers: int = 1) -> List[str]:
+    """
+    Dibuja muchos tableros en hojas PNG en mosaico, sin mostrar ninguna ventana.
+
+    Args:
+        boards: Tableros a dibujar (todos de tamaño n)
+        n: Tamaño de los tableros
+        output_prefix: Prefijo de los archivos; la hoja i se guarda en
+            <output_prefix>_<i>.png (i con tres dígitos)
+        titles: Título de cada tablero (opcional)
+        rows: Filas de tableros por hoja
+        cols: Columnas de tableros por hoja
+        detail: Nivel de detalle (None = choose_detail(n))
+        tile_size: Lado de cada tablero en pulgadas
+        dpi: Resolución de las hojas
+        workers: Procesos que reparten las hojas (1 = en este proceso)
+
+    Returns:
+        Rutas de las hojas en orden
+    """
+    per_sheet = rows * cols
+    jobs = []
+    for index, start in enumerate(range(0, len(boards), per_sheet)):
+        jobs.append((boards[start:start + per_sheet], f"{output_prefix}_{index:03d}.png",
+                     titles[start:start + per_sheet] if titles else None))
+    options = (n, rows, cols, detail, tile_size, dpi)
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        return _render_sheets(jobs, *options)
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Reparto en bloques contiguos: cada proceso crea su figura una sola vez
+    size = -(-len(jobs) // workers)
+    chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_render_sheets, chunks, *[[option] * len(chunks) for option in options])
+        return [path for paths in results for path in paths]
 
 
 if __name__ == "__main__":